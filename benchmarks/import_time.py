@@ -0,0 +1,84 @@
+"""Measures the cold import time of `pyjudilibre`
+
+Each statement is run in a fresh interpreter (`python -X importtime`) several times and the median
+cumulated import time of the top-level modules, minus the one of an empty interpreter, is reported
+as JSON on stdout.
+
+Usage:
+    python benchmarks/import_time.py --repeat 10
+    python benchmarks/import_time.py --max-ms 120  # exits with 1 if a statement is slower
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = {
+    "import pyjudilibre": "import pyjudilibre",
+    "import client": "from pyjudilibre import JudilibreClient",
+    "import enums": "from pyjudilibre.enums import JurisdictionEnum",
+    "import models": "import pyjudilibre.models",
+}
+
+IMPORT_TIME_PATTERN = re.compile(r"^import time:\s+\d+\s+\|\s+(\d+)\s+\|\s{1}(\S.*)$")
+
+
+def measure_import_time(statement: str) -> float:
+    """Returns the cumulated time (in ms) spent importing top-level modules in a fresh interpreter"""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    total_us = 0
+    for line in output.stderr.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match is not None:
+            # top-level imports are the ones that are not indented
+            total_us += int(match.group(1))
+    return total_us / 1_000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="number of fresh interpreters per statement")
+    parser.add_argument("--max-ms", type=float, default=None, help="budget for `import pyjudilibre` (in ms)")
+    args = parser.parse_args()
+
+    baseline = statistics.median(measure_import_time("pass") for _ in range(args.repeat))
+
+    results = {}
+    for name, statement in STATEMENTS.items():
+        timings = [measure_import_time(statement) - baseline for _ in range(args.repeat)]
+        results[name] = {
+            "statement": statement,
+            "median_ms": round(statistics.median(timings), 3),
+            "min_ms": round(min(timings), 3),
+            "max_ms": round(max(timings), 3),
+        }
+
+    print(
+        json.dumps(
+            {
+                "benchmark": "import_time",
+                "python": sys.version.split()[0],
+                "baseline_ms": round(baseline, 3),
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+
+    if args.max_ms is not None:
+        for name in ["import pyjudilibre", "import client"]:
+            if results[name]["median_ms"] > args.max_ms:
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
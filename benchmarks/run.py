@@ -0,0 +1,701 @@
+"""Benchmarks of the hot paths of `JudilibreClient`
+
+The benchmarks run offline against `pyjudilibre.testing.JudilibreMockServer` and print their results as JSON,
+so that two versions of the library can be compared:
+
+    python benchmarks/run.py --output before.json
+    git checkout my-branch && pip install -e .
+    python benchmarks/run.py --output after.json --compare before.json
+
+Use `--only` to run a subset of benchmarks and `--quick` to reduce the sizes of the workloads.
+"""
+
+import argparse
+import collections
+import contextlib
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import pyjudilibre
+from pyjudilibre import JudilibreClient
+from pyjudilibre.cli import main as cli_main
+from pyjudilibre.enums import (
+    JudilibreDateTypeEnum,
+    JudilibreMultiValueEnum,
+    JudilibreTaxonEnum,
+    JurisdictionEnum,
+    LocationCAEnum,
+)
+from pyjudilibre.instrumentation import JudilibreMetricsCollector
+from pyjudilibre.models import File, JudilibreDecision
+from pyjudilibre.taxonomy import DEFAULT_LABEL_COLUMNS, TaxonomyRegistry, write_snapshot
+from pyjudilibre.testing import JudilibreMockServer, SyntheticCorpus
+from pyjudilibre.transports import CassetteTransport, InMemoryTransport
+
+BENCHMARKS: dict[str, Callable[[argparse.Namespace], dict]] = {}
+
+
+def benchmark(name: str):
+    """Registers a benchmark function under `name`"""
+
+    def decorator(function: Callable[[argparse.Namespace], dict]):
+        BENCHMARKS[name] = function
+        return function
+
+    return decorator
+
+
+def measure(function: Callable[[], object], *, min_time: float = 1.0, repeat: int = 5) -> dict:
+    """Calls `function` repeatedly and returns statistics on the duration of one call (in seconds)"""
+    function()  # warm-up
+
+    n_calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(n_calls):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / repeat:
+            break
+        n_calls *= 2
+
+    timings = [elapsed / n_calls]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(n_calls):
+            function()
+        timings.append((time.perf_counter() - start) / n_calls)
+
+    return {
+        "calls": n_calls * repeat,
+        "median_s": statistics.median(timings),
+        "min_s": min(timings),
+    }
+
+
+TRANSPORT = "urllib"
+
+
+def mock_client(server: JudilibreMockServer, **kwargs) -> JudilibreClient:
+    return JudilibreClient(
+        judilibre_api_url=server.url,
+        judilibre_api_key=server.api_key,
+        **{"transport": TRANSPORT, **kwargs},
+    )
+
+
+@benchmark("query_overhead")
+def bench_query_overhead(args: argparse.Namespace) -> dict:
+    """Duration of a `_query` on `/healthcheck`, i.e. the fixed cost of a request"""
+    with JudilibreMockServer(corpus_size=1) as server:
+        client = mock_client(server)
+        result = measure(lambda: client._query("/healthcheck"), min_time=args.min_time)
+    return {**result, "unit": "requests/s", "value": 1 / result["median_s"]}
+
+
+@benchmark("decision_validation")
+def bench_decision_validation(args: argparse.Namespace) -> dict:
+    """JSON decoding and `JudilibreDecision` validation of a batch of decisions"""
+    batch_size = 100 if args.quick else 1_000
+    corpus = SyntheticCorpus(size=batch_size, text_size=args.text_size)
+    content = json.dumps({"results": [corpus.decision(d) for d in corpus.decisions]}).encode("utf-8")
+
+    def decode_and_validate():
+        return [JudilibreDecision(**d) for d in json.loads(content)["results"]]
+
+    result = measure(decode_and_validate, min_time=args.min_time)
+    return {
+        **result,
+        "unit": "decisions/s",
+        "value": batch_size / result["median_s"],
+        "batch_size": batch_size,
+        "bytes_per_decision": len(content) / batch_size,
+    }
+
+
+@benchmark("zoning")
+def bench_zoning(args: argparse.Namespace) -> dict:
+    """Construction of the `Zoning` of a decision"""
+    corpus = SyntheticCorpus(size=1, text_size=args.text_size)
+    decision = JudilibreDecision(**corpus.decision(corpus.decisions[0]))
+
+    result = measure(lambda: decision.zoning, min_time=args.min_time)
+    return {**result, "unit": "zonings/s", "value": 1 / result["median_s"]}
+
+
+@benchmark("clean_query_parameters")
+def bench_clean_query_parameters(args: argparse.Namespace) -> dict:
+    """Cleaning of the query parameters of a typical `/export` query"""
+    query_parameters = {
+        "particularInterest": "true",
+        "location": [LocationCAEnum.ca_paris, LocationCAEnum.ca_lyon, LocationCAEnum.ca_douai],
+        "jurisdiction": [JurisdictionEnum.cours_d_appel],
+        "date_start": "2024-01-01",
+        "date_end": "2024-12-31",
+        "date_type": JudilibreDateTypeEnum.creation,
+        "resolve_references": True,
+        "batch": 0,
+        "batch_size": 1_000,
+    }
+
+    result = measure(
+        lambda: JudilibreClient._clean_query_parameters(query_parameters.copy()),
+        min_time=args.min_time,
+    )
+    return {**result, "unit": "calls/s", "value": 1 / result["median_s"]}
+
+
+@benchmark("paginate_scan")
+def bench_paginate_scan(args: argparse.Namespace) -> dict:
+    """End-to-end `paginate_scan` over the whole mock corpus"""
+    corpus_size = 2_000 if args.quick else 20_000
+    with JudilibreMockServer(corpus_size=corpus_size, text_size=args.text_size) as server:
+        client = mock_client(server, default_timeout=60)
+        result = measure(lambda: client.paginate_scan(batch_size=1_000), min_time=args.min_time, repeat=3)
+
+        server.reset()
+        metrics = JudilibreMetricsCollector().attach(client)
+        client.paginate_scan(batch_size=1_000)
+        n_requests = server.request_count
+        scan_metrics = metrics.as_dict()["/scan"]
+    return {
+        **result,
+        "unit": "decisions/s",
+        "value": corpus_size / result["median_s"],
+        "corpus_size": corpus_size,
+        "requests": n_requests,
+        "bytes_received": scan_metrics["bytes_received"],
+        "bytes_decoded": scan_metrics["bytes_decoded"],
+    }
+
+
+@benchmark("paginate_scan_replay")
+def bench_paginate_scan_replay(args: argparse.Namespace) -> dict:
+    """`paginate_scan` replayed from a cassette, i.e. decoding and pagination without network"""
+    corpus_size = 2_000 if args.quick else 20_000
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "scan.jsonl.gz")
+        with JudilibreMockServer(corpus_size=corpus_size, text_size=args.text_size) as server:
+            with CassetteTransport.record(path) as cassette:
+                mock_client(server, default_timeout=60, transport=cassette).paginate_scan(batch_size=1_000)
+
+        client = JudilibreClient(
+            judilibre_api_url="http://replay.invalid",
+            judilibre_api_key="replay",
+            transport=CassetteTransport.replay(path),
+        )
+        result = measure(lambda: client.paginate_scan(batch_size=1_000), min_time=args.min_time, repeat=3)
+    return {**result, "unit": "decisions/s", "value": corpus_size / result["median_s"], "corpus_size": corpus_size}
+
+
+@benchmark("adaptive_batch_size")
+def bench_adaptive_batch_size(args: argparse.Namespace) -> dict:
+    """`paginate_export` with the default batch size (100) and with `batch_size="auto"`, against a server with
+    a fixed latency per request and a latency per decision"""
+    corpus_size = 2_000 if args.quick else 10_000
+    with JudilibreMockServer(
+        corpus_size=corpus_size, text_size=args.text_size, latency=0.05, latency_per_result=0.0002
+    ) as server:
+        client = mock_client(server, default_timeout=5)
+
+        timings = {}
+        for batch_size in [100, "auto"]:
+            server.reset()
+            start = time.perf_counter()
+            client.paginate_export(batch_size=batch_size)
+            timings[batch_size] = (time.perf_counter() - start, server.request_count)
+
+    return {
+        "unit": "speedup",
+        "value": timings[100][0] / timings["auto"][0],
+        "corpus_size": corpus_size,
+        "fixed_decisions_per_s": corpus_size / timings[100][0],
+        "fixed_requests": timings[100][1],
+        "auto_decisions_per_s": corpus_size / timings["auto"][0],
+        "auto_requests": timings["auto"][1],
+    }
+
+
+@benchmark("page_size")
+def bench_page_size(args: argparse.Namespace) -> dict:
+    """`paginate_search` and `paginate_transactional_history` with the former page sizes (25) and with
+    `page_size="auto"`, against a server with a fixed latency per request"""
+    corpus_size = 2_000 if args.quick else 10_000
+    with JudilibreMockServer(corpus_size=corpus_size, text_size=args.text_size, latency=0.01) as server:
+        client = mock_client(server, default_timeout=60)
+        paginators = {
+            "search": lambda page_size: client.paginate_search("contrat", page_size=page_size),
+            "transactional_history": lambda page_size: client.paginate_transactional_history(
+                date_start=datetime.date(2000, 1, 1), page_size=page_size
+            ),
+        }
+
+        results: dict[str, object] = {"unit": "speedup", "corpus_size": corpus_size}
+        speedups = []
+        for name, paginate in paginators.items():
+            timings = {}
+            for page_size in [25, "auto"]:
+                server.reset()
+                start = time.perf_counter()
+                paginate(page_size)
+                timings[page_size] = (time.perf_counter() - start, server.request_count)
+            results[f"{name}_fixed_requests"] = timings[25][1]
+            results[f"{name}_auto_requests"] = timings["auto"][1]
+            speedups.append(timings[25][0] / timings["auto"][0])
+    return {**results, "value": min(speedups)}
+
+
+@benchmark("concurrent_search")
+def bench_concurrent_search(args: argparse.Namespace) -> dict:
+    """`paginate_search` fetching one page at a time and 8 pages at a time, against a server with a fixed
+    latency per request"""
+    corpus_size = 2_000 if args.quick else 10_000
+    with JudilibreMockServer(corpus_size=corpus_size, text_size=args.text_size, latency=0.05) as server:
+        client = mock_client(server, default_timeout=60)
+
+        timings = {}
+        for max_workers in [1, 8]:
+            server.reset()
+            start = time.perf_counter()
+            client.paginate_search("contrat", max_workers=max_workers)
+            timings[max_workers] = (time.perf_counter() - start, server.request_count)
+
+    return {
+        "unit": "speedup",
+        "value": timings[1][0] / timings[8][0],
+        "corpus_size": corpus_size,
+        "requests": timings[1][1],
+        "sequential_s": timings[1][0],
+        "concurrent_s": timings[8][0],
+    }
+
+
+@benchmark("bulk_decisions")
+def bench_bulk_decisions(args: argparse.Namespace) -> dict:
+    """Decisions fetched by ID in a loop over `decision` and with `decisions`, against a server with a fixed
+    latency per request"""
+    n_decisions = 100 if args.quick else 500
+    with JudilibreMockServer(corpus_size=n_decisions, text_size=args.text_size, latency=0.02) as server:
+        client = mock_client(server, default_timeout=60)
+        ids = [d.id for d in server.corpus.decisions]
+
+        start = time.perf_counter()
+        for decision_id in ids:
+            client.decision(decision_id)
+        loop_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        collections.deque(client.decisions(ids, max_workers=16), maxlen=0)
+        bulk_s = time.perf_counter() - start
+
+    return {
+        "unit": "speedup",
+        "value": loop_s / bulk_s,
+        "decisions": n_decisions,
+        "loop_decisions_per_s": n_decisions / loop_s,
+        "bulk_decisions_per_s": n_decisions / bulk_s,
+    }
+
+
+@benchmark("hydration")
+def bench_hydration(args: argparse.Namespace) -> dict:
+    """Search results enriched with their decision by a loop over `decision` and by `hydrate`, against a server
+    with a fixed latency per request"""
+    max_results = 100 if args.quick else 500
+    with JudilibreMockServer(corpus_size=10_000, text_size=args.text_size, latency=0.02) as server:
+        client = mock_client(server, default_timeout=60)
+
+        start = time.perf_counter()
+        for result in client.paginate_search("contrat", max_results=max_results):
+            client.decision(result.id)
+        loop_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        collections.deque(client.hydrate(client.iter_search("contrat", max_results=max_results)), maxlen=0)
+        hydrate_s = time.perf_counter() - start
+
+    return {
+        "unit": "speedup",
+        "value": loop_s / hydrate_s,
+        "results": max_results,
+        "loop_results_per_s": max_results / loop_s,
+        "hydrate_results_per_s": max_results / hydrate_s,
+    }
+
+
+@benchmark("single_flight")
+def bench_single_flight(args: argparse.Namespace) -> dict:
+    """Bursts of identical `decision` and `stats` calls from concurrent threads, with and without request
+    coalescing, against a server with a fixed latency per request"""
+    n_threads = 16 if args.quick else 64
+    with JudilibreMockServer(corpus_size=100, text_size=args.text_size, latency=0.05) as server:
+        decision_id = server.corpus.decisions[0].id
+        results = {}
+        for single_flight in [False, True]:
+            client = mock_client(server, default_timeout=60, single_flight=single_flight)
+            server.reset()
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                start = time.perf_counter()
+                for i in range(n_threads):
+                    executor.submit(client.decision, decision_id) if i % 2 else executor.submit(client.stats)
+            results[single_flight] = (time.perf_counter() - start, server.request_count)
+
+    return {
+        "unit": "requests ratio",
+        "value": results[False][1] / results[True][1],
+        "threads": n_threads,
+        "requests": results[False][1],
+        "coalesced_requests": results[True][1],
+        "speedup": results[False][0] / results[True][0],
+    }
+
+
+@benchmark("small_scans")
+def bench_small_scans(args: argparse.Namespace) -> dict:
+    """Many small `paginate_scan` (one per location) with a progress callback, with the total taken from the
+    first `/scan` response and with `stats_total=True` (a `/stats` request per scan), against a server with
+    a fixed latency per request"""
+    locations = list(LocationCAEnum)[: 10 if args.quick else 36]
+    with JudilibreMockServer(corpus_size=2_000, text_size=args.text_size, latency=0.02) as server:
+        client = mock_client(server, default_timeout=60)
+
+        timings = {}
+        for stats_total in [True, False]:
+            server.reset()
+            start = time.perf_counter()
+            for location in locations:
+                client.paginate_scan(
+                    batch_size=1_000,
+                    locations=[location],
+                    progress_callback=lambda progress: None,
+                    stats_total=stats_total,
+                )
+            timings[stats_total] = (time.perf_counter() - start, server.request_count)
+
+    return {
+        "unit": "speedup",
+        "value": timings[True][0] / timings[False][0],
+        "scans": len(locations),
+        "stats_total_requests": timings[True][1],
+        "requests": timings[False][1],
+    }
+
+
+@benchmark("fan_out_scan")
+def bench_fan_out_scan(args: argparse.Namespace) -> dict:
+    """`paginate_scan` on all the courts of appeal, as a single chain of batches and as 8 groups of locations
+    scanned in parallel, against a server with a latency per request closer to the one of `/scan` than in the
+    other benchmarks (with a small latency, the decoding of the decisions, which holds the GIL, dominates)"""
+    with JudilibreMockServer(
+        corpus_size=2_000 if args.quick else 10_000, text_size=args.text_size, latency=0.1
+    ) as server:
+        client = mock_client(server, default_timeout=60)
+
+        timings = {}
+        for max_workers in [1, 8]:
+            server.reset()
+            start = time.perf_counter()
+            decisions = client.paginate_scan(batch_size=100, locations=list(LocationCAEnum), max_workers=max_workers)
+            timings[max_workers] = (time.perf_counter() - start, server.request_count)
+
+    return {
+        "unit": "speedup",
+        "value": timings[1][0] / timings[8][0],
+        "decisions": len(decisions),
+        "sequential_requests": timings[1][1],
+        "fan_out_requests": timings[8][1],
+    }
+
+
+@benchmark("sharded_export")
+def bench_sharded_export(args: argparse.Namespace) -> dict:
+    """`python -m pyjudilibre export` with 1 and 4 processes, against a server with a fixed latency per request"""
+    with JudilibreMockServer(
+        corpus_size=1_000 if args.quick else 5_000, text_size=args.text_size, latency=0.02
+    ) as server:
+        timings = {}
+        for processes in [1, 4]:
+            server.reset()
+            with tempfile.TemporaryDirectory() as folder, contextlib.redirect_stdout(None):
+                start = time.perf_counter()
+                cli_main(
+                    [
+                        "export",
+                        *("--api-url", server.url, "--api-key", server.api_key),
+                        *("--jurisdiction", "ca", "--output", folder, "--processes", str(processes)),
+                    ]
+                )
+                timings[processes] = (time.perf_counter() - start, server.request_count)
+
+    return {
+        "unit": "speedup",
+        "value": timings[1][0] / timings[4][0],
+        "one_process_s": timings[1][0],
+        "four_processes_s": timings[4][0],
+        "requests": timings[4][1],
+    }
+
+
+@benchmark("taxonomy_labels")
+def bench_taxonomy_labels(args: argparse.Namespace) -> dict:
+    """Labels of the chambers of scanned decisions, with a `/taxonomy` request per decision and with a
+    warmed-up `TaxonomyRegistry`, against a server with a fixed latency per request"""
+    with JudilibreMockServer(corpus_size=200 if args.quick else 1_000, text_size=0, latency=0.005) as server:
+        client = mock_client(server)
+        decisions = client.paginate_scan(batch_size=1_000)
+
+        server.reset()
+        start = time.perf_counter()
+        labels = [
+            client.taxonomy(JudilibreTaxonEnum.chamber, decision.jurisdiction).get(  # type: ignore
+                JudilibreMultiValueEnum.replace_enum(decision.chamber)
+            )
+            for decision in decisions
+        ]
+        uncached = (time.perf_counter() - start, server.request_count)
+
+        server.reset()
+        start = time.perf_counter()
+        registry = TaxonomyRegistry(client).warm_up()
+        cached_labels = [
+            registry.label(JudilibreTaxonEnum.chamber, decision.jurisdiction, decision.chamber)  # type: ignore
+            for decision in decisions
+        ]
+        cached = (time.perf_counter() - start, server.request_count)
+        assert cached_labels == labels
+        assert sum(label is not None for label in labels) == sum(d.chamber is not None for d in decisions) > 0
+
+    return {
+        "unit": "speedup",
+        "value": uncached[0] / cached[0],
+        "decisions": len(decisions),
+        "uncached_requests": uncached[1],
+        "registry_requests": cached[1],
+    }
+
+
+@benchmark("taxonomy_snapshot")
+def bench_taxonomy_snapshot(args: argparse.Namespace) -> dict:
+    """Time to the first label of a new registry, warmed up from the API, from a JSON cache and from a snapshot"""
+    with JudilibreMockServer(corpus_size=100, text_size=0) as server, tempfile.TemporaryDirectory() as folder:
+        client = mock_client(server)
+        cache_path = os.path.join(folder, "taxonomy.json")
+        snapshot_path = os.path.join(folder, "taxonomy.snapshot")
+        write_snapshot(snapshot_path, TaxonomyRegistry(client, cache_path=cache_path).warm_up().taxons())
+
+        def first_label(registry: TaxonomyRegistry):
+            registry.warm_up()
+            registry.label(JudilibreTaxonEnum.chamber, JurisdictionEnum.cour_de_cassation, "soc")
+
+        api = measure(lambda: first_label(TaxonomyRegistry(client)), min_time=0.5)
+        cache = measure(lambda: first_label(TaxonomyRegistry(client, cache_path=cache_path)), min_time=0.5)
+        snapshot = measure(lambda: first_label(TaxonomyRegistry(client, snapshot=snapshot_path)), min_time=0.5)
+        sizes = {"snapshot_bytes": os.path.getsize(snapshot_path), "json_cache_bytes": os.path.getsize(cache_path)}
+
+    return {
+        "unit": "speedup",
+        "value": api["median_s"] / snapshot["median_s"],
+        "api_s": api["median_s"],
+        "json_cache_s": cache["median_s"],
+        "snapshot_s": snapshot["median_s"],
+        **sizes,
+    }
+
+
+@benchmark("label_columns")
+def bench_label_columns(args: argparse.Namespace) -> dict:
+    """Labels of the columns of exported decisions (as written by `python -m pyjudilibre export`), row by row with
+    `TaxonomyRegistry.label` and column by column with `TaxonomyRegistry.label_columns` (on lists, and on a
+    `pyarrow` table if `pyarrow` is installed)"""
+    with JudilibreMockServer(corpus_size=1_000, text_size=0) as server:
+        client = mock_client(server)
+        registry = TaxonomyRegistry(client).warm_up()
+        columns = ["jurisdiction", *DEFAULT_LABEL_COLUMNS]
+        decisions = [decision.model_dump(mode="json") for decision in client.iter_scan(batch_size=1_000)]
+        n_rows = 50_000 if args.quick else 500_000
+        rows = [{column: decisions[i % len(decisions)].get(column) for column in columns} for i in range(n_rows)]
+        batch = {column: [row[column] for row in rows] for column in columns}
+
+        def label_rows():
+            for row in rows:
+                for column, taxon_id in DEFAULT_LABEL_COLUMNS.items():
+                    code = row[column]
+                    if isinstance(code, list):
+                        [registry.label(taxon_id, row["jurisdiction"], c) for c in code]
+                    else:
+                        registry.label(taxon_id, row["jurisdiction"], code)
+
+        labelled = registry.label_columns(batch)
+        assert all(label is not None for label in labelled["solution_label"])
+        assert sum(label is not None for label in labelled["chamber_label"]) == sum(
+            chamber is not None for chamber in batch["chamber"]
+        )
+
+        result = {
+            "rows": n_rows,
+            "row_by_row_s": measure(label_rows, min_time=0.1, repeat=1)["median_s"],
+            "lists_s": measure(lambda: registry.label_columns(batch), min_time=0.1, repeat=3)["median_s"],
+        }
+        try:
+            import pyarrow  # type: ignore
+        except ImportError:
+            pass
+        else:
+            table = pyarrow.Table.from_pydict(batch)
+            result["arrow_s"] = measure(lambda: registry.label_columns(table), min_time=0.1, repeat=3)["median_s"]
+
+    fastest = result.get("arrow_s", result["lists_s"])
+    return {"unit": "speedup", "value": result["row_by_row_s"] / fastest, **result}
+
+
+@benchmark("stats_many")
+def bench_stats_many(args: argparse.Namespace) -> dict:
+    """A dashboard refresh of 24 `/stats` queries: sequential `stats` calls, `stats_many`, and `stats_many` again
+    with the stats cache of the client, against a server with a fixed latency per request"""
+    queries = [
+        {"jurisdictions": [jurisdiction], "keys": ["year"], "date_start": datetime.date(year, 1, 1)}
+        for jurisdiction in ["cc", "ca", "tj", "tcom"]
+        for year in range(2019, 2025)
+    ]
+    with JudilibreMockServer(corpus_size=1_000, text_size=0, latency=0.05) as server:
+        client = mock_client(server, stats_cache_size=100)
+
+        start = time.perf_counter()
+        for query in queries:
+            client.stats(**query)
+        sequential = time.perf_counter() - start
+
+        client.stats_cache.clear()
+        start = time.perf_counter()
+        client.stats_many(queries, max_workers=len(queries))
+        concurrent = time.perf_counter() - start
+
+        start = time.perf_counter()
+        client.stats_many(queries)
+        cached = time.perf_counter() - start
+
+    return {
+        "unit": "speedup",
+        "value": sequential / concurrent,
+        "queries": len(queries),
+        "sequential_s": sequential,
+        "stats_many_s": concurrent,
+        "cached_s": cached,
+    }
+
+
+@benchmark("scan_memory")
+def bench_scan_memory(args: argparse.Namespace) -> dict:
+    """Peak memory of a `/scan` batch decoded at once (`scan`) or streamed decision by decision (`iter_scan`)"""
+    batch_size = 100 if args.quick else 1_000
+    corpus = SyntheticCorpus(size=batch_size, text_size=args.text_size)
+    body = json.dumps(
+        {"total": batch_size, "next_batch": None, "results": [corpus.decision(d) for d in corpus.decisions]}
+    ).encode("utf-8")
+    client = JudilibreClient(
+        judilibre_api_url="http://judilibre.invalid",
+        judilibre_api_key="unused",
+        transport=InMemoryTransport(lambda method, url, headers: (200, {}, body)),
+    )
+
+    def peak_memory(function: Callable[[], object]) -> int:
+        function()  # warm-up
+        tracemalloc.start()
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+
+    scan_peak = peak_memory(lambda: client.scan(batch_size=batch_size))
+    iter_scan_peak = peak_memory(lambda: collections.deque(client.iter_scan(batch_size=batch_size), maxlen=0))
+    return {
+        "unit": "memory ratio",
+        "value": scan_peak / iter_scan_peak,
+        "batch_size": batch_size,
+        "body_bytes": len(body),
+        "scan_peak_bytes": scan_peak,
+        "iter_scan_peak_bytes": iter_scan_peak,
+    }
+
+
+@benchmark("download_file")
+def bench_download_file(args: argparse.Namespace) -> dict:
+    """Download of a decision attachment"""
+    file_size = 5_000_000 if args.quick else 50_000_000
+    with JudilibreMockServer(corpus_size=1, file_size=file_size) as server, tempfile.TemporaryDirectory() as folder:
+        client = mock_client(server, default_timeout=60)
+        file = File(
+            id="file",
+            name="file.pdf",
+            type="prep_rapp",
+            isCommunication=False,
+            date="2024-01-01",
+            url=f"{server.url}/files/file.pdf",
+            rawUrl=f"{server.url}/files/file.pdf",
+        )
+        result = measure(lambda: client.download_file(file, folder=folder), min_time=args.min_time, repeat=3)
+    return {**result, "unit": "MB/s", "value": file_size / 1e6 / result["median_s"], "file_size": file_size}
+
+
+def compare(results: dict, reference: dict) -> dict:
+    """Returns the ratio between the values of two runs (> 1 means faster than the reference)"""
+    ratios = {}
+    for name, result in results["benchmarks"].items():
+        reference_result = reference["benchmarks"].get(name)
+        if reference_result is not None and reference_result.get("unit") == result.get("unit"):
+            ratios[name] = round(result["value"] / reference_result["value"], 3)
+    return ratios
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="benchmarks to run")
+    parser.add_argument("--quick", action="store_true", help="use smaller workloads")
+    parser.add_argument("--min-time", type=float, default=1.0, help="minimal duration of each benchmark (in s)")
+    parser.add_argument("--text-size", type=int, default=20_000, help="number of characters per decision text")
+    parser.add_argument("--output", help="path of the JSON file to write the results to")
+    parser.add_argument("--compare", help="path of a previous JSON output to compare the results with")
+    parser.add_argument("--transport", default="urllib", help="transport of the client (urllib, pooled or httpx)")
+    args = parser.parse_args()
+
+    global TRANSPORT
+    TRANSPORT = args.transport
+
+    results: dict = {
+        "pyjudilibre": pyjudilibre.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "transport": args.transport,
+        "benchmarks": {},
+    }
+    for name in args.only or BENCHMARKS:
+        print(f"Running {name}...", file=sys.stderr)
+        result = BENCHMARKS[name](args)
+        results["benchmarks"][name] = {k: round(v, 9) if isinstance(v, float) else v for k, v in result.items()}
+
+    if args.compare is not None:
+        with open(args.compare) as reference_file:
+            results["comparison"] = {
+                "reference": os.path.basename(args.compare),
+                "ratios": compare(results, json.load(reference_file)),
+            }
+
+    output = json.dumps(results, indent=2)
+    if args.output is not None:
+        with open(args.output, "w") as output_file:
+            output_file.write(output)
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,15 @@
-from .pyjudilibre import JudilibreClient, __version__  # noqa
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .pyjudilibre import JudilibreClient, __version__  # noqa
 
 __all__ = ["JudilibreClient", "__version__"]
+
+
+def __getattr__(name: str):
+    """Lazily imports the client so that `import pyjudilibre` stays cheap"""
+    if name in __all__:
+        from . import pyjudilibre
+
+        return getattr(pyjudilibre, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
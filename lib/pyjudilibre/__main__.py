@@ -0,0 +1,5 @@
+import sys
+
+from pyjudilibre.cli import main
+
+sys.exit(main())
@@ -0,0 +1,134 @@
+"""Adaptive batch sizes for the paginated endpoints
+
+The time taken by a batch grows with its size (roughly `overhead + size * time_per_decision`), so that the
+number of decisions per second grows with the batch size until the requests time out. `AdaptiveBatchSize`
+measures the time and the bytes per decision of each batch, and picks the largest batch size expected to
+answer within `target_duration` (half of the timeout by default) and under `max_bytes`. Batch sizes grow at
+most twofold from one batch to the next, and are halved after a timeout.
+
+```python
+decisions = client.paginate_scan(batch_size="auto")
+decisions = client.paginate_export(batch_size=AdaptiveBatchSize(initial=50, target_duration=2.0))
+```
+"""
+
+from typing import Sequence
+
+
+class AdaptiveBatchSize:
+    """Batch size tuned from the duration, size and timeouts of the previous batches"""
+
+    def __init__(
+        self,
+        initial: int = 100,
+        *,
+        minimum: int = 1,
+        maximum: int = 1_000,
+        target_duration: float | None = None,
+        max_bytes: int | None = 32_000_000,
+        smoothing: float = 0.5,
+    ):
+        """Constructor of the `AdaptiveBatchSize` class
+
+        Args:
+            initial (int, optional): size of the first batch.
+                Defaults to 100.
+            minimum (int, optional): minimal batch size.
+                Defaults to 1.
+            maximum (int, optional): maximal batch size (the API accepts at most 1 000 decisions per batch).
+                Defaults to 1_000.
+            target_duration (float | None, optional): expected duration of a batch, in seconds.
+                If `None`, the paginators use half of their timeout.
+                Defaults to None.
+            max_bytes (int | None, optional): maximal expected size of a response body, in bytes.
+                If `None`, the size of the responses is not limited.
+                Defaults to 32_000_000.
+            smoothing (float, optional): weight of the last batch in the moving averages of the duration
+                and of the size of a decision.
+                Defaults to 0.5.
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_duration = target_duration
+        self.max_bytes = max_bytes
+        self.smoothing = smoothing
+
+        self.seconds_per_result: float | None = None
+        self.bytes_per_result: float | None = None
+        self.timeouts = 0
+        self._size = self._clamp(initial)
+
+    def _clamp(self, size: float) -> int:
+        return max(self.minimum, min(self.maximum, int(size)))
+
+    def _average(self, average: float | None, value: float) -> float:
+        if average is None:
+            return value
+        return (1 - self.smoothing) * average + self.smoothing * value
+
+    def size(self, offset: int | None = None, sizes: Sequence[int] | None = None) -> int:
+        """Returns the size of the next batch
+
+        Args:
+            offset (int | None, optional): number of results already fetched, for endpoints paginated by batch number.
+                Defaults to None.
+            sizes (Sequence[int] | None, optional): batch sizes accepted by the endpoint. If `offset` is given,
+                the batch size must divide it as well, so that `offset` is a whole number of batches.
+                Defaults to None.
+        """
+        if sizes is None:
+            return self._size
+        candidates = [s for s in sizes if s <= self._size and (offset is None or offset % s == 0)]
+        if candidates:
+            return max(candidates)
+        return min(s for s in sizes if offset is None or offset % s == 0)
+
+    def record(
+        self,
+        n_results: int,
+        duration: float,
+        n_bytes: int = 0,
+    ):
+        """Updates the batch size after a batch
+
+        Args:
+            n_results (int): number of results of the batch
+            duration (float): time taken by the request, in seconds
+            n_bytes (int, optional): size of the response body.
+                Defaults to 0.
+        """
+        if n_results <= 0:
+            return
+
+        # the overhead of the request is counted in the duration of each result: the estimate is
+        # pessimistic for small batches and gets more accurate as they grow
+        self.seconds_per_result = self._average(self.seconds_per_result, duration / n_results)
+        self.bytes_per_result = self._average(self.bytes_per_result, n_bytes / n_results)
+
+        target_size = 2.0 * self._size
+        if self.target_duration is not None and self.seconds_per_result > 0:
+            target_size = min(target_size, self.target_duration / self.seconds_per_result)
+        if self.max_bytes is not None and self.bytes_per_result > 0:
+            target_size = min(target_size, self.max_bytes / self.bytes_per_result)
+        self._size = self._clamp(target_size)
+
+    def record_timeout(
+        self,
+        batch_size: int,
+        duration: float,
+    ) -> bool:
+        """Halves the batch size after a timeout
+
+        Args:
+            batch_size (int): size of the batch that timed out
+            duration (float): time elapsed before the timeout, in seconds
+
+        Returns:
+            bool: False if the batch size was already the minimal one
+        """
+        self.timeouts += 1
+        self.seconds_per_result = max(self.seconds_per_result or 0.0, duration / batch_size)
+        if batch_size <= self.minimum:
+            return False
+        self._size = self._clamp(batch_size // 2)
+        return True
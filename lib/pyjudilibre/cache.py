@@ -0,0 +1,150 @@
+"""In-memory caches of the responses of the **JUDILIBRE** API
+
+Decisions are immutable once published, so a decision fetched once can be served again without a request.
+`LRUCache` keeps the most recently used entries and is shared by the threads of a client:
+
+```python
+client = JudilibreClient(decision_cache_size=10_000)
+client.decision(decision_id)  # request
+client.decision(decision_id)  # served from `client.decision_cache`
+```
+
+Statistics change as decisions are published, so `client.stats_cache` keeps the responses of `stats` for
+`stats_cache_ttl` seconds only (entries of an `LRUCache` given a `ttl` expire).
+
+`SingleFlight` coalesces the identical requests made at the same time by several threads (the users of a web
+service asking for the same popular decision, for example) into a single request.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class LRUCache:
+    """Thread-safe mapping keeping the `maxsize` most recently used entries (for `ttl` seconds, if given)"""
+
+    def __init__(self, maxsize: int, ttl: float | None = None):
+        """Constructor of the `LRUCache` class
+
+        Args:
+            maxsize (int): maximal number of entries. If 0, nothing is cached.
+            ttl (float | None, optional): number of seconds after which an entry expires.
+                If `None`, entries do not expire.
+                Defaults to None.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        # values and their expiry times
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the entry of `key` (marking it as the most recently used one), or `default`"""
+        with self._lock:
+            if key in self._entries:
+                value, expires = self._entries[key]
+                if expires > time.monotonic():
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any):
+        """Stores an entry, evicting the least recently used one if the cache is full"""
+        if self.maxsize <= 0:
+            return
+        expires = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Removes all the entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[1] > time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SingleFlight:
+    """Shares the result of a call between the threads making the same call at the same time
+
+    The first thread calling `do` with a key runs the function; the threads calling `do` with the same key
+    until it returns wait for it and get its result (or its exception). Results are not kept afterwards.
+    When a result is shared, each thread (the first one included) gets its own copy, made by `copy`, so that a
+    thread modifying its result does not modify those of the others.
+    """
+
+    def __init__(self, copy: Callable[[Any], Any] = copy.deepcopy) -> None:
+        """Constructor of the `SingleFlight` class
+
+        Args:
+            copy (Callable[[Any], Any], optional): function copying a shared result.
+                Defaults to copy.deepcopy.
+        """
+        self.shared = 0
+        self.copy = copy
+
+        # call in flight of each key, and the number of threads waiting for it
+        self._calls: dict[Hashable, tuple[Future, list[int]]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> tuple[T, bool]:
+        """Calls `function`, unless a call with the same key is in flight, whose result is then shared
+
+        Args:
+            key (Hashable): identifier of the call
+            function (Callable[[], T]): function to call
+
+        Returns:
+            tuple[T, bool]: the result of the call (a copy, if it was shared), and whether it was shared with a
+                call in flight
+        """
+        with self._lock:
+            entry = self._calls.get(key)
+            if entry is None:
+                call: Future = Future()
+                waiters = [0]
+                self._calls[key] = (call, waiters)
+                leader = True
+            else:
+                call, waiters = entry
+                waiters[0] += 1
+                self.shared += 1
+                leader = False
+
+        if not leader:
+            return self.copy(call.result()), True
+
+        try:
+            result = function()
+        except BaseException as exc:
+            call.set_exception(exc)
+            raise
+        finally:
+            # no thread can wait for the call once it is removed
+            with self._lock:
+                del self._calls[key]
+        call.set_result(result)
+        if waiters[0]:
+            # the waiting threads copy `result`, which must not be modified
+            return self.copy(result), False
+        return result, False
@@ -0,0 +1,533 @@
+"""Command line interface of `pyjudilibre`
+
+```sh
+python -m pyjudilibre export --jurisdiction ca --date-start 2024-01-01 --date-end 2024-12-31 --output export/
+```
+
+`export` splits the query into shards (one per jurisdiction, location and month, planned with a single `/stats`
+request), exports the shards with `/scan` on a pool of processes (each with its own client) and writes each one
+to a compressed JSON Lines (or Parquet) file:
+
+```
+export/
+    checkpoint.jsonl          # one line per exported shard
+    ca/ca_paris/2024-01.jsonl.gz
+    ca/ca_paris/2024-02.jsonl.gz
+    ...
+```
+
+A shard is written to a temporary file, renamed once complete and then recorded in `checkpoint.jsonl`: an
+interrupted export can be resumed by running the same command again, which skips the exported shards. The shards
+that fail are reported at the end of the export, which then exits with status 1.
+
+`taxonomy snapshot` fetches all the taxons into a snapshot file (see `pyjudilibre.taxonomy.TaxonomySnapshot`),
+and `taxonomy diff` compares a snapshot with the API. Both exit with status 1 if some taxons could not be fetched
+(they are reported, and left out of the snapshot or of the comparison), and `diff` also if they differ:
+
+```sh
+python -m pyjudilibre taxonomy snapshot --output taxonomy.snapshot
+python -m pyjudilibre taxonomy diff taxonomy.snapshot
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import datetime
+import gzip
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Iterator
+
+from pyjudilibre.enums import JudilibreMultiValueEnum, JurisdictionEnum
+from pyjudilibre.exceptions import JudilibreValueError
+
+if TYPE_CHECKING:
+    from pyjudilibre import JudilibreClient
+    from pyjudilibre.progress import JudilibreProgress
+
+CHECKPOINT_FILENAME = "checkpoint.jsonl"
+EXPORT_FORMATS = {"jsonl": ".jsonl.gz", "parquet": ".parquet"}
+
+# client of the current worker process, built by `_init_worker`
+_worker_client: JudilibreClient | None = None
+
+
+@dataclasses.dataclass(frozen=True)
+class ExportShard:
+    """Part of an export: the decisions of a jurisdiction and a location (if any) during a month"""
+
+    jurisdiction: str
+    location: str | None
+    date_start: datetime.date
+    date_end: datetime.date
+    expected: int = 0
+
+    @property
+    def name(self) -> str:
+        """Identifier of the shard, also its path (without extension) in the output folder"""
+        return f"{self.jurisdiction}/{self.location or 'all'}/{self.date_start:%Y-%m}"
+
+    def path(self, output: str, export_format: str) -> str:
+        """Path of the file of the shard"""
+        return os.path.join(output, *self.name.split("/")) + EXPORT_FORMATS[export_format]
+
+
+@dataclasses.dataclass
+class ShardResult:
+    """Outcome of the export of a shard"""
+
+    shard: ExportShard
+    path: str
+    decisions: int
+    bytes_written: int
+    bytes_received: int
+    requests: int
+    retries: int
+    seconds: float
+
+
+def _month_range(month: str, date_start: datetime.date | None, date_end: datetime.date | None):
+    """Returns the first and last days of a month ("2024-02"), restricted to [`date_start`, `date_end`]"""
+    first = datetime.date.fromisoformat(f"{month}-01")
+    last = (first.replace(day=28) + datetime.timedelta(days=4)).replace(day=1) - datetime.timedelta(days=1)
+    return max(first, date_start or first), min(last, date_end or last)
+
+
+def plan_shards(
+    client: JudilibreClient,
+    *,
+    jurisdictions: list[str] | None = None,
+    locations: list[str] | None = None,
+    date_start: datetime.date | None = None,
+    date_end: datetime.date | None = None,
+    selection: bool | None = None,
+) -> list[ExportShard]:
+    """Splits an export into shards, with the number of decisions of each one, using a single `/stats` request
+
+    Args:
+        client (JudilibreClient): client used for the `/stats` request
+        jurisdictions (list[str] | None, optional): codes of the jurisdictions to export ("cc", "ca", ...).
+            Defaults to None.
+        locations (list[str] | None, optional): codes of the locations to export ("ca_paris", ...).
+            Defaults to None.
+        date_start (datetime.date | None, optional): minimal decision date.
+            Defaults to None.
+        date_end (datetime.date | None, optional): maximal decision date.
+            Defaults to None.
+        selection (bool | None, optional): exports only the decisions of particular interest.
+            Defaults to None.
+
+    Returns:
+        list[ExportShard]: the non-empty shards, largest first
+
+    The decisions without a location of a jurisdiction make a shard of their own (`location=None`), unless
+    `locations` is given, which they cannot match.
+    """
+    stats = client.stats(
+        keys=["jurisdiction", "location", "month"],  # type: ignore
+        jurisdictions=jurisdictions,  # type: ignore
+        locations=locations,  # type: ignore
+        date_start=date_start,
+        date_end=date_end,
+        selection=selection,
+    )
+
+    shards = []
+    for aggregate in stats.results.aggregated_data:
+        key = aggregate.key
+        if key.month is None or key.jurisdiction is None or not aggregate.decisions_count:
+            continue
+        if key.location is None and locations:
+            continue
+        shard_start, shard_end = _month_range(key.month, date_start, date_end)
+        shards.append(
+            ExportShard(
+                jurisdiction=JudilibreMultiValueEnum.replace_enum(key.jurisdiction),
+                location=JudilibreMultiValueEnum.replace_enum(key.location) if key.location else None,
+                date_start=shard_start,
+                date_end=shard_end,
+                expected=aggregate.decisions_count,
+            )
+        )
+    return sorted(shards, key=lambda shard: (-shard.expected, shard.name))
+
+
+def export_shard(
+    client: JudilibreClient,
+    shard: ExportShard,
+    output: str,
+    *,
+    export_format: str = "jsonl",
+    batch_size: int = 1_000,
+    selection: bool | None = None,
+) -> ShardResult:
+    """Exports the decisions of a shard to a file of `output`
+
+    The decisions are written to a temporary file, renamed once all of them have been written, so that the file
+    of a shard is either complete or absent. `/scan` cannot select the decisions without a location: those of a
+    shard without location are the decisions of its jurisdiction whose location is missing.
+
+    Args:
+        client (JudilibreClient): client used for the `/scan` requests
+        shard (ExportShard): shard to export
+        output (str): output folder
+        export_format (str, optional): "jsonl" (JSON Lines compressed with gzip) or "parquet" (requires `pyarrow`).
+            Defaults to "jsonl".
+        batch_size (int, optional): number of decisions per `/scan` request.
+            Defaults to 1_000.
+        selection (bool | None, optional): exports only the decisions of particular interest.
+            Defaults to None.
+
+    Returns:
+        ShardResult: the numbers of decisions, bytes and requests of the export
+    """
+    path = shard.path(output, export_format)
+    partial_path = f"{path}.part"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    reports: list[JudilibreProgress] = []
+    started = time.perf_counter()
+    decisions = client.iter_scan(
+        batch_size=batch_size,
+        jurisdictions=[shard.jurisdiction],  # type: ignore
+        locations=[shard.location] if shard.location else None,  # type: ignore
+        date_start=shard.date_start,
+        date_end=shard.date_end,
+        selection=selection,
+        progress_callback=reports.append,
+    )
+    if shard.location is None:
+        # the decisions of the located shards of the jurisdiction are exported by those shards
+        decisions = (decision for decision in decisions if decision.location is None)
+    try:
+        if export_format == "parquet":
+            n_decisions = _write_parquet(partial_path, decisions)
+        else:
+            n_decisions = _write_jsonl(partial_path, decisions)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+    os.replace(partial_path, path)
+
+    progress = reports[-1] if reports else None
+    return ShardResult(
+        shard=shard,
+        path=path,
+        decisions=n_decisions,
+        bytes_written=os.path.getsize(path),
+        bytes_received=progress.bytes_received if progress else 0,
+        requests=progress.requests if progress else 0,
+        retries=progress.retries if progress else 0,
+        seconds=time.perf_counter() - started,
+    )
+
+
+def _write_jsonl(path: str, decisions: Iterator) -> int:
+    """Writes decisions to a gzip-compressed JSON Lines file and returns their number"""
+    n_decisions = 0
+    with gzip.open(path, "wt", encoding="utf-8", compresslevel=6) as output_file:
+        for decision in decisions:
+            output_file.write(decision.model_dump_json())
+            output_file.write("\n")
+            n_decisions += 1
+    return n_decisions
+
+
+def _require_pyarrow():
+    """Imports `pyarrow.parquet`, which is only needed for Parquet exports"""
+    try:
+        import pyarrow  # type: ignore
+        import pyarrow.parquet  # type: ignore
+    except ImportError as exc:
+        raise ImportError("Parquet exports require pyarrow: pip install 'pyjudilibre[parquet]'") from exc
+    return pyarrow
+
+
+def _write_parquet(path: str, decisions: Iterator) -> int:
+    """Writes decisions to a Parquet file (compressed with zstd) and returns their number"""
+    pyarrow = _require_pyarrow()
+    rows = [decision.model_dump(mode="json") for decision in decisions]
+    pyarrow.parquet.write_table(pyarrow.Table.from_pylist(rows), path, compression="zstd")
+    return len(rows)
+
+
+def _init_worker(client_options: dict):
+    """Builds the client of a worker process"""
+    global _worker_client
+    from pyjudilibre import JudilibreClient
+
+    _worker_client = JudilibreClient(**client_options)
+
+
+def _export_shard_in_worker(shard: ExportShard, output: str, options: dict) -> ShardResult:
+    assert _worker_client is not None
+    return export_shard(_worker_client, shard, output, **options)
+
+
+def _read_checkpoint(output: str) -> set[str]:
+    """Returns the names of the shards recorded in the checkpoint of `output` whose file still exists"""
+    checkpoint_path = os.path.join(output, CHECKPOINT_FILENAME)
+    if not os.path.exists(checkpoint_path):
+        return set()
+    done = set()
+    with open(checkpoint_path, encoding="utf-8") as checkpoint_file:
+        for line in checkpoint_file:
+            if line.strip():
+                entry = json.loads(line)
+                if os.path.exists(entry["path"]):
+                    done.add(entry["shard"])
+    return done
+
+
+def _record_checkpoint(output: str, result: ShardResult):
+    entry = {
+        "shard": result.shard.name,
+        "path": result.path,
+        "decisions": result.decisions,
+        "expected": result.shard.expected,
+        "bytes": result.bytes_written,
+        "seconds": round(result.seconds, 3),
+    }
+    with open(os.path.join(output, CHECKPOINT_FILENAME), "a", encoding="utf-8") as checkpoint_file:
+        checkpoint_file.write(json.dumps(entry) + "\n")
+
+
+def run_export(args: argparse.Namespace) -> int:
+    """Runs the `export` command: plans the shards, exports the missing ones and prints a summary
+
+    A shard that fails does not stop the others, which are still recorded in the checkpoint: the command then
+    reports the failed shards and returns 1, and running it again only exports them.
+    """
+    from pyjudilibre import JudilibreClient
+    from pyjudilibre.progress import JudilibreProgress, TqdmProgress
+
+    if args.format == "parquet":
+        _require_pyarrow()
+    if args.date_start and args.date_end and args.date_start > args.date_end:
+        raise JudilibreValueError(f"date_start ({args.date_start}) is after date_end ({args.date_end})")
+
+    processes = max(args.processes, 1)
+    client_options = {
+        "judilibre_api_url": args.api_url,
+        "judilibre_api_key": args.api_key,
+        "transport": args.transport,
+        "max_retries": args.max_retries,
+        # each process has its own rate limiter: they share the rate
+        "rate_limit": args.rate_limit / processes if args.rate_limit else None,
+    }
+    started = time.perf_counter()
+
+    with JudilibreClient(**client_options) as client:
+        shards = plan_shards(
+            client,
+            jurisdictions=args.jurisdiction,
+            locations=args.location,
+            date_start=args.date_start,
+            date_end=args.date_end,
+            selection=args.selection,
+        )
+
+    os.makedirs(args.output, exist_ok=True)
+    done = _read_checkpoint(args.output)
+    pending = [shard for shard in shards if shard.name not in done]
+    options = {"export_format": args.format, "batch_size": args.batch_size, "selection": args.selection}
+
+    progress = JudilibreProgress(
+        operation="export",
+        unit="shards",
+        total=len(pending),
+        callback=TqdmProgress() if args.verbose else None,
+    )
+    results: list[ShardResult] = []
+    failures: dict[str, Exception] = {}
+
+    def collect(shard: ExportShard, result: ShardResult | Exception):
+        if isinstance(result, Exception):
+            failures[shard.name] = result
+        else:
+            _record_checkpoint(args.output, result)
+            results.append(result)
+        done = len(results) + len(failures)
+        progress.update(done, finished=done == len(pending))
+
+    if processes == 1:
+        with JudilibreClient(**client_options) as client:
+            for shard in pending:
+                try:
+                    collect(shard, export_shard(client, shard, args.output, **options))
+                except Exception as exc:
+                    collect(shard, exc)
+    else:
+        with ProcessPoolExecutor(processes, initializer=_init_worker, initargs=(client_options,)) as executor:
+            futures = {
+                executor.submit(_export_shard_in_worker, shard, args.output, options): shard for shard in pending
+            }
+            for future in as_completed(futures):
+                try:
+                    collect(futures[future], future.result())
+                except Exception as exc:
+                    collect(futures[future], exc)
+
+    print_summary(
+        results,
+        skipped=len(shards) - len(pending),
+        seconds=time.perf_counter() - started,
+        failures=failures,
+    )
+    return 1 if failures else 0
+
+
+def print_summary(
+    results: list[ShardResult],
+    skipped: int,
+    seconds: float,
+    file=None,
+    failures: dict[str, Exception] | None = None,
+):
+    """Prints the numbers of decisions, requests and bytes of an export, its throughput and its failed shards"""
+    file = file or sys.stdout
+    decisions = sum(r.decisions for r in results)
+    bytes_received = sum(r.bytes_received for r in results)
+    bytes_written = sum(r.bytes_written for r in results)
+    requests = sum(r.requests for r in results)
+    retries = sum(r.retries for r in results)
+    mismatches = [r for r in results if r.decisions != r.shard.expected]
+
+    print(
+        f"Exported {decisions} decisions in {len(results)} shards ({skipped} skipped"
+        + (f", {len(failures)} failed" if failures else "")
+        + f") in {seconds:.1f}s",
+        file=file,
+    )
+    print(
+        f"  {decisions / seconds if seconds else 0:.0f} decisions/s, "
+        f"{bytes_received / seconds / 1e6 if seconds else 0:.2f} MB/s received, "
+        f"{requests} requests, {retries} retries",
+        file=file,
+    )
+    print(f"  {bytes_written / 1e6:.2f} MB written", file=file)
+    for result in mismatches:
+        print(
+            f"  warning: {result.shard.name} has {result.decisions} decisions, {result.shard.expected} expected",
+            file=file,
+        )
+    for name, exc in sorted((failures or {}).items()):
+        print(f"  error: {name} failed: {exc!r}", file=file)
+
+
+def run_taxonomy_snapshot(args: argparse.Namespace) -> int:
+    """Runs the `taxonomy snapshot` command: fetches all the taxons and writes them to a snapshot"""
+    from pyjudilibre import JudilibreClient
+    from pyjudilibre.taxonomy import TaxonomyRegistry, write_snapshot
+
+    started = time.perf_counter()
+    with JudilibreClient(judilibre_api_url=args.api_url, judilibre_api_key=args.api_key) as client:
+        registry = TaxonomyRegistry(client, max_workers=args.max_workers).warm_up()
+        size = write_snapshot(args.output, registry.taxons(), url=client.judilibre_api_url)
+
+    print(
+        f"Wrote {len(registry)} taxons ({size / 1e3:.0f} kB) to {args.output} in {time.perf_counter() - started:.1f}s"
+    )
+    _print_failures(registry.failures)
+    return 1 if registry.failures else 0
+
+
+def run_taxonomy_diff(args: argparse.Namespace) -> int:
+    """Runs the `taxonomy diff` command: prints the differences between a snapshot and the API"""
+    from pyjudilibre import JudilibreClient
+    from pyjudilibre.taxonomy import Taxon, TaxonomyRegistry, TaxonomySnapshot, diff_taxons
+
+    with TaxonomySnapshot(args.snapshot) as snapshot:
+        with JudilibreClient(judilibre_api_url=args.api_url, judilibre_api_key=args.api_key) as client:
+            registry = TaxonomyRegistry(client, max_workers=args.max_workers).warm_up()
+        live = {(taxon.taxon_id, taxon.context): taxon for taxon in registry.taxons()}
+
+        diffs = []
+        # the taxons that could not be fetched are not compared
+        for key in sorted((set(live) | set(snapshot.keys())) - set(registry.failures)):
+            old = snapshot.taxon(*key) or Taxon(taxon_id=key[0], context=key[1], labels={})
+            new = live.get(key) or Taxon(taxon_id=key[0], context=key[1], labels={})
+            diff = diff_taxons(old, new)
+            if diff:
+                diffs.append(diff)
+
+    for diff in diffs:
+        print(f"{diff.taxon_id}/{diff.context}: +{len(diff.added)} -{len(diff.removed)} ~{len(diff.changed)}")
+        if args.verbose:
+            for code, label in diff.added.items():
+                print(f"  + {code}: {label}")
+            for code, label in diff.removed.items():
+                print(f"  - {code}: {label}")
+            for code, (old_label, new_label) in diff.changed.items():
+                print(f"  ~ {code}: {old_label} -> {new_label}")
+    print(f"{len(diffs)} taxons differ from the snapshot" if diffs else "The snapshot is up to date")
+    _print_failures(registry.failures)
+    return 1 if diffs or registry.failures else 0
+
+
+def _print_failures(failures: dict[tuple[str, str], Exception]):
+    """Prints the taxons that could not be fetched, and why"""
+    for (taxon_id, context), exc in sorted(failures.items()):
+        print(f"  error: could not fetch {taxon_id}/{context}: {exc}")
+
+
+def _add_api_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--api-url", help="URL of the API (default: $JUDILIBRE_API_URL)")
+    parser.add_argument("--api-key", help="API key (default: $JUDILIBRE_API_KEY)")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="pyjudilibre", description="Command line interface of pyjudilibre")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="exports decisions to files, shard by shard")
+    export.add_argument(
+        "--jurisdiction",
+        action="append",
+        choices=[j._all_values[-1] for j in JurisdictionEnum],  # type: ignore
+        help="jurisdiction to export (can be repeated)",
+    )
+    export.add_argument("--location", action="append", help="location to export, e.g. ca_paris (can be repeated)")
+    export.add_argument("--date-start", type=datetime.date.fromisoformat, help="minimal decision date (YYYY-MM-DD)")
+    export.add_argument("--date-end", type=datetime.date.fromisoformat, help="maximal decision date (YYYY-MM-DD)")
+    export.add_argument("--selection", action="store_true", default=None, help="only decisions of interest")
+    export.add_argument("--output", required=True, help="output folder")
+    export.add_argument("--format", choices=sorted(EXPORT_FORMATS), default="jsonl", help="format of the files")
+    export.add_argument("--processes", type=int, default=4, help="number of worker processes (default: 4)")
+    export.add_argument("--batch-size", type=int, default=1_000, help="decisions per request (default: 1000)")
+    export.add_argument("--rate-limit", type=float, help="maximal number of requests per second, for all processes")
+    export.add_argument("--max-retries", type=int, default=3, help="retries of a failed request (default: 3)")
+    export.add_argument("--transport", choices=["urllib", "pooled", "httpx"], default="pooled")
+    _add_api_arguments(export)
+    export.add_argument("--verbose", action="store_true", help="displays a progress bar")
+    export.set_defaults(run=run_export)
+
+    taxonomy = commands.add_parser("taxonomy", help="snapshots the taxons of the API")
+    taxonomy_commands = taxonomy.add_subparsers(dest="taxonomy_command", required=True)
+
+    snapshot = taxonomy_commands.add_parser("snapshot", help="writes all the taxons to a snapshot file")
+    snapshot.add_argument("--output", required=True, help="path of the snapshot")
+    snapshot.add_argument("--max-workers", type=int, default=8, help="concurrent requests (default: 8)")
+    _add_api_arguments(snapshot)
+    snapshot.set_defaults(run=run_taxonomy_snapshot)
+
+    diff = taxonomy_commands.add_parser("diff", help="compares a snapshot with the API")
+    diff.add_argument("snapshot", help="path of the snapshot")
+    diff.add_argument("--max-workers", type=int, default=8, help="concurrent requests (default: 8)")
+    diff.add_argument("--verbose", action="store_true", help="prints the codes that differ")
+    _add_api_arguments(diff)
+    diff.set_defaults(run=run_taxonomy_diff)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point of the command line interface"""
+    args = _build_parser().parse_args(argv)
+    status = args.run(args)
+    return status if isinstance(status, int) else 0
@@ -1,7 +1,6 @@
 import functools
 from typing import Callable
 
-import httpx
 from pyjudilibre.exceptions import JudilibreWrongURLError
 
 
@@ -22,7 +21,7 @@ def catch_wrong_url_error(function: Callable):
         try:
             results = function(*args, **kwargs)
             return results
-        except httpx.ConnectError as exc:
+        except ConnectionError as exc:
             raise JudilibreWrongURLError("URL is not reachable.") from exc
 
     return wrapper
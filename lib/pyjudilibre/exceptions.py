@@ -1,3 +1,8 @@
+import email.message
+import urllib.error
+from typing import Mapping
+
+
 class JudilibreDecisionNotFoundError(Exception):
     pass
 
@@ -50,6 +55,31 @@ class JudilibreInternalError(Exception):
     pass
 
 
+class JudilibreHTTPError(urllib.error.HTTPError):
+    """Error status code without a more specific exception
+
+    It is also a `urllib.error.HTTPError` (with its `url`, `code` and `headers`), as raised before transports.
+    """
+
+    def __init__(self, message: str, url: str = "", code: int = 0, headers: Mapping[str, str] | None = None):
+        message_headers = email.message.Message()
+        for name, value in (headers or {}).items():
+            message_headers[name] = value
+        super().__init__(url, code, message, message_headers, None)
+        self.args = (message, url, code, dict(headers or {}))
+
+    def __str__(self) -> str:
+        return self.msg
+
+
+class JudilibreGatewayTimeoutError(TimeoutError):
+    pass
+
+
+class JudilibreCassetteMissError(Exception):
+    pass
+
+
 ERROR_CODES_TO_EXCEPTIONS = {
     400: JudilibreInvalidRequestError,
     401: JudilibreInvalidCredentialsError,
@@ -58,6 +88,7 @@ ERROR_CODES_TO_EXCEPTIONS = {
     423: JudilibreSuspiciousActivityError,
     429: JudilibreTooManyRequestError,
     500: JudilibreInternalError,
+    504: JudilibreGatewayTimeoutError,
 }
 
 # def catch_response(response: Response) -> Response:
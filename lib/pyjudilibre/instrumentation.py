@@ -0,0 +1,280 @@
+"""Request instrumentation for `JudilibreClient`
+
+`JudilibreClient` emits a `JudilibreRequestEvent` to the callbacks registered with `JudilibreClient.add_hook`
+at each step of a request:
+
+- `before_request`: before the request is sent
+- `after_response`: after a successful response has been received and decoded
+- `on_error`: after an attempt has failed (HTTP error, timeout, invalid JSON, ...)
+- `on_retry`: before waiting `retry_delay` seconds and retrying a failed attempt
+
+`JudilibreMetricsCollector` uses those hooks to record per-endpoint metrics that can be exported
+as a dictionary or in the Prometheus text format.
+"""
+
+import bisect
+import threading
+from dataclasses import dataclass, field
+from typing import Callable
+
+HOOK_NAMES = (
+    "before_request",
+    "after_response",
+    "on_error",
+    "on_retry",
+)
+
+DEFAULT_LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+@dataclass
+class JudilibreRequestEvent:
+    """Information on a request, filled as the request progresses
+
+    `wire_bytes` is the size of the body received from the network and `response_bytes` its size once
+    decompressed (both are equal when the response is not compressed). `throttle_time` is the time spent
+    waiting for the rate limiter before sending the request, which is not part of `duration`.
+    """
+
+    method: str
+    endpoint: str
+    url: str
+    attempt: int = 0
+
+    status: int | None = None
+    wire_bytes: int = 0
+    response_bytes: int = 0
+    network_time: float = 0.0
+    decode_time: float = 0.0
+    throttle_time: float = 0.0
+
+    error: BaseException | None = None
+    retry_delay: float | None = None
+
+    extra: dict = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        """Total time spent on the request (network and decoding)"""
+        return self.network_time + self.decode_time
+
+
+JudilibreHook = Callable[[JudilibreRequestEvent], None]
+
+
+class _Histogram:
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> list[tuple[str, int]]:
+        counts = []
+        total = 0
+        for bound, count in zip([*map(str, self.buckets), "+Inf"], self.counts):
+            total += count
+            counts.append((bound, total))
+        return counts
+
+
+class _EndpointMetrics:
+    def __init__(self, buckets: tuple[float, ...]):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.status_codes: dict[int, int] = {}
+        self.bytes_received = 0
+        self.bytes_decoded = 0
+        self.network_time = 0.0
+        self.decode_time = 0.0
+        self.throttle_time = 0.0
+        self.latency = _Histogram(buckets)
+
+
+class JudilibreMetricsCollector:
+    """Collects per-endpoint metrics from the hooks of one or several `JudilibreClient`
+
+    ```python
+    metrics = JudilibreMetricsCollector()
+    metrics.attach(client)
+
+    client.paginate_scan(...)
+
+    print(metrics.as_dict()["/scan"]["latency"]["mean"])
+    print(metrics.to_prometheus())
+    ```
+    """
+
+    def __init__(self, latency_buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        """Constructor of the `JudilibreMetricsCollector` class
+
+        Args:
+            latency_buckets (tuple[float, ...], optional): upper bounds (in seconds) of the latency histograms.
+                Defaults to DEFAULT_LATENCY_BUCKETS.
+        """
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self._endpoints: dict[str, _EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def attach(self, client) -> "JudilibreMetricsCollector":
+        """Registers the collector on the hooks of a `JudilibreClient`"""
+        client.add_hook("after_response", self.after_response)
+        client.add_hook("on_error", self.on_error)
+        client.add_hook("on_retry", self.on_retry)
+        return self
+
+    def detach(self, client):
+        """Removes the collector from the hooks of a `JudilibreClient`"""
+        client.remove_hook("after_response", self.after_response)
+        client.remove_hook("on_error", self.on_error)
+        client.remove_hook("on_retry", self.on_retry)
+
+    def reset(self):
+        """Clears all the collected metrics"""
+        with self._lock:
+            self._endpoints.clear()
+
+    def _endpoint(self, endpoint: str) -> _EndpointMetrics:
+        if endpoint not in self._endpoints:
+            self._endpoints[endpoint] = _EndpointMetrics(self.latency_buckets)
+        return self._endpoints[endpoint]
+
+    def _record(self, event: JudilibreRequestEvent) -> _EndpointMetrics:
+        metrics = self._endpoint(event.endpoint)
+        metrics.requests += 1
+        if event.status is not None:
+            metrics.status_codes[event.status] = metrics.status_codes.get(event.status, 0) + 1
+        metrics.bytes_received += event.wire_bytes
+        metrics.bytes_decoded += event.response_bytes
+        metrics.network_time += event.network_time
+        metrics.decode_time += event.decode_time
+        metrics.throttle_time += event.throttle_time
+        metrics.latency.observe(event.duration)
+        return metrics
+
+    def after_response(self, event: JudilibreRequestEvent):
+        with self._lock:
+            self._record(event)
+
+    def on_error(self, event: JudilibreRequestEvent):
+        with self._lock:
+            self._record(event).errors += 1
+
+    def on_retry(self, event: JudilibreRequestEvent):
+        with self._lock:
+            self._endpoint(event.endpoint).retries += 1
+
+    def as_dict(self) -> dict[str, dict]:
+        """Returns the collected metrics, by endpoint"""
+        with self._lock:
+            return {
+                endpoint: {
+                    "requests": metrics.requests,
+                    "errors": metrics.errors,
+                    "retries": metrics.retries,
+                    "status_codes": dict(metrics.status_codes),
+                    "bytes_received": metrics.bytes_received,
+                    "bytes_decoded": metrics.bytes_decoded,
+                    "network_time": metrics.network_time,
+                    "decode_time": metrics.decode_time,
+                    "throttle_time": metrics.throttle_time,
+                    "latency": {
+                        "count": metrics.latency.count,
+                        "sum": metrics.latency.sum,
+                        "mean": metrics.latency.sum / metrics.latency.count if metrics.latency.count else None,
+                        "buckets": dict(metrics.latency.cumulative_counts()),
+                    },
+                }
+                for endpoint, metrics in self._endpoints.items()
+            }
+
+    def to_prometheus(self, prefix: str = "judilibre_client") -> str:
+        """Returns the collected metrics in the Prometheus text exposition format"""
+        lines: list[str] = []
+
+        def family(name: str, metric_type: str, description: str, samples: list[tuple[str, dict, float]]):
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} {metric_type}")
+            for suffix, labels, value in samples:
+                label_string = ",".join(f'{k}="{v}"' for k, v in labels.items())
+                lines.append(f"{prefix}_{name}{suffix}{{{label_string}}} {value}")
+
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            family(
+                "requests_total",
+                "counter",
+                "Number of requests by endpoint and status code",
+                [
+                    ("", {"endpoint": endpoint, "status": status}, count)
+                    for endpoint, metrics in endpoints
+                    for status, count in sorted(metrics.status_codes.items())
+                ],
+            )
+            family(
+                "errors_total",
+                "counter",
+                "Number of failed attempts by endpoint",
+                [("", {"endpoint": endpoint}, metrics.errors) for endpoint, metrics in endpoints],
+            )
+            family(
+                "retries_total",
+                "counter",
+                "Number of retries by endpoint",
+                [("", {"endpoint": endpoint}, metrics.retries) for endpoint, metrics in endpoints],
+            )
+            family(
+                "received_bytes_total",
+                "counter",
+                "Number of bytes received from the network (compressed) by endpoint",
+                [("", {"endpoint": endpoint}, metrics.bytes_received) for endpoint, metrics in endpoints],
+            )
+            family(
+                "decoded_bytes_total",
+                "counter",
+                "Number of bytes of the decompressed responses by endpoint",
+                [("", {"endpoint": endpoint}, metrics.bytes_decoded) for endpoint, metrics in endpoints],
+            )
+            family(
+                "network_seconds_total",
+                "counter",
+                "Time spent waiting for the network by endpoint",
+                [("", {"endpoint": endpoint}, metrics.network_time) for endpoint, metrics in endpoints],
+            )
+            family(
+                "decode_seconds_total",
+                "counter",
+                "Time spent decoding responses by endpoint",
+                [("", {"endpoint": endpoint}, metrics.decode_time) for endpoint, metrics in endpoints],
+            )
+            family(
+                "throttle_seconds_total",
+                "counter",
+                "Time spent waiting for the rate limiter by endpoint",
+                [("", {"endpoint": endpoint}, metrics.throttle_time) for endpoint, metrics in endpoints],
+            )
+            family(
+                "request_duration_seconds",
+                "histogram",
+                "Duration of the requests by endpoint",
+                [
+                    sample
+                    for endpoint, metrics in endpoints
+                    for sample in [
+                        *[
+                            ("_bucket", {"endpoint": endpoint, "le": bound}, count)
+                            for bound, count in metrics.latency.cumulative_counts()
+                        ],
+                        ("_sum", {"endpoint": endpoint}, metrics.latency.sum),
+                        ("_count", {"endpoint": endpoint}, metrics.latency.count),
+                    ]
+                ],
+            )
+
+        return "\n".join(lines) + "\n"
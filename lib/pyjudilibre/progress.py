@@ -0,0 +1,190 @@
+"""Progress reporting of the long-running methods of `JudilibreClient`
+
+The paginators (`paginate_*`, `iter_*`), `decisions`, `hydrate` and `download_decision_files` accept a
+`progress_callback`, called with a `JudilibreProgress` after each page (or decision, or file). The totals
+come from the responses of the API, so reporting progress costs no additional request:
+
+```python
+def log_progress(progress):
+    print(
+        f"{progress.done}/{progress.total} {progress.unit} in {progress.requests} requests, "
+        f"{progress.rate:.0f} {progress.unit}/s, {progress.bytes_rate / 1e6:.1f} MB/s, ETA {progress.eta}s"
+    )
+
+decisions = client.paginate_scan(progress_callback=log_progress)
+decisions = client.paginate_scan(progress_callback=TqdmProgress())  # what `verbose=True` does
+```
+
+`idle_time` (the time since the last response) can be used to detect stalled operations.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Hashable
+
+if TYPE_CHECKING:
+    from tqdm import tqdm
+
+
+@dataclass
+class JudilibreProgress:
+    """Progress and throughput of an operation
+
+    The same object is updated during the whole operation and passed to `callback` after each step: `total`
+    is `None` until it is known (usually after the first request), and `finished` is True in the last call.
+    Requests, retries and rate limiter waits are recorded by the client as they happen, from any thread.
+    """
+
+    operation: str
+    unit: str = "decisions"
+    done: int = 0
+    total: int | None = None
+    requests: int = 0
+    retries: int = 0
+    bytes_received: int = 0
+    throttle_time: float = 0.0
+    finished: bool = False
+    started: float = field(default_factory=time.perf_counter)
+    updated: float = field(default_factory=time.perf_counter)
+    callback: ProgressCallback | None = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+        self._parts: dict[Hashable, JudilibreProgress] = {}
+        self._parts_lock = threading.Lock()
+
+    @property
+    def elapsed(self) -> float:
+        """Number of seconds since the start of the operation"""
+        return time.perf_counter() - self.started
+
+    @property
+    def idle_time(self) -> float:
+        """Number of seconds since the last response (or the start of the operation)"""
+        return time.perf_counter() - self.updated
+
+    @property
+    def rate(self) -> float:
+        """Number of items processed per second"""
+        elapsed = self.elapsed
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def bytes_rate(self) -> float:
+        """Number of bytes received per second"""
+        elapsed = self.elapsed
+        return self.bytes_received / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def fraction(self) -> float | None:
+        """Fraction of the items processed, if the total is known"""
+        if not self.total:
+            return None
+        return min(self.done / self.total, 1.0)
+
+    @property
+    def eta(self) -> float | None:
+        """Expected number of seconds before the end of the operation, at the current rate"""
+        if self.finished:
+            return 0.0
+        rate = self.rate
+        if self.total is None or rate <= 0:
+            return None
+        return max(self.total - self.done, 0) / rate
+
+    def record(self, n_bytes: int):
+        """Records a successful request and the number of bytes of its response"""
+        with self._lock:
+            self.requests += 1
+            self.bytes_received += n_bytes
+            self.updated = time.perf_counter()
+
+    def record_retry(self):
+        """Records a failed attempt that is going to be retried"""
+        with self._lock:
+            self.retries += 1
+
+    def record_throttle(self, seconds: float):
+        """Records a wait for the rate limiter"""
+        with self._lock:
+            self.throttle_time += seconds
+
+    def update(
+        self,
+        done: int,
+        total: int | None = None,
+        finished: bool = False,
+    ):
+        """Updates the number of items processed (and the total, if it was unknown) and calls the callback"""
+        with self._lock:
+            self.done = done
+            if self.total is None:
+                self.total = total
+            self.finished = finished
+        if self.callback is not None:
+            self.callback(self)
+
+    def part(self, key: Hashable) -> ProgressCallback:
+        """Returns the progress callback of a part of the operation, run in parallel with the other parts
+
+        The counters of the operation are the sums of those of its parts, and its callback is called (from the
+        thread of the part) after each step of a part, until the operation is finished.
+        """
+
+        def report(part_progress: JudilibreProgress):
+            with self._parts_lock:
+                if self.finished:
+                    return
+                self._parts[key] = part_progress
+                parts = self._parts.values()
+                with self._lock:
+                    self.requests = sum(p.requests for p in parts)
+                    self.retries = sum(p.retries for p in parts)
+                    self.bytes_received = sum(p.bytes_received for p in parts)
+                    self.throttle_time = sum(p.throttle_time for p in parts)
+                    self.updated = max(p.updated for p in parts)
+                self.update(sum(p.done for p in parts))
+
+        return report
+
+    def finish(self, done: int):
+        """Marks an operation made of parts as finished (see `part`) and calls the callback a last time"""
+        with self._parts_lock:
+            self.update(done, finished=True)
+
+
+ProgressCallback = Callable[[JudilibreProgress], None]
+
+
+def _progress_bar(total: int | None) -> tqdm:
+    """Builds a `tqdm` progress bar, importing `tqdm` only when a progress bar is actually needed"""
+    import warnings
+
+    from tqdm import TqdmExperimentalWarning
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=TqdmExperimentalWarning)
+        from tqdm.autonotebook import tqdm
+
+    return tqdm(total=total)
+
+
+class TqdmProgress:
+    """Progress callback displaying a `tqdm` progress bar"""
+
+    def __init__(self) -> None:
+        self._bar: tqdm | None = None
+
+    def __call__(self, progress: JudilibreProgress):
+        if self._bar is None:
+            self._bar = _progress_bar(total=progress.total)
+        elif progress.total is not None and self._bar.total != progress.total:
+            self._bar.total = progress.total
+            self._bar.refresh()
+
+        self._bar.update(progress.done - self._bar.n)
+        if progress.finished:
+            self._bar.close()
@@ -1,12 +1,24 @@
+from __future__ import annotations
+
+import copy
 import datetime
+import heapq
+import itertools
 import json
 import logging
 import os
-import urllib.error
-import urllib.request
-import warnings
+import queue
+import random
+import threading
+import time
+import urllib.parse
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Callable, Generator, Hashable, Iterable, Iterator, Sequence, Sized, TypeVar, cast
 from urllib.parse import parse_qs
 
+from pyjudilibre.batching import AdaptiveBatchSize
+from pyjudilibre.cache import LRUCache, SingleFlight
 from pyjudilibre.enums import (
     JudilibreDateTypeEnum,
     JudilibreFileTypeEnum,
@@ -16,43 +28,325 @@ from pyjudilibre.enums import (
     JudilibreTaxonEnum,
     JurisdictionEnum,
     LocationCAEnum,
-    LocationTCOMEnum,
-    LocationTJEnum,
 )
 from pyjudilibre.exceptions import (
     ERROR_CODES_TO_EXCEPTIONS,
     JudilibreDecisionNotFoundError,
     JudilibreDownloadFileError,
+    JudilibreHTTPError,
     JudilibreResourceNotFoundError,
+    JudilibreValueError,
 )
-from pyjudilibre.models import (
-    File,
-    JudilibreDecision,
-    JudilibreSearchResult,
-    JudilibreShortDecision,
-    JudilibreStats,
-    JudilibreTransaction,
+from pyjudilibre.instrumentation import HOOK_NAMES, JudilibreHook, JudilibreRequestEvent
+from pyjudilibre.progress import JudilibreProgress, ProgressCallback, TqdmProgress
+from pyjudilibre.ratelimit import RateLimiter
+from pyjudilibre.streaming import JsonStreamParser
+from pyjudilibre.transports import (
+    ContentDecoder,
+    JudilibreTransport,
+    JudilibreTransportResponse,
+    accept_encoding,
+    build_transport,
 )
-from tqdm import TqdmExperimentalWarning
-from tqdm.autonotebook import tqdm
+
+if TYPE_CHECKING:
+    # `pyjudilibre.models` (and `pydantic`), the large location enums and `tqdm` are imported
+    # on first use to keep `import pyjudilibre` cheap.
+    from pyjudilibre.locations import LocationTCOMEnum, LocationTJEnum
+    from pyjudilibre.models import (
+        File,
+        JudilibreDecision,
+        JudilibreSearchResult,
+        JudilibreShortDecision,
+        JudilibreStats,
+        JudilibreTransaction,
+    )
 
 __version__ = "0.14.6"
 
-warnings.filterwarnings("ignore", category=TqdmExperimentalWarning)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+MAX_RESULT_WINDOW = 10_000
+# `/export` is paginated by batch number: batch sizes dividing the result window keep every batch inside it
+EXPORT_BATCH_SIZES = tuple(size for size in range(1, 1_001) if MAX_RESULT_WINDOW % size == 0)
+# largest pages accepted by `/search` and `/transactionalhistory`, used by the paginators with `page_size="auto"`
+SEARCH_MAX_PAGE_SIZE = 50
+TRANSACTIONAL_HISTORY_MAX_PAGE_SIZE = 1_000
+# number of results read ahead by each group of locations of `iter_scan(..., max_workers=...)`, and by each date
+# window of `iter_search(..., split_dates=True)`
+FAN_OUT_BUFFER_SIZE = 100
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+# zones of `Zoning` that `hydrate` can select
+ZONING_ZONES = ("introduction", "expose_du_litige", "moyens", "motivations", "dispositif", "moyens_annexes")
+# parameters of the queries of `stats_many`
+STATS_QUERY_PARAMETERS = ("keys", "locations", "jurisdictions", "date_start", "date_end", "date_type", "selection")
+
+T = TypeVar("T")
+R = TypeVar("R")
+K = TypeVar("K", bound=Hashable)
+READ_CHUNK_SIZE = 1 << 16
+# guards the configuration of the logger shared by the clients, which can be built concurrently
+_LOGGER_LOCK = threading.Lock()
+
+
+def _stats_cache_key(
+    keys: list | None = None,
+    locations: list | None = None,
+    jurisdictions: list | None = None,
+    date_start: datetime.date | str | None = None,
+    date_end: datetime.date | str | None = None,
+    date_type: JudilibreDateTypeEnum | str | None = JudilibreDateTypeEnum.creation,
+    selection: bool | None = None,
+) -> tuple:
+    """Returns the normalized query of `stats`, the same for enum members and their codes, for dates and their ISO
+    strings, and for filters in any order (the order of the aggregation keys matters, as it is the order of the
+    groups)"""
+
+    def codes(values: list | None) -> tuple | None:
+        return None if values is None else tuple(JudilibreMultiValueEnum.replace_enum(value) for value in values)
+
+    def iso(date: datetime.date | str | None) -> str | None:
+        return date.isoformat() if isinstance(date, datetime.date) else date
+
+    return (
+        codes(keys),
+        None if locations is None else tuple(sorted(set(codes(locations) or ()))),
+        None if jurisdictions is None else tuple(sorted(set(codes(jurisdictions) or ()))),
+        iso(date_start),
+        iso(date_end),
+        JudilibreMultiValueEnum.replace_enum(date_type) if date_type else None,
+        bool(selection),
+    )
+
+
+def _map_concurrently(
+    function: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    max_workers: int,
+    ordered: bool,
+) -> Generator[R, None, None]:
+    """Applies `function` to `items` on a thread pool, with at most `2 * max_workers` calls in flight, and yields
+    the results in the order of `items` or as soon as they are available
+
+    An exception raised by `items` is raised once the results of the items read before it have been yielded.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    iterator = iter(items)
+    pending: deque[Future[R]] = deque()
+    exhausted = False
+    error: Exception | None = None
+    try:
+        while True:
+            try:
+                while not exhausted and error is None and len(pending) < 2 * max_workers:
+                    pending.append(executor.submit(function, next(iterator)))
+            except StopIteration:
+                exhausted = True
+            except Exception as exc:
+                error = exc
+            if not pending:
+                if error is not None:
+                    raise error
+                return
+            if ordered:
+                yield pending.popleft().result()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _prefetch(items: Iterable[T], size: int) -> Iterator[T]:
+    """Iterates through `items` in a background thread, reading up to `size` items ahead of the consumer"""
+    return _merge_concurrently([items], size)
+
+
+def _produce(items: Iterable[T], buffer: queue.Queue, stopped: threading.Event, end: object):
+    """Puts the items of `items` into `buffer`, followed by `(end, exception)`, until `stopped` is set"""
+
+    def put(entry: tuple) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+        except BaseException as exc:
+            put((end, exc))
+        else:
+            put((end, None))
+
+    threading.Thread(target=produce, name="pyjudilibre-prefetch", daemon=True).start()
+
+
+def _merge_concurrently(iterables: Sequence[Iterable[T]], size: int) -> Generator[T, None, None]:
+    """Iterates through `iterables` in background threads (one per iterable) and yields their items as they come,
+    reading up to `size` items ahead of the consumer
+
+    The first exception raised by an iterable is raised once the items read before it have been yielded.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=max(size, 1))
+    stopped = threading.Event()
+    end = object()
+
+    for items in iterables:
+        _produce(items, buffer, stopped, end)
+    try:
+        remaining = len(iterables)
+        while remaining:
+            item, exc = buffer.get()
+            if item is end:
+                if exc is not None:
+                    raise exc
+                remaining -= 1
+                continue
+            yield item
+    finally:
+        stopped.set()
+
+
+def _chain_concurrently(iterables: Iterable[Iterable[T]], *, max_workers: int, size: int) -> Generator[T, None, None]:
+    """Yields the items of `iterables` one iterable after the other, while iterating through the next ones in
+    background threads: up to `max_workers` iterables are read at once, each up to `size` items ahead
+
+    An exception raised by an iterable is raised once the items read before it have been yielded.
+    """
+    stopped = threading.Event()
+    end = object()
+    iterator = iter(iterables)
+    running: deque[queue.Queue] = deque()
+    try:
+        while True:
+            for items in itertools.islice(iterator, max(max_workers, 1) - len(running)):
+                buffer: queue.Queue = queue.Queue(maxsize=max(size, 1))
+                _produce(items, buffer, stopped, end)
+                running.append(buffer)
+            if not running:
+                return
+            while True:
+                item, exc = running[0].get()
+                if item is end:
+                    if exc is not None:
+                        raise exc
+                    break
+                yield item
+            running.popleft()
+    finally:
+        stopped.set()
+
+
+def _bisect_dates(
+    count: Callable[[datetime.date, datetime.date], int],
+    date_start: datetime.date,
+    date_end: datetime.date,
+    total: int,
+    limit: int,
+) -> list[tuple[datetime.date, datetime.date, int]]:
+    """Splits [`date_start`, `date_end`], holding `total` results, into windows of at most `limit` results
+
+    Windows are halved until they are small enough: only the first half of a window is counted (with `count`),
+    the second one holding the rest. A single day holding more than `limit` results cannot be split.
+
+    Returns:
+        list[tuple[datetime.date, datetime.date, int]]: the first and last days and the number of results of the
+            non-empty windows, in chronological order
+    """
+    if total <= 0:
+        return []
+    if total <= limit or date_start >= date_end:
+        return [(date_start, date_end, total)]
+    middle = date_start + (date_end - date_start) // 2
+    first_half = count(date_start, middle)
+    return _bisect_dates(count, date_start, middle, first_half, limit) + _bisect_dates(
+        count, middle + datetime.timedelta(days=1), date_end, total - first_half, limit
+    )
+
+
+def _cap_windows(
+    windows: list[tuple[datetime.date, datetime.date, int]],
+    max_results: int | None,
+) -> list[tuple[datetime.date, datetime.date, int | None]]:
+    """Caps each window of dates at the results that the previous ones (according to their counts) lack
+
+    Returns:
+        list[tuple[datetime.date, datetime.date, int | None]]: the first and last days and the maximal number of
+            results of the windows needed for `max_results` results (all of them, uncapped, if it is `None`)
+    """
+    capped_windows: list[tuple[datetime.date, datetime.date, int | None]] = []
+    n_previous = 0
+    for start, end, window_results in windows:
+        if max_results is not None and n_previous >= max_results:
+            break
+        capped_windows.append((start, end, None if max_results is None else max_results - n_previous))
+        n_previous += window_results
+    return capped_windows
+
+
+def _balance(sizes: dict[K, int], n_groups: int) -> list[list[K]]:
+    """Splits the keys of `sizes` into at most `n_groups` groups of similar total sizes, assigning the largest keys
+    first, each to the smallest group (longest processing time first)"""
+    groups: list[tuple[int, int, list[K]]] = [(0, index, []) for index in range(max(min(n_groups, len(sizes)), 1))]
+    for key, size in sorted(sizes.items(), key=lambda item: -item[1]):
+        total, index, keys = heapq.heappop(groups)
+        keys.append(key)
+        heapq.heappush(groups, (total + size, index, keys))
+    return [keys for _, _, keys in sorted(groups, key=lambda group: group[1]) if keys]
+
+
+def _track_progress(items: Iterable[T], progress: JudilibreProgress) -> Iterator[T]:
+    """Yields `items`, counting them in `progress`"""
+    done = 0
+    for item in items:
+        done += 1
+        progress.update(done)
+        yield item
+    progress.update(done, done, finished=True)
+
+
+def _known_length(items: Iterable) -> int | None:
+    """Returns the length of `items` if it is known without iterating through it"""
+    return len(items) if isinstance(items, Sized) else None
 
 
 class JudilibreClient:
-    """Class that implements a Python Client for the **JUDILIBRE** API"""
+    """Class that implements a Python Client for the **JUDILIBRE** API
+
+    A client can be shared by several threads: the transports, the rate limiter, the decision cache and the
+    hooks are thread-safe, and a request does not change the state of the client. Hooks may be called from
+    any thread, so they must be thread-safe themselves.
+    """
 
     def __init__(
         self,
         judilibre_api_key: str | None = None,
         judilibre_api_url: str | None = None,
-        judilibre_api_headers: dict = {},
+        judilibre_api_headers: dict | None = None,
         http_proxy: str | None = None,
         https_proxy: str | None = None,
         default_timeout: int = 5,
         logging_level: int = logging.ERROR,
+        max_retries: int = 0,
+        retry_backoff: float = 0.5,
+        hooks: dict[str, list[JudilibreHook]] | None = None,
+        log_body_max_bytes: int | None = 2_048,
+        transport: JudilibreTransport | str | None = None,
+        compression: bool = True,
+        rate_limit: float | RateLimiter | None = None,
+        decision_cache_size: int = 0,
+        single_flight: bool = True,
+        stats_cache_size: int = 0,
+        stats_cache_ttl: float = 300,
+        log_body_sample_rate: float = 1.0,
     ):
         """Constructor of the `JudilibreClient` class
 
@@ -63,8 +357,51 @@ class JudilibreClient:
             judilibre_api_url (_type_, optional): JUDLIBRE API URL.
                 If `None`, `pyjudilibre` will try to use the `JUDILIBRE_API_URL` environment variable.
                 Defaults to None.
+            judilibre_api_headers (dict | None, optional): additional headers sent with every request.
+                Defaults to None.
             logging_level (int, optional): Level of logs that you want to get from `JudilibreClient`.
                 Defaults to logging.INFO.
+            max_retries (int, optional): Number of times a request is retried after a timeout, a connection error
+                or a 429, 500, 502, 503 or 504 response.
+                Defaults to 0.
+            retry_backoff (float, optional): Number of seconds to wait before the first retry.
+                The delay doubles at each retry, unless the API sends a `Retry-After` header.
+                Defaults to 0.5.
+            hooks (dict[str, list[JudilibreHook]] | None, optional): callbacks to register, by event name
+                (see `add_hook`).
+                Defaults to None.
+            log_body_max_bytes (int | None, optional): Maximal number of bytes of the response bodies written
+                in the logs at the `logging.DEBUG` level. If `None`, the whole bodies are logged.
+                Defaults to 2_048.
+            transport (JudilibreTransport | str | None, optional): Transport used to send the requests to the API
+                (see `pyjudilibre.transports`), or the name of a built-in one ("urllib", "pooled" or "httpx")
+                built with `http_proxy` and `https_proxy`. If `None`, requests are sent with `urllib`.
+                Defaults to None.
+            compression (bool, optional): Asks the API for compressed responses (gzip, and br or zstd when
+                `brotli` or `zstandard` is installed), which are decompressed on the fly.
+                Defaults to True.
+            rate_limit (float | RateLimiter | None, optional): Maximal number of requests per second, or a
+                `RateLimiter` (which can be shared by several clients). Retries count as requests.
+                If `None`, requests are not limited.
+                Defaults to None.
+            decision_cache_size (int, optional): Number of decisions kept in memory by `decision` and `decisions`,
+                which are then served without a request (each caller gets its own copy). If 0, decisions are not
+                cached.
+                Defaults to 0.
+            single_flight (bool, optional): Sends a single request for identical GET requests made at the same
+                time by several threads, which all get a copy of its response.
+                Defaults to True.
+            stats_cache_size (int, optional): Number of responses kept in memory by `stats` and `stats_many`, for
+                `stats_cache_ttl` seconds. If 0, statistics are not cached.
+                Defaults to 0.
+            stats_cache_ttl (float, optional): Number of seconds during which a cached response of `stats` is used.
+                Defaults to 300.
+            log_body_sample_rate (float, optional): Share (between 0 and 1) of the responses whose body is
+                written in the logs at the `logging.DEBUG` level, drawn at random.
+                Defaults to 1.0.
+
+        Raises:
+            JudilibreValueError: if `log_body_sample_rate` is not between 0 and 1
         """
         # HTTP CLIENT
         judilibre_api_url = judilibre_api_url or os.environ["JUDILIBRE_API_URL"]
@@ -72,43 +409,123 @@ class JudilibreClient:
 
         self.judilibre_api_url = judilibre_api_url
         self.judilibre_api_key = judilibre_api_key
-        self.judilibre_api_headers = judilibre_api_headers
-
-        proxies = {
-            **({"http": http_proxy} if http_proxy else {}),
-            **({"https": https_proxy} if https_proxy else {}),
-        }
-        self.proxy_handler = urllib.request.ProxyHandler(proxies=proxies)
-        self.url_opener = urllib.request.build_opener(self.proxy_handler)
+        self.judilibre_api_headers = dict(judilibre_api_headers or {})
+
+        if transport is None or isinstance(transport, str):
+            transport = build_transport(transport or "urllib", http_proxy=http_proxy, https_proxy=https_proxy)
+        self.transport: JudilibreTransport = transport
+        self.compression = compression
+        if isinstance(rate_limit, (int, float)):
+            rate_limit = RateLimiter(rate_limit)
+        self.rate_limiter: RateLimiter | None = rate_limit
+        self.decision_cache = LRUCache(decision_cache_size)
+        self.stats_cache = LRUCache(stats_cache_size, ttl=stats_cache_ttl)
+        # the threads sharing a response get their own copy of its data (the event is not modified)
+        self.single_flight: SingleFlight | None = (
+            SingleFlight(copy=lambda response: (copy.deepcopy(response[0]), response[1])) if single_flight else None
+        )
         self.default_timeout = default_timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
 
         self.__version__ = __version__
 
         self.client_headers = {
-            **judilibre_api_headers,
+            **self.judilibre_api_headers,
             "KeyId": self.judilibre_api_key,
             "User-Agent": f"pyJudilibre {self.__version__}",
         }
 
         # LOGGING
         self._logger = logging.getLogger("judilibre-client")
-        if len(self._logger.handlers) == 0:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-            handler.setFormatter(formatter)
-            self._logger.addHandler(handler)
-        self._logger.setLevel(level=logging_level)
+        with _LOGGER_LOCK:
+            if len(self._logger.handlers) == 0:
+                handler = logging.StreamHandler()
+                formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+                handler.setFormatter(formatter)
+                self._logger.addHandler(handler)
+            self._logger.setLevel(level=logging_level)
+        self.log_body_max_bytes = log_body_max_bytes
+        if not 0 <= log_body_sample_rate <= 1:
+            raise JudilibreValueError(f"log_body_sample_rate ({log_body_sample_rate}) must be between 0 and 1")
+        self.log_body_sample_rate = log_body_sample_rate
+
+        # HOOKS
+        # the lists of callbacks are replaced rather than modified, so that `_emit` can iterate through them
+        # while other threads add or remove hooks
+        self._hooks: dict[str, list[JudilibreHook]] = {name: [] for name in HOOK_NAMES}
+        self._hooks_lock = threading.Lock()
+        for name, callbacks in (hooks or {}).items():
+            for callback in callbacks:
+                self.add_hook(name, callback)
+
+    def close(self):
+        """Releases the resources (connections, ...) of the transport"""
+        self.transport.close()
+
+    def __enter__(self) -> JudilibreClient:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def add_hook(
+        self,
+        event: str,
+        callback: JudilibreHook,
+    ):
+        """Registers a callback called with a `JudilibreRequestEvent` at each step of the requests
+
+        Args:
+            event (str): name of the event: `before_request`, `after_response`, `on_error` or `on_retry`
+            callback (JudilibreHook): function taking a `JudilibreRequestEvent` as only argument
+
+        Raises:
+            JudilibreValueError: raised if the event name is unknown
+        """
+        if event not in self._hooks:
+            raise JudilibreValueError(f"Unknown hook {event}, expected one of {', '.join(HOOK_NAMES)}")
+        with self._hooks_lock:
+            self._hooks[event] = [*self._hooks[event], callback]
+
+    def remove_hook(
+        self,
+        event: str,
+        callback: JudilibreHook,
+    ):
+        """Removes a callback registered with `add_hook`
+
+        Args:
+            event (str): name of the event
+            callback (JudilibreHook): callback to remove
+        """
+        with self._hooks_lock:
+            if event in self._hooks and callback in self._hooks[event]:
+                self._hooks[event] = [c for c in self._hooks[event] if c != callback]
+
+    def _emit(
+        self,
+        event: str,
+        request_event: JudilibreRequestEvent,
+    ):
+        for callback in self._hooks[event]:
+            callback(request_event)
 
     # @catch_wrong_url_error
     def _query(
         self,
         url: str,
         method: str = "GET",
-        query_parameters: dict = {},
+        query_parameters: dict | None = None,
         timeout: int | None = None,
+        on_response: JudilibreHook | None = None,
+        progress: JudilibreProgress | None = None,
     ) -> dict:
         """Internal method to query the **JUDILIBRE** API constistently trhoughout methods.
 
+        Concurrent identical GET requests share a single request (see `single_flight`), and each one gets its own
+        copy of the response: the hooks are only called for the request actually sent.
+
         Args:
             url (str): URL endpoint to query (for example "/search", "/export")
             method (str, optional): HTTP method to use for the query.
@@ -116,47 +533,371 @@ class JudilibreClient:
             query_parameters (dict | None, optional): query string parameters.
                 Defaults to None.
             timeout (int): Number of seconds before timeout.                Defaults to 5.
+            on_response (JudilibreHook | None, optional): callback called with the event of the successful attempt,
+                before the `after_response` hooks.
+                Defaults to None.
+            progress (JudilibreProgress | None, optional): progress of the operation sending the request, in which
+                the request, its retries and its rate limiter waits are recorded.
+                Defaults to None.
 
         Returns:
             Response: Raw response from the JUDLIBRE API.
+
+        Raises:
+            Exception: the exception of `ERROR_CODES_TO_EXCEPTIONS` matching the status code of the response
+                (`JudilibreHTTPError` for other error status codes), once all the retries are exhausted.
         """
 
+        url, endpoint = self._url(method, url, query_parameters)
+        timeout = timeout or self.default_timeout
+
+        shared = False
+        if method == "GET" and self.single_flight is not None:
+            (data, event), shared = self.single_flight.do(
+                self._flight_key(method, url),
+                lambda: self._send_query(method, url, endpoint, timeout, progress),
+            )
+        else:
+            data, event = self._send_query(method, url, endpoint, timeout, progress)
+
+        if progress is not None:
+            progress.record(event.wire_bytes)
+        if on_response is not None:
+            on_response(event)
+        if not shared:
+            self._emit("after_response", event)
+        return data
+
+    def _send_query(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        timeout: int,
+        progress: JudilibreProgress | None = None,
+    ) -> tuple[dict, JudilibreRequestEvent]:
+        """Sends a request (retrying it if needed) and returns the decoded response and the event of the
+        successful attempt"""
+        headers = self._headers()
+        attempt = 0
+
+        while True:
+            event = JudilibreRequestEvent(method=method, endpoint=endpoint, url=url, attempt=attempt)
+            self._emit("before_request", event)
+            self._throttle(event, progress)
+
+            start = time.perf_counter()
+            retry_after = None
+            try:
+                with self.transport.send(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    timeout=timeout,
+                ) as response:
+                    event.status = response.status
+                    retry_after = response.headers.get("retry-after")
+                    content = self._read_body(response, event)
+                    event.network_time = time.perf_counter() - start
+
+                    self._logger.info("RESPONSE STATUS : %s", response.status)
+                    self._logger.info("RESPONSE HEADERS: %s", response.headers)
+                    if self._logger.isEnabledFor(logging.DEBUG) and self._sample_body():
+                        self._logger.debug("RESPONSE CONTENT: %s", self._truncate_body(content))
+
+                self._raise_for_status(method, url, response.status, content, response.headers)
+
+                start = time.perf_counter()
+                data = json.loads(content)
+                event.decode_time = time.perf_counter() - start
+
+            except Exception as exc:
+                if not event.network_time:
+                    event.network_time = time.perf_counter() - start
+                self._handle_error(event, exc, retry_after, progress)
+                attempt += 1
+                continue
+
+            return data, event
+
+    @staticmethod
+    def _flight_key(method: str, url: str) -> tuple:
+        """Identifies the requests that can share a response: same method, endpoint and parameters in any order"""
+        parts = urllib.parse.urlsplit(url)
+        return method, parts.path, tuple(sorted(urllib.parse.parse_qsl(parts.query, keep_blank_values=True)))
+
+    def _query_stream(
+        self,
+        url: str,
+        method: str = "GET",
+        query_parameters: dict | None = None,
+        timeout: int | None = None,
+        array_key: str = "results",
+        on_response: JudilibreHook | None = None,
+        progress: JudilibreProgress | None = None,
+    ) -> Generator[Any, None, dict]:
+        """Same as `_query`, but yields the items of the `array_key` array of the response as soon as they are
+        parsed from the network, and returns the other fields of the response.
+
+        Failed requests are retried as in `_query` until the body starts being read; errors raised while the body
+        is streamed are not retried.
+
+        Args:
+            url (str): URL endpoint to query (for example "/scan")
+            method (str, optional): HTTP method to use for the query.
+                Defaults to "GET".
+            query_parameters (dict | None, optional): query string parameters.
+                Defaults to None.
+            timeout (int): Number of seconds before timeout.
+                Defaults to 5.
+            array_key (str, optional): key of the array to stream.
+                Defaults to "results".
+            on_response (JudilibreHook | None, optional): callback called with the event of the request once the
+                whole body has been read, before the `after_response` hooks.
+                Defaults to None.
+            progress (JudilibreProgress | None, optional): progress of the operation sending the request.
+                Defaults to None.
+
+        Returns:
+            dict: the fields of the response other than `array_key` (once all the items have been yielded)
+        """
+        url, endpoint = self._url(method, url, query_parameters)
+        headers = self._headers()
+        attempt = 0
+
+        while True:
+            event = JudilibreRequestEvent(method=method, endpoint=endpoint, url=url, attempt=attempt)
+            self._emit("before_request", event)
+            self._throttle(event, progress)
+
+            start = time.perf_counter()
+            retry_after = None
+            try:
+                response = self.transport.send(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    timeout=timeout or self.default_timeout,
+                )
+                event.status = response.status
+                retry_after = response.headers.get("retry-after")
+                self._logger.info("RESPONSE STATUS : %s", response.status)
+                self._logger.info("RESPONSE HEADERS: %s", response.headers)
+                if response.status >= 400:
+                    with response:
+                        content = self._read_body(response, event)
+                    self._raise_for_status(method, url, response.status, content, response.headers)
+            except Exception as exc:
+                event.network_time = time.perf_counter() - start
+                self._handle_error(event, exc, retry_after, progress)
+                attempt += 1
+                continue
+            break
+
+        event.network_time = time.perf_counter() - start
+        parser = JsonStreamParser(array_key)
+        try:
+            with response:
+                decoder = ContentDecoder(response.headers.get("content-encoding"))
+                while True:
+                    start = time.perf_counter()
+                    chunk = response.read(READ_CHUNK_SIZE)
+                    data = decoder.decompress(chunk) if chunk else decoder.flush()
+                    event.network_time += time.perf_counter() - start
+                    event.wire_bytes += len(chunk)
+                    event.response_bytes += len(data)
+
+                    start = time.perf_counter()
+                    items = parser.feed(data) if chunk else parser.close()
+                    event.decode_time += time.perf_counter() - start
+
+                    yield from items
+                    if not chunk:
+                        break
+        except Exception as exc:
+            event.error = exc
+            self._emit("on_error", event)
+            raise
+
+        if progress is not None:
+            progress.record(event.wire_bytes)
+        if on_response is not None:
+            on_response(event)
+        self._emit("after_response", event)
+        return parser.fields
+
+    def _url(
+        self,
+        method: str,
+        url: str,
+        query_parameters: dict | None,
+    ) -> tuple[str, str]:
+        """Returns the full URL of a query and the name of its endpoint"""
         query_string = urllib.parse.urlencode(
-            self._clean_query_parameters(query_parameters.copy()),
+            self._clean_query_parameters(query_parameters),
             doseq=True,
         )
-        url = f"{self.judilibre_api_url.rstrip('/')}/{url.lstrip('/')}?{query_string}".rstrip("?")
+        full_url = f"{self.judilibre_api_url.rstrip('/')}/{url.lstrip('/')}?{query_string}".rstrip("?")
 
-        self._logger.info(f"REQUEST METHOD URL: {method} {url}")
-        self._logger.info(f"REQUEST PARAMETERS: {query_string}")
+        self._logger.info("REQUEST METHOD URL: %s %s", method, full_url)
+        self._logger.info("REQUEST PARAMETERS: %s", query_string)
 
-        request = urllib.request.Request(
-            method=method,
-            url=url,
-        )
-        for key, value in self.client_headers.items():
-            request.add_header(key, value)
+        return full_url, "/" + url.strip("/")
 
-        try:
-            with self.url_opener.open(request, timeout=timeout or self.default_timeout) as response:
-                content = response.read()
+    def _throttle(
+        self,
+        event: JudilibreRequestEvent,
+        progress: JudilibreProgress | None = None,
+    ):
+        """Waits for the rate limiter, if any, before sending a request"""
+        if self.rate_limiter is not None:
+            event.throttle_time = self.rate_limiter.acquire()
+            if progress is not None and event.throttle_time:
+                progress.record_throttle(event.throttle_time)
+
+    def _headers(self) -> dict[str, str]:
+        """Returns the headers of the API queries"""
+        if self.compression:
+            return {**self.client_headers, "Accept-Encoding": accept_encoding()}
+        return self.client_headers
+
+    def _raise_for_status(
+        self,
+        method: str,
+        url: str,
+        status: int,
+        content: bytes,
+        headers: dict[str, str] | None = None,
+    ):
+        """Raises the exception matching an error status code"""
+        if status >= 400:
+            message = f"{method} {url} returned {status}: {self._truncate_body(content)}"
+            exception_class = ERROR_CODES_TO_EXCEPTIONS.get(status)
+            if exception_class is None:
+                raise JudilibreHTTPError(message, url=url, code=status, headers=headers)
+            raise exception_class(message)
+
+    def _handle_error(
+        self,
+        event: JudilibreRequestEvent,
+        exc: Exception,
+        retry_after: str | None = None,
+        progress: JudilibreProgress | None = None,
+    ):
+        """Reports a failed attempt, then waits before the next one if it can be retried, else raises `exc`"""
+        event.error = exc
+        self._emit("on_error", event)
 
-                self._logger.info(f"RESPONSE STATUS : {response.status}")
-                self._logger.info(f"RESPONSE HEADERS: {response.headers}")
-                self._logger.debug(f"RESPONSE CONTENT: {content.decode('utf-8')}")
+        retryable = event.status in RETRY_STATUS_CODES or (event.status is None and isinstance(exc, OSError))
+        if not retryable or event.attempt >= self.max_retries:
+            raise exc
 
-                data = json.loads(content)
+        event.retry_delay = self._retry_delay(attempt=event.attempt, retry_after=retry_after)
+        self._emit("on_retry", event)
+        if progress is not None:
+            progress.record_retry()
+        self._logger.warning("RETRYING %s %s IN %ss AFTER %r", event.method, event.url, event.retry_delay, exc)
+        time.sleep(event.retry_delay)
 
-        except urllib.error.HTTPError as exc:
-            if exc.status in ERROR_CODES_TO_EXCEPTIONS:
-                exception = ERROR_CODES_TO_EXCEPTIONS[exc.status]
-                raise exception from exc
-            else:
-                raise exc
-        except Exception as exc:
-            raise exc
+    def _batch_sizer(
+        self,
+        batch_size: int | str | AdaptiveBatchSize,
+        timeout: int | None = None,
+    ) -> AdaptiveBatchSize | None:
+        """Returns the `AdaptiveBatchSize` to use for a `batch_size` argument, or `None` for a fixed batch size"""
+        if isinstance(batch_size, int):
+            return None
+        if batch_size == "auto":
+            batch_size = AdaptiveBatchSize()
+        if not isinstance(batch_size, AdaptiveBatchSize):
+            raise JudilibreValueError(
+                f"batch_size must be an integer, 'auto' or an AdaptiveBatchSize, not {batch_size}"
+            )
+        if batch_size.target_duration is None:
+            batch_size.target_duration = (timeout or self.default_timeout) / 2
+        return batch_size
 
-        return data
+    @staticmethod
+    def _progress_total(
+        response: dict,
+        max_results: int | None = None,
+        maximum: int | None = None,
+    ) -> int | None:
+        """Returns the number of results an operation is expected to return, from the `total` of a response"""
+        total = response.get("total")
+        if total is None:
+            return None
+        for limit in (max_results, maximum):
+            if limit is not None:
+                total = min(total, limit)
+        return total
+
+    @staticmethod
+    def _page_size(
+        page_size: int | str,
+        maximum: int,
+        max_results: int | None = None,
+    ) -> int:
+        """Returns the page size to use for a `page_size` argument of a paginator
+
+        `"auto"` is the largest page accepted by the endpoint, or `max_results` if it is smaller.
+        """
+        if isinstance(page_size, int):
+            return page_size
+        if page_size != "auto":
+            raise JudilibreValueError(f"page_size must be an integer or 'auto', not {page_size}")
+        if max_results is not None and max_results > 0:
+            return min(maximum, max_results)
+        return maximum
+
+    @staticmethod
+    def _read_body(
+        response: JudilibreTransportResponse,
+        event: JudilibreRequestEvent,
+    ) -> bytes:
+        """Reads and decompresses the body of a response, counting the bytes received and decoded in `event`"""
+        decoder = ContentDecoder(response.headers.get("content-encoding"))
+        if decoder.identity:
+            content = response.read()
+            event.wire_bytes = len(content)
+        else:
+            chunks = []
+            while chunk := response.read(READ_CHUNK_SIZE):
+                event.wire_bytes += len(chunk)
+                chunks.append(decoder.decompress(chunk))
+            chunks.append(decoder.flush())
+            content = b"".join(chunks)
+        event.response_bytes = len(content)
+        return content
+
+    def _sample_body(self) -> bool:
+        """Draws whether the body of a response is written in the logs, according to `log_body_sample_rate`"""
+        return self.log_body_sample_rate >= 1 or random.random() < self.log_body_sample_rate
+
+    def _truncate_body(
+        self,
+        content: bytes,
+    ) -> str:
+        """Decodes (at most `log_body_max_bytes` of) a response body to write it in the logs"""
+        if self.log_body_max_bytes is None or len(content) <= self.log_body_max_bytes:
+            return content.decode("utf-8", errors="replace")
+        return (
+            content[: self.log_body_max_bytes].decode("utf-8", errors="replace")
+            + f"... [{len(content) - self.log_body_max_bytes} more bytes]"
+        )
+
+    def _retry_delay(
+        self,
+        attempt: int,
+        retry_after: str | None = None,
+    ) -> float:
+        """Number of seconds to wait before retrying a failed attempt"""
+        if retry_after is not None:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+        return self.retry_backoff * 2**attempt
 
     def healthcheck(
         self,
@@ -195,6 +936,21 @@ class JudilibreClient:
         Returns:
             judilibre_decision (JudilibreDecision): a decision from **JUDILIBRE**
         """
+        return self._decision(decision_id, timeout=timeout)
+
+    def _decision(
+        self,
+        decision_id: str,
+        timeout: int | None = None,
+        progress: JudilibreProgress | None = None,
+    ) -> JudilibreDecision:
+        """Retrieves a decision from the decision cache or **JUDILIBRE**, recording the request in `progress`"""
+        from pyjudilibre.models import JudilibreDecision
+
+        decision = self.decision_cache.get(decision_id)
+        if decision is not None:
+            return decision.model_copy(deep=True)
+
         query_parameters = {
             "id": decision_id,
             "resolve_references": True,
@@ -205,11 +961,157 @@ class JudilibreClient:
                 url="/decision",
                 query_parameters=query_parameters,
                 timeout=timeout or self.default_timeout,
+                progress=progress,
             )
         except JudilibreResourceNotFoundError as exc:
             raise JudilibreDecisionNotFoundError(f"decision with ID {decision_id} not Found") from exc
 
-        return JudilibreDecision(**response)
+        decision = JudilibreDecision(**response)
+        if self.decision_cache.maxsize > 0:
+            self.decision_cache.put(decision_id, decision.model_copy(deep=True))
+        return decision
+
+    def decisions(
+        self,
+        decision_ids: Iterable[str],
+        *,
+        max_workers: int = 8,
+        ordered: bool = False,
+        progress_callback: ProgressCallback | None = None,
+        timeout: int | None = None,
+    ) -> Iterator[tuple[str, JudilibreDecision | Exception]]:
+        """Retrieves decisions from **JUDILIBRE** concurrently, based on their IDs
+
+        Each decision is fetched with `decision` (and therefore goes through the rate limiter, the retries and
+        the decision cache of the client). At most `2 * max_workers` requests are in flight at once, so that
+        `decision_ids` can be a long or lazy iterable. A transport keeping its connections alive
+        (`transport="pooled"`) spares a connection setup per decision.
+
+        Args:
+            decision_ids (Iterable[str]): IDs of the decisions on **JUDILIBRE**
+            max_workers (int, optional): number of decisions fetched concurrently.
+                Defaults to 8.
+            ordered (bool, optional): yields the decisions in the order of `decision_ids` rather than
+                as soon as they are fetched.
+                Defaults to False.
+            progress_callback (ProgressCallback | None, optional): function called with a `JudilibreProgress`
+                after each decision (see `pyjudilibre.progress`). The total is known if `decision_ids` has a length.
+                Defaults to None.
+            timeout (int): Number of seconds before timeout.
+                Defaults to 5.
+
+        Yields:
+            tuple[str, JudilibreDecision | Exception]: the ID and the decision, or the exception raised while
+                fetching it (`JudilibreDecisionNotFoundError` if the decision does not exist)
+        """
+
+        progress = JudilibreProgress(
+            operation="decisions",
+            total=_known_length(decision_ids),
+            callback=progress_callback,
+        )
+
+        def fetch(decision_id: str) -> tuple[str, JudilibreDecision | Exception]:
+            try:
+                return decision_id, self._decision(decision_id, timeout=timeout, progress=progress)
+            except Exception as exc:
+                return decision_id, exc
+
+        return _track_progress(
+            _map_concurrently(fetch, decision_ids, max_workers=max_workers, ordered=ordered),
+            progress,
+        )
+
+    def hydrate(
+        self,
+        results: Iterable[JudilibreSearchResult],
+        *,
+        fields: list[str] | None = None,
+        zones: list[str] | None = None,
+        max_workers: int = 8,
+        ordered: bool = True,
+        prefetch: int = 2 * SEARCH_MAX_PAGE_SIZE,
+        progress_callback: ProgressCallback | None = None,
+        timeout: int | None = None,
+    ) -> Iterator[tuple[JudilibreSearchResult, JudilibreDecision | dict | Exception]]:
+        """Enriches search results with their full decision, fetched concurrently
+
+        `results` (`iter_search(...)` for example) is read in a background thread, up to `prefetch` results
+        ahead, so that the next pages of a search are requested while the decisions of the current one
+        are fetched. Decisions are fetched with `decisions` (see its documentation for the errors).
+
+        ```python
+        for result, decision in client.hydrate(client.iter_search("contrat"), zones=["motivations"]):
+            ...
+        ```
+
+        Args:
+            results (Iterable[JudilibreSearchResult]): search results to enrich
+            fields (list[str] | None, optional): attributes of `JudilibreDecision` to keep ("text", "visa", ...).
+                Defaults to None.
+            zones (list[str] | None, optional): zones of the `Zoning` of the decision to keep, as texts
+                ("introduction", "expose_du_litige", "moyens", "motivations", "dispositif" or "moyens_annexes").
+                If `fields` or `zones` is given, each result is paired with a dictionary of the selected fields
+                and zones instead of the whole decision.
+                Defaults to None.
+            max_workers (int, optional): number of decisions fetched concurrently.
+                Defaults to 8.
+            ordered (bool, optional): yields the results in the order of `results` rather than as soon as
+                their decision is fetched.
+                Defaults to True.
+            prefetch (int, optional): number of search results read ahead from `results`.
+                Defaults to 100.
+            progress_callback (ProgressCallback | None, optional): function called with a `JudilibreProgress`
+                after each result (see `pyjudilibre.progress`). The total is known if `results` has a length.
+                Defaults to None.
+            timeout (int): Number of seconds before timeout.
+                Defaults to 5.
+
+        Raises:
+            JudilibreValueError: raised if a field or a zone is unknown
+
+        Yields:
+            tuple[JudilibreSearchResult, JudilibreDecision | dict | Exception]: the search result and its decision
+                (or its selected fields and zones), or the exception raised while fetching the decision
+        """
+        from pyjudilibre.models import JudilibreDecision
+
+        unknown = [f for f in fields or [] if f not in JudilibreDecision.model_fields] + [
+            z for z in zones or [] if z not in ZONING_ZONES
+        ]
+        if unknown:
+            raise JudilibreValueError(f"Unknown decision fields or zones: {', '.join(unknown)}")
+
+        progress = JudilibreProgress(
+            operation="hydrate",
+            unit="results",
+            total=_known_length(results),
+            callback=progress_callback,
+        )
+
+        def enrich(result: JudilibreSearchResult) -> tuple[JudilibreSearchResult, JudilibreDecision | dict | Exception]:
+            try:
+                decision = self._decision(result.id, timeout=timeout, progress=progress)
+            except Exception as exc:
+                return result, exc
+            if fields is None and zones is None:
+                return result, decision
+
+            selected = {f: getattr(decision, f) for f in fields or []}
+            if zones:
+                zoning = decision.zoning
+                for name in zones:
+                    zone = getattr(zoning, name)
+                    if isinstance(zone, list):
+                        selected[name] = [z.text for z in zone]
+                    else:
+                        selected[name] = zone.text if zone is not None else None
+            return result, selected
+
+        return _track_progress(
+            _map_concurrently(enrich, _prefetch(results, prefetch), max_workers=max_workers, ordered=ordered),
+            progress,
+        )
 
     def stats(
         self,
@@ -251,6 +1153,22 @@ class JudilibreClient:
         Returns:
             JudilibreStats: A set of statistics correponding to the given aggregation keys and filters
         """
+        from pyjudilibre.models import JudilibreStats
+
+        cache_key = _stats_cache_key(
+            keys=keys,
+            locations=locations,
+            jurisdictions=jurisdictions,
+            date_start=date_start,
+            date_end=date_end,
+            date_type=date_type,
+            selection=selection,
+        )
+        # the cache keeps its own copy of the statistics, and each caller gets its own copy
+        stats = self.stats_cache.get(cache_key)
+        if stats is not None:
+            return stats.model_copy(deep=True)
+
         query_parameters = {
             **({"keys": keys} if keys is not None else {}),
             **({"date_start": date_start} if date_start is not None else {}),
@@ -266,7 +1184,61 @@ class JudilibreClient:
             query_parameters=query_parameters,
             timeout=timeout or self.default_timeout,
         )
-        return JudilibreStats(**response)
+        stats = JudilibreStats(**response)
+        if self.stats_cache.maxsize > 0:
+            self.stats_cache.put(cache_key, stats.model_copy(deep=True))
+        return stats
+
+    def stats_many(
+        self,
+        queries: Iterable[dict[str, Any]],
+        *,
+        max_workers: int = 8,
+        timeout: int | None = None,
+    ) -> list[JudilibreStats]:
+        """Returns the statistics of several queries, requested concurrently
+
+        Each query is a dictionary of arguments of `stats` (`keys`, `locations`, `jurisdictions`, `date_start`,
+        `date_end`, `date_type` and `selection`). Equivalent queries (with enum members or their codes, dates or
+        their ISO strings, and filters in any order) are only requested once, and not at all if their statistics are in the stats
+        cache of the client (see `stats_cache_size`).
+
+        Args:
+            queries (Iterable[dict[str, Any]]): arguments of `stats` of each query
+            max_workers (int, optional): number of queries requested concurrently.
+                Defaults to 8.
+            timeout (int): Number of seconds before timeout.
+                Defaults to 5.
+
+        Raises:
+            JudilibreValueError: if a query has an argument that `stats` does not take
+
+        Returns:
+            list[JudilibreStats]: the statistics of the queries, in the order of `queries`
+        """
+        queries = list(queries)
+        for query in queries:
+            unknown = sorted(set(query) - set(STATS_QUERY_PARAMETERS))
+            if unknown:
+                raise JudilibreValueError(f"Unknown arguments of stats: {', '.join(unknown)}")
+
+        cache_keys = [_stats_cache_key(**query) for query in queries]
+        distinct = dict(zip(cache_keys, queries))
+        stats = _map_concurrently(
+            lambda query: self.stats(**query, timeout=timeout),
+            distinct.values(),
+            max_workers=max_workers,
+            ordered=True,
+        )
+        results = dict(zip(distinct, stats))
+        # the duplicates of a query get their own copy of its statistics
+        returned: set[tuple] = set()
+        many = []
+        for cache_key in cache_keys:
+            result = results[cache_key]
+            many.append(result.model_copy(deep=True) if cache_key in returned else result)
+            returned.add(cache_key)
+        return many
 
     def export(
         self,
@@ -312,6 +1284,8 @@ class JudilibreClient:
         Returns:
             tuple[int, list[JudilibreDecision]]: a tuple containing the total number of decisions and the decisions corresponding to the current batch
         """
+        from pyjudilibre.models import JudilibreDecision, JudilibreShortDecision
+
         query_parameters = {}
 
         query_parameters = {
@@ -326,7 +1300,6 @@ class JudilibreClient:
             "batch_size": batch_size,
             **kwargs,
         }
-        print(query_parameters)
 
         response = self._query(
             method="GET",
@@ -336,10 +1309,8 @@ class JudilibreClient:
         )
 
         if query_parameters.get("abridged") is True:
-            print("ABRIDGED")
             decisions = [JudilibreShortDecision(**d) for d in response["results"]]
         else:
-            print("NOT ABRIDGED", query_parameters.get("abridged"), type(query_parameters.get("abridged")))
             decisions = [JudilibreDecision(**d) for d in response["results"]]
 
         return (
@@ -394,6 +1365,8 @@ class JudilibreClient:
         Returns:
             tuple[int, list[JudilibreSearchResult]]: a tuple containing the total number of search results and the list of results corresponding to the current page
         """
+        from pyjudilibre.models import JudilibreSearchResult
+
         query_parameters = {
             **({"particularInterest": "true"} if selection else {}),
             **({"location": locations} if locations else {}),
@@ -469,6 +1442,8 @@ class JudilibreClient:
                 - the decisions corresponding to the current batch
                 - the id to provide for the next batch
         """
+        from pyjudilibre.models import JudilibreDecision, JudilibreShortDecision
+
         query_parameters = {
             **({"particularInterest": "true"} if selection else {}),
             **({"location": locations} if locations else {}),
@@ -502,13 +1477,278 @@ class JudilibreClient:
             search_after,
         )
 
+    def iter_scan(
+        self,
+        batch_size: int | str | AdaptiveBatchSize = 100,
+        *,
+        jurisdictions: list[JurisdictionEnum] | None = None,
+        locations: list[LocationCAEnum | LocationTJEnum | LocationTCOMEnum] | None = None,
+        selection: bool | None = None,
+        date_start: datetime.date | None = None,
+        date_end: datetime.date | None = None,
+        date_type: JudilibreDateTypeEnum | None = JudilibreDateTypeEnum.creation,
+        search_after: str | None = None,
+        max_results: int | None = None,
+        max_workers: int = 1,
+        progress_callback: ProgressCallback | None = None,
+        timeout: int | None = None,
+        **kwargs,
+    ) -> Iterator[JudilibreDecision | JudilibreShortDecision]:
+        """Iterates through the results of a metadata query, batch after batch
+
+        Each decision is yielded as soon as it has been parsed from the network: the first decisions of a batch
+        are available before the batch has been fully received, and only one decision at a time is kept in memory.
+
+        A query on many `locations` is a single chain of batches. With `max_workers > 1`, the locations are split
+        into `max_workers` groups of similar sizes (according to a `/stats` request), scanned in parallel; the
+        decisions of the groups are then yielded as they come, in no particular order.
+
+        Args:
+            batch_size (int | str | AdaptiveBatchSize, optional): Size of the batches to get (at most 1 000),
+                or "auto" (or an `AdaptiveBatchSize`) to tune it from the duration of the previous batches
+                (see `pyjudilibre.batching`).
+                Defaults to 100.
+            jurisdictions (list[JurisdictionEnum] | None, optional): list of jurisdictions to return results from.
+                If `None`, it will default to **JUDILIBRE** default settings.
+                Defaults to None.
+            locations (list[LocationCAEnum  |  LocationTJEnum  |  LocationTCOMEnum] | None, optional): list of locations (courts) to return results from.
+                If `None`, it will default to **JUDILIBRE** default settings.
+                Defaults to None.
+            selection (bool | None, optional): Returns only results about decisions with a particular interest if true.
+                If False, returns all the results
+                Defaults to None.
+            date_start (datetime.date | None, optional): minimal date to return results from.
+                If `None` returns all the results.
+                Defaults to None.
+            date_end (datetime.date | None, optional): maximal date to return results from.
+                If `None` returns all the results.
+                Defaults to None.
+            date_type (JudilibreDateTypeEnum | None, optional): type of date to use for the date filters.
+                If `None`, it will default to **JUDILIBRE** default settings.
+                Defaults to JudilibreDateTypeEnum.creation.
+            search_after (str, optional): ID of the decision that will start the first batch.
+                Defaults to None.
+            max_results (int | None, optional): maximal number of results that should be returned.
+                If `None` all results are returned.
+                Defaults to None.
+            max_workers (int, optional): number of groups of locations scanned in parallel, if several `locations`
+                are given. Cannot be combined with `search_after`.
+                Defaults to 1.
+            progress_callback (ProgressCallback | None, optional): function called with a `JudilibreProgress`
+                after each batch (see `pyjudilibre.progress`). The total is the one of the first batch (or of the
+                `/stats` request, with `max_workers > 1`, in which case it is called from the scanning threads).
+                Defaults to None.
+            timeout (int): Number of seconds before timeout.
+                Defaults to 5.
+
+        Yields:
+            JudilibreDecision | JudilibreShortDecision: the decisions corresponding to the query
+        """
+        from pyjudilibre.models import JudilibreDecision, JudilibreShortDecision
+
+        if max_workers > 1 and locations is not None and len(locations) > 1:
+            yield from self._fan_out_scan(
+                batch_size,
+                jurisdictions=jurisdictions,
+                locations=locations,
+                selection=selection,
+                date_start=date_start,
+                date_end=date_end,
+                date_type=date_type,
+                search_after=search_after,
+                max_results=max_results,
+                max_workers=max_workers,
+                progress_callback=progress_callback,
+                timeout=timeout,
+                **kwargs,
+            )
+            return
+
+        model = JudilibreShortDecision if kwargs.get("abridged") is True else JudilibreDecision
+        batch_sizer = self._batch_sizer(batch_size, timeout)
+        n_decisions = 0
+        progress = JudilibreProgress(operation="scan", callback=progress_callback)
+
+        while max_results is None or n_decisions < max_results:
+            size = batch_sizer.size() if batch_sizer is not None else cast(int, batch_size)
+            query_parameters = {
+                **({"particularInterest": "true"} if selection else {}),
+                **({"location": locations} if locations else {}),
+                **({"jurisdiction": jurisdictions} if jurisdictions else {}),
+                **({"date_start": date_start} if date_start else {}),
+                **({"date_end": date_end} if date_end else {}),
+                **({"date_type": date_type} if date_type else {}),
+                **({"searchAfter": search_after} if search_after else {}),
+                "resolve_references": True,
+                "batch_size": size,
+                **kwargs,
+            }
+
+            events: list[JudilibreRequestEvent] = []
+            stream = self._query_stream(
+                method="GET",
+                url="/scan",
+                query_parameters=query_parameters,
+                timeout=timeout or self.default_timeout,
+                on_response=events.append,
+                progress=progress,
+            )
+            n_batch_decisions = 0
+            start = time.perf_counter()
+            try:
+                while True:
+                    try:
+                        result = next(stream)
+                    except StopIteration as stop:
+                        fields = stop.value
+                        break
+                    except TimeoutError:
+                        # a batch that timed out before its first decision is retried with a smaller size
+                        if (
+                            batch_sizer is None
+                            or n_batch_decisions > 0
+                            or not batch_sizer.record_timeout(size, time.perf_counter() - start)
+                        ):
+                            raise
+                        fields = None
+                        break
+
+                    yield model(**result)
+                    n_batch_decisions += 1
+                    n_decisions += 1
+                    if max_results is not None and n_decisions >= max_results:
+                        progress.update(n_decisions, finished=True)
+                        return
+            finally:
+                stream.close()
+
+            if fields is None:
+                continue
+            if batch_sizer is not None:
+                batch_sizer.record(n_batch_decisions, events[-1].network_time, events[-1].response_bytes)
+
+            search_after = parse_qs(fields["next_batch"] or "").get("searchAfter", [None])[0]
+            progress.update(n_decisions, self._progress_total(fields, max_results), finished=search_after is None)
+            if search_after is None:
+                return
+
+    def _date_windows(
+        self,
+        count: Callable[[datetime.date, datetime.date], int],
+        *,
+        jurisdictions: list[JurisdictionEnum] | None,
+        locations: list[LocationCAEnum | LocationTJEnum | LocationTCOMEnum] | None,
+        selection: bool | None,
+        date_start: datetime.date | None,
+        date_end: datetime.date | None,
+        date_type: JudilibreDateTypeEnum | None,
+        timeout: int | None = None,
+    ) -> list[tuple[datetime.date, datetime.date, int]]:
+        """Splits the dates of a query into windows of at most `MAX_RESULT_WINDOW` results (see `_bisect_dates`)
+
+        Missing dates are replaced by the dates of the first and last decisions, given by `/stats`.
+        """
+        if date_start is None or date_end is None:
+            stats = self.stats(jurisdictions=jurisdictions, locations=locations, selection=selection, timeout=timeout)
+            first, last = stats.results.min_decision_date, stats.results.max_decision_date
+            if first is None or last is None:
+                return []
+            if JudilibreMultiValueEnum.replace_enum(date_type) == "update":
+                last = datetime.date.today()
+            date_start, date_end = date_start or first, date_end or last
+        if date_start > date_end:
+            return []
+
+        windows = _bisect_dates(count, date_start, date_end, count(date_start, date_end), MAX_RESULT_WINDOW)
+        for start, _, total in windows:
+            if total > MAX_RESULT_WINDOW:
+                self._logger.warning(
+                    "%s results on %s: only the first %s can be fetched", total, start, MAX_RESULT_WINDOW
+                )
+        return windows
+
+    def _fan_out_scan(
+        self,
+        batch_size: int | str | AdaptiveBatchSize,
+        *,
+        jurisdictions: list[JurisdictionEnum] | None,
+        locations: list[LocationCAEnum | LocationTJEnum | LocationTCOMEnum],
+        selection: bool | None,
+        date_start: datetime.date | None,
+        date_end: datetime.date | None,
+        date_type: JudilibreDateTypeEnum | None,
+        max_workers: int,
+        search_after: str | None = None,
+        max_results: int | None = None,
+        progress_callback: ProgressCallback | None = None,
+        timeout: int | None = None,
+        **kwargs,
+    ) -> Iterator[JudilibreDecision | JudilibreShortDecision]:
+        """Scans groups of `locations` of similar sizes in parallel (see `iter_scan`)"""
+        if search_after is not None:
+            raise JudilibreValueError("search_after cannot be used to scan several groups of locations in parallel")
+
+        stats = self.stats(
+            keys=[JudilibreStatsAggregationKeysEnum.location],
+            locations=locations,
+            jurisdictions=jurisdictions,
+            date_start=date_start,
+            date_end=date_end,
+            date_type=date_type,
+            selection=selection,
+            timeout=timeout,
+        )
+        counts = {
+            JudilibreMultiValueEnum.replace_enum(aggregate.key.location): aggregate.decisions_count
+            for aggregate in stats.results.aggregated_data
+        }
+        # locations without decisions are not scanned
+        sizes = {location: counts.get(JudilibreMultiValueEnum.replace_enum(location), 0) for location in locations}
+        groups = _balance({location: size for location, size in sizes.items() if size > 0}, max_workers)
+        total = sum(sizes.values())
+
+        progress = JudilibreProgress(
+            operation="scan",
+            total=min(total, max_results) if max_results is not None else total,
+            callback=progress_callback,
+        )
+        scans = [
+            self.iter_scan(
+                # an `AdaptiveBatchSize` tunes the size of the batches of one scan
+                copy.deepcopy(batch_size),
+                jurisdictions=jurisdictions,
+                locations=group,
+                selection=selection,
+                date_start=date_start,
+                date_end=date_end,
+                date_type=date_type,
+                max_results=max_results,
+                progress_callback=progress.part(index),
+                timeout=timeout,
+                **kwargs,
+            )
+            for index, group in enumerate(groups)
+        ]
+
+        n_decisions = 0
+        decisions = _merge_concurrently(scans, size=len(scans) * FAN_OUT_BUFFER_SIZE)
+        try:
+            for decision in decisions:
+                yield decision
+                n_decisions += 1
+                if max_results is not None and n_decisions >= max_results:
+                    break
+        finally:
+            decisions.close()
+        progress.finish(n_decisions)
+
     @staticmethod
     def _clean_query_parameters(query_parameters: dict | None) -> dict:
+        """Returns a copy of the query parameters with the values (enums, booleans, ...) converted for the API"""
         if query_parameters is None:
             return {}
         if isinstance(query_parameters, dict):
-            for k, v in query_parameters.items():
-                query_parameters[k] = JudilibreClient._clean_query_parameters(v)
+            return {k: JudilibreClient._clean_query_parameters(v) for k, v in query_parameters.items()}
         elif isinstance(query_parameters, list):
             return [JudilibreClient._clean_query_parameters(i) for i in query_parameters]
         elif query_parameters is True:
@@ -517,7 +1757,6 @@ class JudilibreClient:
             return "false"
         else:
             return JudilibreMultiValueEnum.replace_enum(query_parameters)
-        return query_parameters
 
     def taxonomy(
         self,
@@ -601,6 +1840,19 @@ class JudilibreClient:
                 - ID of the query to paginate results
             )
         """
+        return self._transactional_history(date_start, page_size=page_size, from_id=from_id, timeout=timeout)
+
+    def _transactional_history(
+        self,
+        date_start: datetime.date,
+        page_size: int = 25,
+        from_id: str | None = None,
+        timeout: int | None = None,
+        progress: JudilibreProgress | None = None,
+    ) -> tuple[int, list[JudilibreTransaction], str | None]:
+        """Returns a page of the transactional history, recording the request in `progress`"""
+        from pyjudilibre.models import JudilibreTransaction
+
         query_parameters = {
             "date": date_start,
             "page_size": page_size,
@@ -612,6 +1864,7 @@ class JudilibreClient:
             url="transactionalhistory",
             query_parameters=query_parameters,
             timeout=timeout or self.default_timeout,
+            progress=progress,
         )
 
         total_transactions = response["total"]
@@ -624,7 +1877,7 @@ class JudilibreClient:
             next_from_id,
         )
 
-    def paginate_search(
+    def iter_search(
         self,
         query: str,
         max_results: int | None = None,
@@ -636,10 +1889,21 @@ class JudilibreClient:
         date_start: datetime.date | None = None,
         date_end: datetime.date | None = None,
         date_type: JudilibreDateTypeEnum | None = JudilibreDateTypeEnum.creation,
+        page_size: int | str = "auto",
+        max_workers: int = 1,
+        split_dates: bool = False,
+        progress_callback: ProgressCallback | None = None,
         timeout: int | None = None,
         **kwargs,
-    ) -> list[JudilibreSearchResult]:
-        """Paginates through all the results from a plain text query
+    ) -> Iterator[JudilibreSearchResult]:
+        """Iterates through the results of a plain text query, page after page
+
+        Pages are requested as the results are consumed. Pages are ranked by score: a result moved to the
+        next page between two requests (because the index was updated) is only yielded once.
+
+        `/search` only gives access to the first 10 000 results of a query. With `split_dates=True`, the dates of
+        the query are split into windows of at most 10 000 results each, searched separately: the results are
+        then ranked by score within each window, the windows being in chronological order.
 
         Args:
             query (str): plain text string query
@@ -664,15 +1928,99 @@ class JudilibreClient:
             date_end (datetime.date | None, optional): maximal date to return results from.
                 If `None` returns all the results.
                 Defaults to None.
+            page_size (int | str, optional): number of results per page, used for every page.
+                If `"auto"`, the largest page accepted by the API (50), or `max_results` if it is smaller.
+                Defaults to "auto".
+            max_workers (int, optional): number of pages fetched concurrently. If greater than 1, the pages
+                following the first one are all requested at once, `max_workers` at a time (see also the
+                `rate_limit` of the client). With `split_dates`, number of windows of dates searched concurrently.
+                Defaults to 1.
+            split_dates (bool, optional): splits the query into windows of dates holding at most 10 000 results.
+                Defaults to False.
+            progress_callback (ProgressCallback | None, optional): function called with a `JudilibreProgress`
+                after each page (see `pyjudilibre.progress`).
+                Defaults to None.
             timeout (int): Number of seconds before timeout.
                 Defaults to 5.
 
-        Returns:
-            list[JudilibreSearchResult]: list of search results corresponding to the query
+        Yields:
+            JudilibreSearchResult: search results corresponding to the query
         """
-        page_size = 25
-        page_number = 0
-        next_page = True
+        from pyjudilibre.models import JudilibreSearchResult
+
+        if split_dates:
+
+            def count(start: datetime.date, end: datetime.date) -> int:
+                n_results, _ = self.search(
+                    query,
+                    page_size=1,
+                    jurisdictions=jurisdictions,
+                    locations=locations,
+                    selection=selection,
+                    date_start=start,
+                    date_end=end,
+                    date_type=date_type,
+                    operator=operator,
+                    timeout=timeout,
+                    **kwargs,
+                )
+                return n_results
+
+            windows = self._date_windows(
+                count,
+                jurisdictions=jurisdictions,
+                locations=locations,
+                selection=selection,
+                date_start=date_start,
+                date_end=date_end,
+                date_type=date_type,
+                timeout=timeout,
+            )
+            n_results = sum(window_results for _, _, window_results in windows)
+            progress = JudilibreProgress(
+                operation="search",
+                unit="results",
+                total=min(n_results, max_results) if max_results is not None else n_results,
+                callback=progress_callback,
+            )
+
+            def search_window(window: tuple[datetime.date, datetime.date, int | None]):
+                start, end, window_max_results = window
+                return self.iter_search(
+                    query,
+                    window_max_results,
+                    jurisdictions=jurisdictions,
+                    locations=locations,
+                    selection=selection,
+                    date_start=start,
+                    date_end=end,
+                    date_type=date_type,
+                    page_size=page_size,
+                    operator=operator,
+                    progress_callback=progress.part((start, end)),
+                    timeout=timeout,
+                    **kwargs,
+                )
+
+            n_yielded = 0
+            results = _chain_concurrently(
+                (search_window(window) for window in _cap_windows(windows, max_results)),
+                max_workers=max_workers,
+                size=FAN_OUT_BUFFER_SIZE,
+            )
+            try:
+                for result in results:
+                    yield result
+                    n_yielded += 1
+                    if max_results is not None and n_yielded >= max_results:
+                        break
+            finally:
+                results.close()
+            progress.finish(n_yielded)
+            return
+
+        page_size = self._page_size(page_size, SEARCH_MAX_PAGE_SIZE, max_results)
+        progress = JudilibreProgress(operation="search", unit="results", callback=progress_callback)
 
         query_parameters = {
             **({"particularInterest": "true"} if selection else {}),
@@ -685,39 +2033,142 @@ class JudilibreClient:
             **kwargs,
             "query": query,
             "page_size": page_size,
-            "page": page_number,
+            "page": 0,
             "resolve_references": True,
         }
 
-        results = []
-        n_results = 0
-
-        while next_page:
-            query_parameters["page"] = page_number
-
-            response = self._query(
+        def search_page(page_number: int) -> dict:
+            return self._query(
                 method="GET",
                 url="/search",
-                query_parameters=query_parameters,
+                query_parameters={**query_parameters, "page": page_number},
                 timeout=timeout or self.default_timeout,
+                progress=progress,
             )
 
-            new_results = [JudilibreSearchResult(**r) for r in response["results"]]
-            n_results += len(new_results)
-
-            results.extend(new_results)
+        def sequential_pages() -> Iterator[dict]:
+            page_number = 0
+            while True:
+                response = search_page(page_number)
+                yield response
+                if response.get("next_page") is None:
+                    return
+                page_number += 1
+
+        def concurrent_pages() -> Iterator[dict]:
+            # the total of the first page tells which pages exist, they are all requested at once
+            response = search_page(0)
+            yield response
+            n_results = min(response["total"], MAX_RESULT_WINDOW)
+            if max_results is not None:
+                n_results = min(n_results, max_results)
+            n_pages = min(-(-n_results // page_size), MAX_RESULT_WINDOW // page_size)
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            try:
+                yield from executor.map(search_page, range(1, n_pages))
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
 
-            if response.get("next_page") is None:
-                next_page = False
+        n_results = 0
+        ids = set()
+        for response in concurrent_pages() if max_workers > 1 else sequential_pages():
+            for r in response["results"]:
+                if r["id"] in ids:
+                    continue
+                ids.add(r["id"])
+                yield JudilibreSearchResult(**r)
+                n_results += 1
+                if max_results is not None and n_results >= max_results:
+                    progress.update(n_results, finished=True)
+                    return
+            total = self._progress_total(response, max_results, MAX_RESULT_WINDOW)
+            progress.update(n_results, total, finished=response.get("next_page") is None)
+
+        if not progress.finished:
+            progress.update(n_results, finished=True)
 
-            if (max_results is not None) and (n_results >= max_results):
-                next_page = False
+    def paginate_search(
+        self,
+        query: str,
+        max_results: int | None = None,
+        *,
+        jurisdictions: list[JurisdictionEnum] | None = None,
+        locations: list[LocationCAEnum | LocationTJEnum | LocationTCOMEnum] | None = None,
+        selection: bool | None = None,
+        operator: JudilibreOperatorEnum | None = None,
+        date_start: datetime.date | None = None,
+        date_end: datetime.date | None = None,
+        date_type: JudilibreDateTypeEnum | None = JudilibreDateTypeEnum.creation,
+        page_size: int | str = "auto",
+        max_workers: int = 1,
+        split_dates: bool = False,
+        progress_callback: ProgressCallback | None = None,
+        timeout: int | None = None,
+        **kwargs,
+    ) -> list[JudilibreSearchResult]:
+        """Paginates through all the results from a plain text query
 
-            page_number += 1
+        Args:
+            query (str): plain text string query
+            max_results (int | None, optional):  maximal number of results that should be returned.
+                If `None` all results are returned.
+                Defaults to None.
+            jurisdictions (list[JurisdictionEnum] | None, optional): list of jurisdictions to return results from.
+                If `None`, it will default to **JUDILIBRE** default settings.
+                Defaults to None.
+            locations (list[LocationCAEnum  |  LocationTJEnum  |  LocationTCOMEnum] | None, optional): list of locations (courts) to return results from.
+                If `None`, it will defaul to **JUDILIBRE** default settings.
+                Defaults to None.
+            selection (bool | None, optional): Returns only results about decisions with a particular interest if true.
+                If False, returns all the results
+                Defaults to None.
+            operator (JudilibreOperatorEnum | None, optional): operator to use for the search.
+                If `None`, it will defaul to **JUDILIBRE** default settings.
+                Defaults to None.
+            date_start (datetime.date | None, optional): minimal date to return results from.
+                If `None` returns all the results.
+                Defaults to None.
+            date_end (datetime.date | None, optional): maximal date to return results from.
+                If `None` returns all the results.
+                Defaults to None.
+            page_size (int | str, optional): number of results per page, used for every page.
+                If `"auto"`, the largest page accepted by the API (50), or `max_results` if it is smaller.
+                Defaults to "auto".
+            max_workers (int, optional): number of pages fetched concurrently. If greater than 1, the pages
+                following the first one are all requested at once, `max_workers` at a time (see also the
+                `rate_limit` of the client). With `split_dates`, number of windows of dates searched concurrently.
+                Defaults to 1.
+            split_dates (bool, optional): splits the query into windows of dates holding at most 10 000 results
+                (see `iter_search`).
+                Defaults to False.
+            progress_callback (ProgressCallback | None, optional): function called with a `JudilibreProgress`
+                after each page (see `pyjudilibre.progress`).
+                Defaults to None.
+            timeout (int): Number of seconds before timeout.
+                Defaults to 5.
 
-        if max_results is not None:
-            return results[:max_results]
-        return results
+        Returns:
+            list[JudilibreSearchResult]: list of search results corresponding to the query
+        """
+        return list(
+            self.iter_search(
+                query,
+                max_results,
+                jurisdictions=jurisdictions,
+                locations=locations,
+                selection=selection,
+                operator=operator,
+                date_start=date_start,
+                date_end=date_end,
+                date_type=date_type,
+                page_size=page_size,
+                max_workers=max_workers,
+                split_dates=split_dates,
+                progress_callback=progress_callback,
+                timeout=timeout,
+                **kwargs,
+            )
+        )
 
     def paginate_export(
         self,
@@ -729,11 +2180,19 @@ class JudilibreClient:
         date_start: datetime.date | None = None,
         date_end: datetime.date | None = None,
         date_type: JudilibreDateTypeEnum | None = JudilibreDateTypeEnum.creation,
+        batch_size: int | str | AdaptiveBatchSize = 100,
+        split_dates: bool = False,
+        max_workers: int = 1,
+        progress_callback: ProgressCallback | None = None,
         timeout: int | None = None,
         **kwargs,
     ) -> list[JudilibreDecision] | list[JudilibreShortDecision]:
         """Paginates through the results of a metadata query
 
+        `/export` only gives access to the first 10 000 results of a query. With `split_dates=True`, the dates of
+        the query are split into windows of at most 10 000 results each (see `_date_windows`), which are exported
+        separately and returned in chronological order.
+
         Args:
             max_results (int | None, optional):  maximal number of results that should be returned.
                 If `None` all results are returned.
@@ -756,14 +2215,95 @@ class JudilibreClient:
             date_type (JudilibreDateTypeEnum | None, optional): type of date to use for the date filters.
                 If `None`, it will default to **JUDILIBRE** default settings.
                 Defaults to JudilibreDateTypeEnum.creation.
+            batch_size (int | str | AdaptiveBatchSize, optional): Size of the batches to get (at most 1 000),
+                or "auto" (or an `AdaptiveBatchSize`) to tune it from the duration of the previous batches
+                (see `pyjudilibre.batching`). Adaptive sizes are divisors of 10 000, so that the offset of
+                each batch is a whole number of batches.
+                Defaults to 100.
+            split_dates (bool, optional): splits the query into windows of dates holding at most 10 000 results.
+                Defaults to False.
+            max_workers (int, optional): number of windows of dates exported concurrently, with `split_dates`.
+                Defaults to 1.
+            progress_callback (ProgressCallback | None, optional): function called with a `JudilibreProgress`
+                after each batch (see `pyjudilibre.progress`).
+                Defaults to None.
             timeout (int): Number of seconds before timeout.
                 Defaults to 5.
 
         Returns:
             list[JudilibreDecision]: list of decisions corresponding to the query
         """
-        batch_size = 100
-        batch_number = 0
+        from pyjudilibre.models import JudilibreDecision, JudilibreShortDecision
+
+        if split_dates:
+
+            def count(start: datetime.date, end: datetime.date) -> int:
+                n_results, _ = self.export(
+                    0,
+                    1,
+                    jurisdictions=jurisdictions,
+                    locations=locations,
+                    selection=selection,
+                    date_start=start,
+                    date_end=end,
+                    date_type=date_type,
+                    timeout=timeout,
+                    **kwargs,
+                )
+                return n_results
+
+            windows = self._date_windows(
+                count,
+                jurisdictions=jurisdictions,
+                locations=locations,
+                selection=selection,
+                date_start=date_start,
+                date_end=date_end,
+                date_type=date_type,
+                timeout=timeout,
+            )
+            n_results = sum(window_results for _, _, window_results in windows)
+            progress = JudilibreProgress(
+                operation="export",
+                total=min(n_results, max_results) if max_results is not None else n_results,
+                callback=progress_callback,
+            )
+
+            def export_window(window: tuple[datetime.date, datetime.date, int | None]) -> list:
+                start, end, window_max_results = window
+                return self.paginate_export(
+                    window_max_results,
+                    jurisdictions=jurisdictions,
+                    locations=locations,
+                    selection=selection,
+                    date_start=start,
+                    date_end=end,
+                    date_type=date_type,
+                    # an `AdaptiveBatchSize` tunes the size of the batches of one window
+                    batch_size=copy.deepcopy(batch_size),
+                    progress_callback=progress.part((start, end)),
+                    timeout=timeout,
+                    **kwargs,
+                )
+
+            decisions: list = []
+            windows_decisions = _map_concurrently(
+                export_window, _cap_windows(windows, max_results), max_workers=max_workers, ordered=True
+            )
+            try:
+                for window_decisions in windows_decisions:
+                    decisions.extend(window_decisions)
+                    if max_results is not None and len(decisions) >= max_results:
+                        break
+            finally:
+                windows_decisions.close()
+            decisions = decisions[:max_results]
+            progress.finish(len(decisions))
+            return decisions
+
+        batch_sizer = self._batch_sizer(batch_size, timeout)
+        progress = JudilibreProgress(operation="export", callback=progress_callback)
+        offset = 0
         next_batch = True
 
         query_parameters = {
@@ -774,8 +2314,6 @@ class JudilibreClient:
             **({"date_end": date_end} if date_end else {}),
             **({"date_type": date_type} if date_type else {}),
             "resolve_references": True,
-            "batch": batch_number,
-            "batch_size": batch_size,
             **kwargs,
         }
 
@@ -783,14 +2321,25 @@ class JudilibreClient:
         n_decisions = 0
 
         while next_batch:
-            query_parameters["batch"] = batch_number
-
-            response = self._query(
-                method="GET",
-                url="/export",
-                query_parameters=query_parameters,
-                timeout=timeout or self.default_timeout,
-            )
+            size = batch_sizer.size(offset, EXPORT_BATCH_SIZES) if batch_sizer is not None else cast(int, batch_size)
+            query_parameters["batch"] = offset // size
+            query_parameters["batch_size"] = size
+
+            events: list[JudilibreRequestEvent] = []
+            start = time.perf_counter()
+            try:
+                response = self._query(
+                    method="GET",
+                    url="/export",
+                    query_parameters=query_parameters,
+                    timeout=timeout or self.default_timeout,
+                    on_response=events.append,
+                    progress=progress,
+                )
+            except TimeoutError:
+                if batch_sizer is None or not batch_sizer.record_timeout(size, time.perf_counter() - start):
+                    raise
+                continue
 
             if query_parameters.get("abridged") is True:
                 new_decisions = [JudilibreShortDecision(**r) for r in response["results"]]
@@ -800,13 +2349,18 @@ class JudilibreClient:
 
             decisions.extend(new_decisions)
 
+            if batch_sizer is not None:
+                batch_sizer.record(len(new_decisions), events[-1].network_time, events[-1].response_bytes)
+
             if response.get("next_batch") is None:
                 next_batch = False
 
             if (max_results is not None) and (n_decisions >= max_results):
                 next_batch = False
 
-            batch_number += 1
+            total = self._progress_total(response, max_results, MAX_RESULT_WINDOW)
+            progress.update(min(n_decisions, total or n_decisions), total, finished=not next_batch)
+            offset += size
 
         if max_results is not None:
             return decisions[:max_results]
@@ -815,7 +2369,7 @@ class JudilibreClient:
 
     def paginate_scan(
         self,
-        batch_size: int = 100,
+        batch_size: int | str | AdaptiveBatchSize = 100,
         *,
         jurisdictions: list[JurisdictionEnum] | None = None,
         locations: list[LocationCAEnum | LocationTJEnum | LocationTCOMEnum] | None = None,
@@ -824,13 +2378,20 @@ class JudilibreClient:
         date_end: datetime.date | None = None,
         date_type: JudilibreDateTypeEnum | None = JudilibreDateTypeEnum.creation,
         max_results: int | None = None,
+        max_workers: int = 1,
         verbose: bool = False,
+        progress_callback: ProgressCallback | None = None,
+        stats_total: bool = False,
         timeout: int | None = None,
         **kwargs,
     ) -> list[JudilibreDecision] | list[JudilibreShortDecision]:
         """Paginates through the results of a metadata query
 
         Args:
+            batch_size (int | str | AdaptiveBatchSize, optional): Size of the batches to get (at most 1 000),
+                or "auto" (or an `AdaptiveBatchSize`) to tune it from the duration of the previous batches
+                (see `pyjudilibre.batching`).
+                Defaults to 100.
             max_results (int | None, optional):  maximal number of results that should be returned.
                 If `None` all results are returned.
                 Defaults to None.
@@ -852,6 +2413,18 @@ class JudilibreClient:
             date_type (JudilibreDateTypeEnum | None, optional): type of date to use for the date filters.
                 If `None`, it will default to **JUDILIBRE** default settings.
                 Defaults to JudilibreDateTypeEnum.creation.
+            max_workers (int, optional): number of groups of locations scanned in parallel, if several `locations`
+                are given (see `iter_scan`). The decisions are then returned in no particular order.
+                Defaults to 1.
+            verbose (bool, optional): displays a `tqdm` progress bar.
+                Defaults to False.
+            progress_callback (ProgressCallback | None, optional): function called with a `JudilibreProgress`
+                after each batch (see `pyjudilibre.progress`), instead of the progress bar of `verbose`.
+                Defaults to None.
+            stats_total (bool, optional): requests the number of decisions to `/stats` before the first batch, so
+                that the total of the progress is known from the start. Otherwise, it is known after the first
+                batch, without an additional request.
+                Defaults to False.
             timeout (int): Number of seconds before timeout.
                 Defaults to 5.
 
@@ -859,31 +2432,33 @@ class JudilibreClient:
             list[JudilibreDecision]: list of decisions corresponding to the query
         """
         decisions: list[JudilibreDecision | JudilibreShortDecision] = []
-        n_decisions = 0
 
-        progression_bar = None
+        if progress_callback is None and verbose:
+            progress_callback = TqdmProgress()
 
-        stats = self.stats(
-            jurisdictions=jurisdictions,
-            locations=locations,
-            date_start=date_start,
-            date_end=date_end,
-            date_type=date_type,
-            timeout=timeout or self.default_timeout,
-        )
+        if progress_callback is not None and stats_total:
+            stats = self.stats(
+                jurisdictions=jurisdictions,
+                locations=locations,
+                date_start=date_start,
+                date_end=date_end,
+                date_type=date_type,
+                timeout=timeout or self.default_timeout,
+            )
+            total = stats.results.total_decisions
+            if max_results is not None and total is not None:
+                total = min(max_results, total)
+            report = progress_callback
 
-        if verbose:
-            if (max_results is not None) and (stats.results.total_decisions is not None):
-                progression_bar = tqdm(
-                    total=min(
-                        max_results,
-                        stats.results.total_decisions,
-                    )
-                )
-            else:
-                progression_bar = tqdm(total=stats.results.total_decisions)
+            def report_with_total(progress: JudilibreProgress):
+                if progress.total is None:
+                    progress.total = total
+                report(progress)
+
+            progress_callback = report_with_total
+            progress_callback(JudilibreProgress(operation="scan"))
 
-        total, decisions_tmp, search_after = self.scan(
+        for decision in self.iter_scan(
             jurisdictions=jurisdictions,
             locations=locations,
             selection=selection,
@@ -891,54 +2466,14 @@ class JudilibreClient:
             date_end=date_end,
             date_type=date_type,
             batch_size=batch_size,
+            max_results=max_results,
+            max_workers=max_workers,
+            progress_callback=progress_callback,
             timeout=timeout or self.default_timeout,
             **kwargs,
-        )
-
-        n_decisions += len(decisions_tmp)
-
-        if verbose and progression_bar:
-            progression_bar.update(len(decisions_tmp))
-
-        decisions.extend(decisions_tmp)
-
-        def end_condition(
-            search_after,
-            max_results,
-            n_decisions,
         ):
-            if search_after is None:
-                return True
-            if max_results is None:
-                return False
-            if n_decisions >= max_results:
-                return True
+            decisions.append(decision)
 
-        while not end_condition(
-            search_after=search_after,
-            max_results=max_results,
-            n_decisions=n_decisions,
-        ):
-            total, decisions_tmp, search_after = self.scan(
-                jurisdictions=jurisdictions,
-                locations=locations,
-                selection=selection,
-                date_start=date_start,
-                date_end=date_end,
-                date_type=date_type,
-                search_after=search_after,
-                batch_size=batch_size,
-                timeout=timeout or self.default_timeout,
-                **kwargs,
-            )
-
-            if verbose and progression_bar:
-                progression_bar.update(len(decisions_tmp))
-
-            n_decisions += len(decisions_tmp)
-            decisions.extend(decisions_tmp)
-        if max_results is not None:
-            return decisions[:max_results]
         return decisions
 
     def paginate_transactional_history(
@@ -946,6 +2481,8 @@ class JudilibreClient:
         date_start: datetime.datetime,
         *,
         max_results: int | None = None,
+        page_size: int | str = "auto",
+        progress_callback: ProgressCallback | None = None,
         timeout: int | None = None,
     ) -> list[JudilibreTransaction]:
         """Paginates through the transactional history results
@@ -955,19 +2492,28 @@ class JudilibreClient:
             max_results (int | None, optional):  maximal number of results that should be returned.
                 If `None` all results are returned.
                 Defaults to None.
+            page_size (int | str, optional): number of transactions per page, used for every page.
+                If `"auto"`, the largest page accepted by the API (1 000), or `max_results` if it is smaller.
+                Defaults to "auto".
+            progress_callback (ProgressCallback | None, optional): function called with a `JudilibreProgress`
+                after each page (see `pyjudilibre.progress`).
+                Defaults to None.
             timeout (int): Number of seconds before timeout.
                 Defaults to 5.
         Returns:
             list[JudilibreTransaction]: list of transaction corresponding to the query
         """
-        page_size = 500
+        page_size = self._page_size(page_size, TRANSACTIONAL_HISTORY_MAX_PAGE_SIZE, max_results)
+        progress = JudilibreProgress(operation="transactional_history", unit="transactions", callback=progress_callback)
 
-        _, transactions, from_id = self.transactional_history(
+        total, transactions, from_id = self._transactional_history(
             date_start=date_start,
             page_size=page_size,
             timeout=timeout or self.default_timeout,
+            progress=progress,
         )
         n_transactions = len(transactions)
+        total = min(total, max_results) if max_results is not None else total
 
         def end_condition(
             from_id,
@@ -986,15 +2532,19 @@ class JudilibreClient:
             max_results=max_results,
             n_transactions=n_transactions,
         ):
-            _, tmp_transactions, from_id = self.transactional_history(
+            progress.update(n_transactions, total)
+            _, tmp_transactions, from_id = self._transactional_history(
                 date_start=date_start,
+                page_size=page_size,
                 from_id=from_id,
                 timeout=timeout or self.default_timeout,
+                progress=progress,
             )
             n_transactions += len(tmp_transactions)
             transactions += tmp_transactions
 
         transactions = transactions[:max_results]
+        progress.update(len(transactions), total, finished=True)
 
         return transactions
 
@@ -1020,28 +2570,46 @@ class JudilibreClient:
         Returns:
             str: path to downloaded file
         """
+        return self._download_file(file, filename=filename, folder=folder, timeout=timeout)
 
+    def _download_file(
+        self,
+        file: File,
+        filename: str | None = None,
+        folder: str = ".",
+        timeout: int | None = None,
+        progress: JudilibreProgress | None = None,
+    ) -> str:
+        """Downloads a file attached to a decision, recording the request and its size in `progress`"""
         if filename is None:
             filename = file.name
 
         if file.rawUrl is None:
             raise JudilibreDownloadFileError("rawUrl is not defined")
 
-        request = urllib.request.Request(
-            url=file.rawUrl,
-            headers=self.client_headers,
-        )
+        output_path = os.path.join(folder, filename)
 
-        with self.url_opener.open(
-            request,
+        # files are written as they are (some transports, as httpx, ask for compressed bodies by default), and
+        # decoded if the server compresses them anyway
+        with self.transport.send(
+            method="GET",
+            url=file.rawUrl,
+            headers={**self.client_headers, "Accept-Encoding": "identity"},
             timeout=timeout or self.default_timeout,
         ) as response:
-            content: bytes = response.read()
-
-        output_path = os.path.join(folder, filename)
-        with open(output_path, "wb") as output_file:
-            output_file.write(content)
-
+            if response.status >= 400:
+                raise JudilibreDownloadFileError(f"GET {file.rawUrl} returned {response.status}")
+
+            decoder = ContentDecoder(response.headers.get("content-encoding"))
+            n_bytes = 0
+            with open(output_path, "wb") as output_file:
+                while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+                    output_file.write(decoder.decompress(chunk))
+                    n_bytes += len(chunk)
+                output_file.write(decoder.flush())
+
+        if progress is not None:
+            progress.record(n_bytes)
         return output_path
 
     def download_decision_files(
@@ -1052,6 +2620,7 @@ class JudilibreClient:
             JudilibreFileTypeEnum.avis_de_l_avocat_general,
         ],
         folder: str = ".",
+        progress_callback: ProgressCallback | None = None,
         timeout: int | None = None,
     ) -> list[str]:
         """Download all files from a decision
@@ -1062,6 +2631,9 @@ class JudilibreClient:
                 Defaults to all available file types.
             folder (str, optional): folder to write files into.
                 Defaults to ".".
+            progress_callback (ProgressCallback | None, optional): function called with a `JudilibreProgress`
+                after each file (see `pyjudilibre.progress`).
+                Defaults to None.
             timeout (int): Number of seconds before timeout.
                 Defaults to 5.
         Returns:
@@ -1070,16 +2642,19 @@ class JudilibreClient:
         if decision.files is None:
             return []
         files = [f for f in decision.files if f.type in types]
+        progress = JudilibreProgress(operation="download", unit="files", total=len(files), callback=progress_callback)
 
         filenames = []
 
         for f in files:
-            filename = self.download_file(
+            filename = self._download_file(
                 file=f,
                 folder=folder,
                 timeout=timeout or self.default_timeout,
+                progress=progress,
             )
 
             filenames.append(filename)
+            progress.update(len(filenames), finished=len(filenames) == len(files))
 
         return filenames
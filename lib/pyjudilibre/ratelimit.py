@@ -0,0 +1,63 @@
+"""Client-side rate limiting of the requests sent to the **JUDILIBRE** API
+
+The API keys of [PISTE](https://piste.gouv.fr) come with a quota of requests per second, above which the API
+answers `429 Too Many Requests`. A `RateLimiter` spaces the requests of a client (and of all its threads)
+so that the quota is not exceeded:
+
+```python
+client = JudilibreClient(rate_limit=10)  # at most 10 requests per second
+client = JudilibreClient(rate_limit=RateLimiter(rate=10, burst=5))
+```
+"""
+
+import threading
+import time
+
+from pyjudilibre.exceptions import JudilibreValueError
+
+
+class RateLimiter:
+    """Token bucket shared by the threads of a client
+
+    The bucket holds at most `burst` tokens and is refilled with `rate` tokens per second; each request takes
+    one token. When the bucket is empty, the token is reserved and the request waits until it is refilled, so
+    that waiting threads are served in the order of their calls.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+    ):
+        """Constructor of the `RateLimiter` class
+
+        Args:
+            rate (float): maximal number of requests per second.
+            burst (int, optional): number of requests that can be sent at once after an idle period.
+                Defaults to 1.
+        """
+        if rate <= 0 or burst < 1:
+            raise JudilibreValueError(f"rate must be positive and burst at least 1, not {rate} and {burst}")
+        self.rate = rate
+        self.burst = burst
+
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Waits until a request can be sent
+
+        Returns:
+            float: number of seconds waited
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if delay > 0:
+            time.sleep(delay)
+        return delay
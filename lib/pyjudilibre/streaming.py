@@ -0,0 +1,176 @@
+"""Incremental parsing of the JSON responses of the **JUDILIBRE** API
+
+The paginated endpoints answer with an object holding an array of results (`{"total": ..., "results": [...]}`).
+`JsonStreamParser` is fed with the body of such a response chunk by chunk, as it comes from the network,
+and returns the items of the array as soon as they are complete, so that they can be processed before
+the whole body has been received and without keeping the whole body and its decoded tree in memory.
+
+```python
+parser = JsonStreamParser("results")
+while chunk := response.read(65_536):
+    for decision in parser.feed(chunk):
+        ...
+for decision in parser.close():
+    ...
+fields = parser.fields  # the other fields of the object: {"total": ..., "next_batch": ...}
+```
+"""
+
+import codecs
+import json
+import re
+from typing import Any
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_SCALAR = re.compile(r"[^ \t\n\r,\]}]*")
+
+_INCOMPLETE = object()
+
+
+class JsonStreamParser:
+    """Incremental parser of a JSON object, returning the items of one of its arrays as soon as they are parsed
+
+    Values are decoded with the C decoder of the `json` module as soon as they may be complete; a value that
+    is still truncated is decoded again once the buffer holds twice as much of it, so each byte is decoded
+    a bounded number of times.
+    """
+
+    def __init__(self, array_key: str = "results"):
+        """Constructor of the `JsonStreamParser` class
+
+        Args:
+            array_key (str, optional): key of the array whose items are returned by `feed`.
+                Defaults to "results".
+        """
+        self.array_key = array_key
+        self.fields: dict[str, Any] = {}
+
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"
+        self._key: str | None = None
+        self._retry_size = 0
+
+    def feed(self, data: bytes) -> list[Any]:
+        """Parses a chunk of the body and returns the items of the array completed by this chunk
+
+        Raises:
+            json.JSONDecodeError: raised if the body is not a JSON object
+        """
+        self._append(self._utf8.decode(data))
+        return self._parse(final=False)
+
+    def close(self) -> list[Any]:
+        """Parses the end of the body and returns the last items of the array
+
+        The other fields of the object are then available in `fields`.
+
+        Raises:
+            json.JSONDecodeError: raised if the body is truncated or is not a JSON object
+        """
+        self._append(self._utf8.decode(b"", final=True))
+        items = self._parse(final=True)
+        if self._state != "end":
+            raise json.JSONDecodeError("Truncated JSON document", self._buffer, self._pos)
+        return items
+
+    def _append(self, text: str):
+        # drop what has already been parsed
+        if self._pos:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        self._buffer += text
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def _parse(self, final: bool) -> list[Any]:
+        items: list[Any] = []
+        buffer = self._buffer
+
+        while True:
+            self._pos = _WHITESPACE.match(buffer, self._pos).end()  # type: ignore
+            if self._pos >= len(buffer):
+                return items
+            char = buffer[self._pos]
+
+            if self._state == "start":
+                if char != "{":
+                    raise self._error("Expecting a JSON object")
+                self._pos += 1
+                self._state = "key"
+
+            elif self._state == "key":
+                if char == "}":
+                    self._pos += 1
+                    self._state = "end"
+                elif char == ",":
+                    self._pos += 1
+                elif char == '"':
+                    key = self._value(final)
+                    if key is _INCOMPLETE:
+                        return items
+                    self._key = key
+                    self._state = "colon"
+                else:
+                    raise self._error("Expecting a property name")
+
+            elif self._state == "colon":
+                if char != ":":
+                    raise self._error("Expecting ':' delimiter")
+                self._pos += 1
+                self._state = "value"
+
+            elif self._state == "value":
+                if self._key == self.array_key and char == "[":
+                    self._pos += 1
+                    self._state = "items"
+                    continue
+                value = self._value(final)
+                if value is _INCOMPLETE:
+                    return items
+                self.fields[self._key] = value  # type: ignore
+                self._state = "key"
+
+            elif self._state == "items":
+                if char == "]":
+                    self._pos += 1
+                    self._state = "key"
+                elif char == ",":
+                    self._pos += 1
+                else:
+                    item = self._value(final)
+                    if item is _INCOMPLETE:
+                        return items
+                    items.append(item)
+
+            else:
+                raise self._error("Extra data")
+
+    def _value(self, final: bool) -> Any:
+        """Decodes the value starting at the current position, or returns `_INCOMPLETE`"""
+        buffer = self._buffer
+        start = self._pos
+
+        if buffer[start] not in '{["':
+            # a number or a literal is complete once it is followed by a delimiter
+            if _SCALAR.match(buffer, start).end() >= len(buffer) and not final:  # type: ignore
+                return _INCOMPLETE
+            value, self._pos = self._json.raw_decode(buffer, start)
+            return value
+
+        if len(buffer) - start < self._retry_size and not final:
+            return _INCOMPLETE
+        try:
+            value, self._pos = self._json.raw_decode(buffer, start)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            # the value is truncated (an invalid value is reported by `close`): decoding it again once twice
+            # as much data is available keeps the total work linear in the size of the value
+            self._retry_size = 2 * (len(buffer) - start)
+            return _INCOMPLETE
+        self._retry_size = 0
+        return value
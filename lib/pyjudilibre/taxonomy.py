@@ -0,0 +1,637 @@
+"""Cached labels of the taxons of **JUDILIBRE**
+
+`JudilibreClient.taxonomy` sends a request at each call. A `TaxonomyRegistry` fetches each taxon (chambers,
+solutions, locations, themes, ...) once per jurisdiction, keeps it in memory (and on disk, if given a path) for
+`ttl` seconds, and resolves codes to labels, and labels to codes, without requests:
+
+```python
+registry = TaxonomyRegistry(client, cache_path="~/.cache/pyjudilibre/taxonomy.json").warm_up()
+
+for decision in client.iter_scan(jurisdictions=[JurisdictionEnum.cour_de_cassation]):
+    chamber = registry.label(JudilibreTaxonEnum.chamber, decision.jurisdiction, decision.chamber)
+```
+
+`warm_up` fetches all the taxons of all the jurisdictions (or the given ones) concurrently; the taxons that are
+not warmed up are fetched on first use.
+
+To label exported decisions, `label_columns` resolves whole columns at once (lists, or `pyarrow` arrays and tables,
+which are dictionary-encoded so that each distinct code is looked up once):
+
+```python
+table = pyarrow.parquet.read_table("export/ca/ca_paris/2024-01.parquet")
+table = registry.label_columns(table)  # adds chamber_label, solution_label, location_label, ... columns
+```
+
+A `TaxonomySnapshot` is a read-only file holding all the taxons, written by `python -m pyjudilibre taxonomy
+snapshot` and memory-mapped when opened: a registry given a snapshot resolves labels without any request, and
+only decodes the taxons it actually uses. Releases ship a snapshot of the production API, used by default. `python -m pyjudilibre taxonomy diff` compares a snapshot with the API.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Iterable, Sequence
+
+from pyjudilibre.enums import JudilibreMultiValueEnum, JudilibreTaxonEnum, JurisdictionEnum
+from pyjudilibre.exceptions import JudilibreInvalidRequestError, JudilibreResourceNotFoundError, JudilibreValueError
+
+if TYPE_CHECKING:
+    from pyjudilibre import JudilibreClient
+
+CACHE_VERSION = 1
+
+# snapshot layout: magic, format version and length of the header (uint32, little-endian), JSON header (metadata
+# and, for each taxon, the offset and length of its block), then one block per taxon, made of UTF-8 records
+# "code<US>label" separated by <RS> (the ASCII unit and record separators, which never appear in labels)
+SNAPSHOT_MAGIC = b"PJTAXSNP"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_PREFIX = struct.Struct("<8sII")
+UNIT_SEPARATOR = "\x1f"
+RECORD_SEPARATOR = "\x1e"
+# columns of exported decisions labelled by `TaxonomyRegistry.label_columns`, and their taxons
+DEFAULT_LABEL_COLUMNS = {
+    "chamber": JudilibreTaxonEnum.chamber,
+    "formation": JudilibreTaxonEnum.formation,
+    "location": JudilibreTaxonEnum.location,
+    "publication": JudilibreTaxonEnum.publication,
+    "solution": JudilibreTaxonEnum.solution,
+    "type": JudilibreTaxonEnum.decision_type,
+}
+BUNDLED_SNAPSHOT_PATH = os.path.join(os.path.dirname(__file__), "data", "taxonomy.snapshot")
+
+logger = logging.getLogger("judilibre-client")
+
+
+@dataclass
+class Taxon:
+    """Labels of the codes of a taxon in a jurisdiction"""
+
+    taxon_id: str
+    context: str
+    labels: dict[str, str]
+    fetched: float = field(default_factory=time.time)
+    codes: dict[str, str] = field(init=False, repr=False)
+    lookup: dict[str, str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # labels are unique within a taxon: the first code of a label is kept otherwise
+        self.codes = {}
+        for code, label in self.labels.items():
+            self.codes.setdefault(label, code)
+        # labels of the codes and of the labels themselves (exported decisions hold labels)
+        self.lookup = {**{label: label for label in self.codes}, **self.labels}
+
+    def expired(self, ttl: float) -> bool:
+        """Returns True if the taxon was fetched more than `ttl` seconds ago"""
+        return time.time() - self.fetched > ttl
+
+    def code_of(self, value: JudilibreMultiValueEnum | str | None) -> str | None:
+        """Returns the code of a code, of a label or of an enum member (as the attributes of decisions), or `None`
+        if the taxon does not hold it"""
+        code: str | None = JudilibreMultiValueEnum.replace_enum(value)
+        if code is None or code in self.labels:
+            return code
+        return self.codes.get(code)
+
+
+@dataclass
+class TaxonDiff:
+    """Differences between two versions of a taxon"""
+
+    taxon_id: str
+    context: str
+    added: dict[str, str] = field(default_factory=dict)
+    removed: dict[str, str] = field(default_factory=dict)
+    changed: dict[str, tuple[str, str]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def diff_taxons(old: Taxon, new: Taxon) -> TaxonDiff:
+    """Returns the codes added to, removed from, and relabelled in `new` compared to `old`"""
+    return TaxonDiff(
+        taxon_id=new.taxon_id,
+        context=new.context,
+        added={code: label for code, label in new.labels.items() if code not in old.labels},
+        removed={code: label for code, label in old.labels.items() if code not in new.labels},
+        changed={
+            code: (label, new.labels[code])
+            for code, label in old.labels.items()
+            if code in new.labels and new.labels[code] != label
+        },
+    )
+
+
+def write_snapshot(path: str, taxons: Iterable[Taxon], *, url: str | None = None) -> int:
+    """Writes taxons to a snapshot file (through a temporary file, so that it is never half-written)
+
+    Args:
+        path (str): path of the snapshot
+        taxons (Iterable[Taxon]): taxons of the snapshot
+        url (str | None, optional): URL of the API the taxons were fetched from.
+            Defaults to None.
+
+    Returns:
+        int: size of the snapshot, in bytes
+    """
+    from pyjudilibre import __version__
+
+    blocks = []
+    index = []
+    offset = 0
+    for taxon in sorted(taxons, key=lambda t: (t.taxon_id, t.context)):
+        block = RECORD_SEPARATOR.join(f"{code}{UNIT_SEPARATOR}{label}" for code, label in taxon.labels.items())
+        data = block.encode("utf-8")
+        blocks.append(data)
+        index.append([taxon.taxon_id, taxon.context, offset, len(data), taxon.fetched])
+        offset += len(data)
+
+    header = json.dumps(
+        {"url": url, "created": time.time(), "pyjudilibre": __version__, "taxons": index},
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as snapshot_file:
+        snapshot_file.write(SNAPSHOT_PREFIX.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(header)))
+        snapshot_file.write(header)
+        for data in blocks:
+            snapshot_file.write(data)
+    os.replace(temporary_path, path)
+    return SNAPSHOT_PREFIX.size + len(header) + offset
+
+
+class TaxonomySnapshot:
+    """Read-only, memory-mapped snapshot of the taxons of **JUDILIBRE**
+
+    Opening a snapshot only reads its header; the block of a taxon is decoded (once) when the taxon is first used.
+    """
+
+    def __init__(self, path: str):
+        """Constructor of the `TaxonomySnapshot` class
+
+        Args:
+            path (str): path of a snapshot written by `write_snapshot`
+
+        Raises:
+            JudilibreValueError: if the file is not a snapshot, or a snapshot of an unsupported version
+        """
+        self.path = os.path.expanduser(path)
+        with open(self.path, "rb") as snapshot_file:
+            try:
+                self._mmap = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                raise JudilibreValueError(f"{self.path} is not a taxonomy snapshot")
+
+        if len(self._mmap) < SNAPSHOT_PREFIX.size:
+            raise JudilibreValueError(f"{self.path} is not a taxonomy snapshot")
+        magic, version, header_size = SNAPSHOT_PREFIX.unpack_from(self._mmap)
+        if magic != SNAPSHOT_MAGIC:
+            raise JudilibreValueError(f"{self.path} is not a taxonomy snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise JudilibreValueError(f"Unsupported version {version} of the taxonomy snapshot {self.path}")
+
+        header = json.loads(self._mmap[SNAPSHOT_PREFIX.size : SNAPSHOT_PREFIX.size + header_size])
+        self.url: str | None = header["url"]
+        self.created: float = header["created"]
+        self._data_offset = SNAPSHOT_PREFIX.size + header_size
+        self._index: dict[tuple[str, str], tuple[int, int, float]] = {
+            (taxon_id, context): (offset, size, fetched)
+            for taxon_id, context, offset, size, fetched in header["taxons"]
+        }
+        self._taxons: dict[tuple[str, str], Taxon] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def bundled(cls) -> TaxonomySnapshot | None:
+        """Returns the snapshot shipped with `pyjudilibre`, if any
+
+        It is written before each release by `scripts/build-taxonomy-snapshot.sh`, from the production API.
+        """
+        if not os.path.exists(BUNDLED_SNAPSHOT_PATH):
+            return None
+        return cls(BUNDLED_SNAPSHOT_PATH)
+
+    def keys(self) -> list[tuple[str, str]]:
+        """Returns the (taxon, jurisdiction) pairs of the snapshot"""
+        return list(self._index)
+
+    def taxon(
+        self,
+        taxon_id: JudilibreTaxonEnum | str,
+        context: JurisdictionEnum | str,
+    ) -> Taxon | None:
+        """Returns a taxon of the snapshot, or `None` if the snapshot does not hold it"""
+        key = (_code(taxon_id, JudilibreTaxonEnum), _code(context, JurisdictionEnum))
+        taxon = self._taxons.get(key)
+        if taxon is not None or key not in self._index:
+            return taxon
+
+        offset, size, fetched = self._index[key]
+        start = self._data_offset + offset
+        block = self._mmap[start : start + size].decode("utf-8")
+        records = (record.split(UNIT_SEPARATOR, 1) for record in block.split(RECORD_SEPARATOR) if record)
+        taxon = Taxon(taxon_id=key[0], context=key[1], labels=dict(records), fetched=fetched)
+        with self._lock:
+            return self._taxons.setdefault(key, taxon)
+
+    def close(self):
+        """Unmaps the snapshot file"""
+        self._mmap.close()
+
+    def __enter__(self) -> TaxonomySnapshot:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+def _is_arrow(value: Any) -> bool:
+    """Returns True if `value` is a `pyarrow` object (without importing `pyarrow`)"""
+    return type(value).__module__.startswith("pyarrow")
+
+
+def _code(value: JudilibreMultiValueEnum | str, enum: type[JudilibreMultiValueEnum]) -> str:
+    """Returns the code used by the API for a member (or a value) of `enum`"""
+    return JudilibreMultiValueEnum.replace_enum(enum(value))
+
+
+class TaxonomyRegistry:
+    """In-memory (and on-disk) cache of the taxons of **JUDILIBRE**, shared by the threads of a client"""
+
+    def __init__(
+        self,
+        client: JudilibreClient,
+        *,
+        ttl: float = 86_400,
+        cache_path: str | None = None,
+        snapshot: TaxonomySnapshot | str | bool | None = None,
+        max_workers: int = 8,
+    ):
+        """Constructor of the `TaxonomyRegistry` class
+
+        Args:
+            client (JudilibreClient): client used to fetch the taxons
+            ttl (float, optional): number of seconds after which a taxon is fetched again.
+                Defaults to 86_400 (a day).
+            cache_path (str | None, optional): JSON file in which the taxons are kept between processes.
+                If `None`, taxons are only kept in memory.
+                Defaults to None.
+            snapshot (TaxonomySnapshot | str | bool | None, optional): snapshot (or path of a snapshot) used,
+                without expiry, for the taxons it holds; the other taxons are fetched.
+                If `None`, the snapshot shipped with `pyjudilibre` (see `TaxonomySnapshot.bundled`), if it was
+                taken from the API of `client`. If `False`, all the taxons are fetched.
+                Defaults to None.
+            max_workers (int, optional): number of taxons fetched concurrently by `warm_up`.
+                Defaults to 8.
+        """
+        self.client = client
+        self.ttl = ttl
+        self.cache_path = os.path.expanduser(cache_path) if cache_path else None
+        self.max_workers = max_workers
+        self.snapshot: TaxonomySnapshot | None
+        if snapshot is None:
+            bundled = TaxonomySnapshot.bundled()
+            # the codes of another API (such as the sandbox) may differ
+            self.snapshot = bundled if bundled is not None and bundled.url == client.judilibre_api_url else None
+        elif isinstance(snapshot, bool):
+            self.snapshot = TaxonomySnapshot.bundled() if snapshot else None
+        else:
+            self.snapshot = TaxonomySnapshot(snapshot) if isinstance(snapshot, str) else snapshot
+        # errors of the taxons that the last `warm_up` could not fetch
+        self.failures: dict[tuple[str, str], Exception] = {}
+
+        self._taxons: dict[tuple[str, str], Taxon] = {}
+        self._lock = threading.Lock()
+        if self.cache_path is not None:
+            self._load()
+
+    def warm_up(
+        self,
+        taxon_ids: list[JudilibreTaxonEnum] | None = None,
+        contexts: list[JurisdictionEnum] | None = None,
+    ) -> TaxonomyRegistry:
+        """Fetches concurrently the taxons that are missing or expired, and saves them to the disk cache
+
+        A taxon that cannot be fetched does not stop the others: its error is logged and kept in `failures`.
+
+        Args:
+            taxon_ids (list[JudilibreTaxonEnum] | None, optional): taxons to fetch.
+                If `None`, all of them.
+                Defaults to None.
+            contexts (list[JurisdictionEnum] | None, optional): jurisdictions to fetch the taxons of.
+                If `None`, all of them.
+                Defaults to None.
+
+        Returns:
+            TaxonomyRegistry: the registry itself
+        """
+        keys = [
+            (_code(taxon_id, JudilibreTaxonEnum), _code(context, JurisdictionEnum))
+            for taxon_id in taxon_ids or list(JudilibreTaxonEnum)
+            for context in contexts or list(JurisdictionEnum)
+        ]
+        if self.snapshot is not None:
+            keys = [key for key in keys if key not in self.snapshot]
+        with self._lock:
+            missing = [key for key in keys if key not in self._taxons or self._taxons[key].expired(self.ttl)]
+        self.failures = {}
+        if not missing:
+            return self
+
+        def fetch(key: tuple[str, str]) -> Taxon | Exception:
+            try:
+                return self._fetch(*key)
+            except Exception as exc:
+                return exc
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            taxons = list(executor.map(fetch, missing))
+        with self._lock:
+            for key, taxon in zip(missing, taxons):
+                if isinstance(taxon, Exception):
+                    self.failures[key] = taxon
+                    logger.warning("Could not fetch the taxon %s of %s: %s", *key, taxon)
+                else:
+                    self._taxons[key] = taxon
+        self._save()
+        return self
+
+    def taxon(
+        self,
+        taxon_id: JudilibreTaxonEnum | str,
+        context: JurisdictionEnum | str,
+    ) -> Taxon:
+        """Returns a taxon, from the snapshot if it holds it, or else fetched if it is missing or expired
+
+        Args:
+            taxon_id (JudilibreTaxonEnum | str): taxon
+            context (JurisdictionEnum | str): jurisdiction
+
+        Returns:
+            Taxon: labels of the codes of the taxon
+        """
+        key = (_code(taxon_id, JudilibreTaxonEnum), _code(context, JurisdictionEnum))
+        if self.snapshot is not None:
+            snapshot_taxon = self.snapshot.taxon(*key)
+            if snapshot_taxon is not None:
+                return snapshot_taxon
+        taxon = self._taxons.get(key)
+        if taxon is None or taxon.expired(self.ttl):
+            taxon = self._fetch(*key)
+            with self._lock:
+                self._taxons[key] = taxon
+            self._save()
+        return taxon
+
+    def label(
+        self,
+        taxon_id: JudilibreTaxonEnum | str,
+        context: JurisdictionEnum | str,
+        code: JudilibreMultiValueEnum | str | None,
+        default: str | None = None,
+    ) -> str | None:
+        """Returns the label of a code ("Chambre sociale" for the code "soc" of the chambers, for example)
+
+        `code` can also be an enum member or a label, as the attributes of the decisions of the client.
+        """
+        if code is None:
+            return default
+        taxon = self.taxon(taxon_id, context)
+        resolved = taxon.code_of(code)
+        return default if resolved is None else taxon.labels.get(resolved, default)
+
+    def code(
+        self,
+        taxon_id: JudilibreTaxonEnum | str,
+        context: JurisdictionEnum | str,
+        label: JudilibreMultiValueEnum | str | None,
+        default: str | None = None,
+    ) -> str | None:
+        """Returns the code of a label ("soc" for the label "Chambre sociale" of the chambers, for example)
+
+        `label` can also be an enum member or a code, as the attributes of the decisions of the client.
+        """
+        if label is None:
+            return default
+        code = self.taxon(taxon_id, context).code_of(label)
+        return default if code is None else code
+
+    def labels(
+        self,
+        taxon_id: JudilibreTaxonEnum | str,
+        codes: Sequence | Any,
+        contexts: JurisdictionEnum | str | Sequence | Any,
+        default: str | None = None,
+    ) -> list | Any:
+        """Returns the labels of a column of codes
+
+        The taxon of each jurisdiction is fetched (if needed) once, and each distinct code is looked up once for
+        `pyarrow` arrays. Codes can also be lists of codes (as `publication`), whose labels are lists of labels.
+        As in `label`, codes can also be labels or enum members, as the columns of exported decisions.
+
+        Args:
+            taxon_id (JudilibreTaxonEnum | str): taxon of the codes
+            codes (Sequence | pyarrow.Array | pyarrow.ChunkedArray): column of codes (or labels)
+            contexts (JurisdictionEnum | str | Sequence | pyarrow.Array | pyarrow.ChunkedArray): jurisdiction of
+                all the codes, or column of the jurisdictions of the codes
+            default (str | None, optional): label of missing and unknown codes.
+                Defaults to None.
+
+        Returns:
+            list | pyarrow.Array: labels, as a list or as a `pyarrow` array if `codes` is one
+        """
+        if _is_arrow(codes):
+            return self._arrow_labels(taxon_id, codes, contexts, default)
+
+        tables: dict[Any, dict[str, str]] = {}
+        replace_enum = JudilibreMultiValueEnum.replace_enum
+
+        def labels_of(context) -> dict[str, str]:
+            if context not in tables:
+                tables[context] = {} if context is None else self.taxon(taxon_id, context).lookup
+            return tables[context]
+
+        def label(labels: dict[str, str], code) -> Any:
+            if isinstance(code, list):
+                return [labels.get(replace_enum(c), default) for c in code]
+            return default if code is None else labels.get(replace_enum(code), default)
+
+        if contexts is None or isinstance(contexts, (str, Enum)):
+            labels = labels_of(contexts)
+            return [label(labels, code) for code in codes]
+        if len(contexts) != len(codes):
+            raise JudilibreValueError(f"{len(codes)} codes but {len(contexts)} contexts")
+        return [label(labels_of(context), code) for code, context in zip(codes, contexts)]
+
+    def label_columns(
+        self,
+        batch: dict[str, Sequence] | Any,
+        columns: dict[str, JudilibreTaxonEnum] | None = None,
+        *,
+        context_column: str = "jurisdiction",
+        suffix: str = "_label",
+        default: str | None = None,
+    ) -> dict[str, Sequence] | Any:
+        """Adds the labels of the code columns of a batch of decisions, as `<column><suffix>` columns
+
+        The columns can hold codes (as the decisions of the API) or labels (as the decisions exported by
+        `pyjudilibre`, whose label columns then hold the labels of the current taxonomy).
+
+        Args:
+            batch (dict[str, Sequence] | pyarrow.Table): decisions, as a dictionary of columns or a `pyarrow` table
+            columns (dict[str, JudilibreTaxonEnum] | None, optional): columns to label, and their taxons; the
+                columns missing from the batch are ignored.
+                If `None`, `DEFAULT_LABEL_COLUMNS`.
+                Defaults to None.
+            context_column (str, optional): column of the jurisdictions of the decisions.
+                Defaults to "jurisdiction".
+            suffix (str, optional): suffix of the names of the label columns.
+                Defaults to "_label".
+            default (str | None, optional): label of missing and unknown codes.
+                Defaults to None.
+
+        Raises:
+            JudilibreValueError: if the batch has no `context_column`
+
+        Returns:
+            dict[str, Sequence] | pyarrow.Table: a new batch, with the label columns
+        """
+        columns = DEFAULT_LABEL_COLUMNS if columns is None else columns
+        names = batch.column_names if _is_arrow(batch) else list(batch)  # type: ignore
+        if context_column not in names:
+            raise JudilibreValueError(f"The batch has no {context_column} column")
+
+        labelled: Any = batch if _is_arrow(batch) else dict(batch)
+        for name, taxon_id in columns.items():
+            if name not in names:
+                continue
+            labels = self.labels(taxon_id, batch[name], batch[context_column], default=default)
+            if _is_arrow(batch):
+                labelled = labelled.append_column(f"{name}{suffix}", labels)
+            else:
+                labelled[f"{name}{suffix}"] = labels
+        return labelled
+
+    def _arrow_labels(self, taxon_id, codes, contexts, default: str | None):
+        """`labels` of a `pyarrow` array: the codes (and jurisdictions) are dictionary-encoded, a label is looked up
+        for each distinct (jurisdiction, code) pair, and the labels of the rows are taken from these labels"""
+        import pyarrow  # type: ignore
+        import pyarrow.compute  # type: ignore
+
+        if isinstance(codes, pyarrow.ChunkedArray):
+            codes = codes.combine_chunks()
+        single_context = contexts is None or isinstance(contexts, (str, Enum))
+        if not single_context:
+            contexts = pyarrow.array(contexts) if not _is_arrow(contexts) else contexts
+            if isinstance(contexts, pyarrow.ChunkedArray):
+                contexts = contexts.combine_chunks()
+            if len(contexts) != len(codes):
+                raise JudilibreValueError(f"{len(codes)} codes but {len(contexts)} contexts")
+
+        if pyarrow.types.is_list(codes.type):
+            # labels of the flattened lists, put back into lists
+            values = pyarrow.compute.list_flatten(codes)
+            if not single_context:
+                contexts = contexts.take(pyarrow.compute.list_parent_indices(codes))
+            offsets = pyarrow.compute.subtract(codes.offsets, codes.offsets[0])
+            labels = self._arrow_labels(taxon_id, values, contexts, default)
+            return pyarrow.ListArray.from_arrays(offsets, labels, mask=codes.is_null())
+
+        encoded = pyarrow.compute.dictionary_encode(codes)
+        distinct_codes = encoded.dictionary.to_pylist()
+        if single_context:
+            labels = {} if contexts is None else self.taxon(taxon_id, contexts).lookup
+            dictionary = [labels.get(code, default) for code in distinct_codes]
+            indices = encoded.indices
+        else:
+            encoded_contexts = pyarrow.compute.dictionary_encode(contexts)
+            dictionary = []
+            for context in encoded_contexts.dictionary.to_pylist():
+                labels = {} if context is None else self.taxon(taxon_id, context).lookup
+                dictionary.extend(labels.get(code, default) for code in distinct_codes)
+            indices = pyarrow.compute.add(
+                pyarrow.compute.multiply(encoded_contexts.indices.cast(pyarrow.int64()), len(distinct_codes)),
+                encoded.indices.cast(pyarrow.int64()),
+            )
+
+        labels_array = pyarrow.array(dictionary, type=pyarrow.string()).take(indices)
+        if default is not None:
+            labels_array = labels_array.fill_null(default)
+        return labels_array
+
+    def taxons(self) -> list[Taxon]:
+        """Returns the taxons held in memory (not those of the snapshot)"""
+        with self._lock:
+            return list(self._taxons.values())
+
+    def clear(self):
+        """Removes the taxons from memory (but not from the disk cache)"""
+        with self._lock:
+            self._taxons.clear()
+
+    def __len__(self) -> int:
+        return len(self._taxons)
+
+    def _fetch(self, taxon_id: str, context: str) -> Taxon:
+        """Fetches a taxon; the taxons that do not exist in (or do not apply to) a jurisdiction are empty"""
+        try:
+            labels = self.client.taxonomy(taxon_id, context)  # type: ignore
+        except (JudilibreResourceNotFoundError, JudilibreInvalidRequestError):
+            labels = {}
+        return Taxon(taxon_id=taxon_id, context=context, labels=labels)
+
+    def _load(self):
+        """Loads the taxons of the disk cache that are not expired"""
+        assert self.cache_path is not None
+        try:
+            with open(self.cache_path, encoding="utf-8") as cache_file:
+                cache = json.load(cache_file)
+        except FileNotFoundError:
+            return
+        except ValueError:
+            logger.warning("Ignoring the invalid taxonomy cache %s", self.cache_path)
+            return
+        if cache.get("version") != CACHE_VERSION or cache.get("url") != self.client.judilibre_api_url:
+            return
+
+        for entry in cache["taxons"]:
+            taxon = Taxon(**entry)
+            if not taxon.expired(self.ttl):
+                self._taxons[taxon.taxon_id, taxon.context] = taxon
+
+    def _save(self):
+        """Writes the taxons to the disk cache (through a temporary file, so that it is never half-written)"""
+        if self.cache_path is None:
+            return
+        with self._lock:
+            cache = {
+                "version": CACHE_VERSION,
+                "url": self.client.judilibre_api_url,
+                "taxons": [
+                    {"taxon_id": t.taxon_id, "context": t.context, "labels": t.labels, "fetched": t.fetched}
+                    for t in self._taxons.values()
+                ],
+            }
+        os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+        temporary_path = f"{self.cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as cache_file:
+            json.dump(cache, cache_file, ensure_ascii=False)
+        os.replace(temporary_path, self.cache_path)
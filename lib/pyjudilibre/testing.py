@@ -0,0 +1,756 @@
+"""Local stand-in for the **JUDILIBRE** API
+
+`JudilibreMockServer` serves a synthetic corpus of decisions on the endpoints used by `JudilibreClient`
+(`/decision`, `/search`, `/export`, `/scan`, `/stats`, `/taxonomy`, `/transactionalhistory`, `/healthcheck`
+and file downloads) so that the client can be tested, benchmarked and load-tested offline.
+
+```python
+from pyjudilibre import JudilibreClient
+from pyjudilibre.testing import JudilibreMockServer
+
+with JudilibreMockServer(corpus_size=10_000, latency=0.05) as server:
+    client = JudilibreClient(judilibre_api_url=server.url, judilibre_api_key=server.api_key)
+    decisions = client.paginate_scan(batch_size=1_000)
+```
+"""
+
+import datetime
+import gzip
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Mapping, NamedTuple
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from pyjudilibre.enums import (
+    ChamberCCEnum,
+    DecisionTypeCAEnum,
+    DecisionTypeCCEnum,
+    FormationCCEnum,
+    JudilibreDateTypeEnum,
+    JudilibreFieldEnum,
+    JudilibreFileTypeEnum,
+    JudilibreMultiValueEnum,
+    JudilibreOperatorEnum,
+    JudilibreOrderEnum,
+    JudilibreSortEnum,
+    JurisdictionEnum,
+    LocationCAEnum,
+    PublicationCCEnum,
+    SolutionCCEnum,
+)
+from pyjudilibre.transports import InMemoryTransport
+
+MAX_RESULT_WINDOW = 10_000
+
+_WORDS = (
+    "attendu que la cour d'appel a retenu que le contrat conclu entre les parties stipulait une clause "
+    "de non-concurrence dont la validite est contestee par le salarie qui soutient que l'employeur "
+    "n'a pas verse la contrepartie financiere prevue par la convention collective applicable au litige "
+    "par ces motifs casse et annule en toutes ses dispositions l'arret rendu entre les parties remet "
+    "en consequence la cause et les parties dans l'etat ou elles se trouvaient avant ledit arret"
+).split()
+
+_SOURCES = {
+    "cc": "jurinet",
+    "ca": "jurica",
+    "tj": "juritj",
+    "tcom": "juritcom",
+}
+
+_SHORT_DECISION_FIELDS = (
+    "id",
+    "decision_date",
+    "jurisdiction",
+    "number",
+    "numbers",
+    "publication",
+    "solution",
+    "particularInterest",
+    "location",
+    "chamber",
+    "ecli",
+    "type",
+    "files",
+    "themes",
+)
+
+
+class DecisionMetadata(NamedTuple):
+    """Lightweight metadata of a synthetic decision, used to filter and aggregate the corpus"""
+
+    position: int
+    id: str
+    decision_date: datetime.date
+    update_datetime: datetime.datetime
+    jurisdiction: str
+    location: str | None
+    chamber: str | None
+    solution: str
+    particular_interest: bool
+
+
+def _enum_codes(enum: type[JudilibreMultiValueEnum]) -> list[str | None]:
+    return [member._all_values[-1] for member in enum]  # type: ignore
+
+
+def _enum_taxon(enum: type[JudilibreMultiValueEnum]) -> dict[str, str]:
+    return {member._all_values[-1]: member.value for member in enum}  # type: ignore
+
+
+class SyntheticCorpus:
+    """Deterministic generator of **JUDILIBRE**-shaped decisions
+
+    Only the metadata of the decisions is kept in memory: texts, zones and files are generated on
+    demand so that large corpora (hundreds of thousands of decisions) remain cheap.
+    """
+
+    def __init__(
+        self,
+        size: int = 1_000,
+        *,
+        text_size: int = 2_000,
+        files_ratio: float = 0.1,
+        jurisdictions: list[str] | None = None,
+        date_start: datetime.date = datetime.date(2020, 1, 1),
+        date_end: datetime.date = datetime.date(2024, 12, 31),
+        seed: int = 0,
+    ):
+        """Constructor of the `SyntheticCorpus` class
+
+        Args:
+            size (int, optional): number of decisions in the corpus.
+                Defaults to 1_000.
+            text_size (int, optional): number of characters of the text of each decision.
+                Defaults to 2_000.
+            files_ratio (float, optional): share of Cour de cassation decisions with attached files.
+                Defaults to 0.1.
+            jurisdictions (list[str] | None, optional): jurisdiction codes to draw decisions from.
+                Defaults to all jurisdictions.
+            date_start (datetime.date, optional): minimal decision date.
+                Defaults to 2020-01-01.
+            date_end (datetime.date, optional): maximal decision date.
+                Defaults to 2024-12-31.
+            seed (int, optional): seed of the random generator.
+                Defaults to 0.
+        """
+        from pyjudilibre.locations import LocationTCOMEnum, LocationTJEnum
+
+        self.size = size
+        self.text_size = text_size
+        self.files_ratio = files_ratio
+        self.seed = seed
+
+        rng = random.Random(seed)
+        jurisdictions = jurisdictions or list(_SOURCES)
+        locations: dict[str, list[str | None]] = {
+            "cc": [None],
+            "ca": _enum_codes(LocationCAEnum),
+            "tj": _enum_codes(LocationTJEnum),
+            "tcom": _enum_codes(LocationTCOMEnum),
+        }
+        chambers = _enum_codes(ChamberCCEnum)
+        solutions = [str(code) for code in _enum_codes(SolutionCCEnum)]
+        n_days = (date_end - date_start).days
+
+        self.decisions: list[DecisionMetadata] = []
+        for index in range(size):
+            jurisdiction = rng.choice(jurisdictions)
+            decision_date = date_start + datetime.timedelta(days=rng.randint(0, n_days))
+            self.decisions.append(
+                DecisionMetadata(
+                    position=index,
+                    id=f"{index:024x}",
+                    decision_date=decision_date,
+                    update_datetime=datetime.datetime.combine(decision_date, datetime.time())
+                    + datetime.timedelta(days=rng.randint(0, 30), seconds=rng.randint(0, 86_399)),
+                    jurisdiction=jurisdiction,
+                    location=rng.choice(locations[jurisdiction]),
+                    chamber=rng.choice(chambers) if jurisdiction == "cc" else None,
+                    solution=rng.choice(solutions),
+                    particular_interest=rng.random() < 0.1,
+                )
+            )
+        self._by_id = {d.id: d for d in self.decisions}
+
+        base_text = " ".join(rng.choice(_WORDS) for _ in range(4_096))
+        self._base_text = base_text * (text_size // len(base_text) + 2)
+
+    def get(self, decision_id: str) -> DecisionMetadata | None:
+        """Returns the metadata of a decision based on its ID"""
+        return self._by_id.get(decision_id)
+
+    def text(self, metadata: DecisionMetadata) -> str:
+        """Returns the (deterministic) text of a decision"""
+        offset = (metadata.position * 7_919) % (len(self._base_text) - self.text_size)
+        return self._base_text[offset : offset + self.text_size]
+
+    def has_files(self, metadata: DecisionMetadata) -> bool:
+        """Returns True if the decision has attached files"""
+        return metadata.jurisdiction == "cc" and (metadata.position % 1_000) < self.files_ratio * 1_000
+
+    def decision(self, metadata: DecisionMetadata, base_url: str = "") -> dict:
+        """Returns the full payload of a decision, as returned by `/decision`"""
+        text = self.text(metadata)
+        step = len(text) // 6
+        bounds = [min(i * step, len(text)) for i in range(6)] + [len(text)]
+        zone_names = ["introduction", "expose", "moyens", "motivations", "dispositif", "annexes"]
+        zones = {name: [{"start": bounds[i], "end": bounds[i + 1]}] for i, name in enumerate(zone_names)}
+
+        decision = {
+            "id": metadata.id,
+            "source": _SOURCES[metadata.jurisdiction],
+            "text": text,
+            "update_date": metadata.update_datetime.date().isoformat(),
+            "update_datetime": metadata.update_datetime.isoformat(),
+            "decision_date": metadata.decision_date.isoformat(),
+            "jurisdiction": metadata.jurisdiction,
+            "number": f"{metadata.decision_date:%y}-{metadata.position % 100_000:05d}",
+            "numbers": [f"{metadata.decision_date:%y}-{metadata.position % 100_000:05d}"],
+            "publication": ["n"],
+            "solution": metadata.solution,
+            "particularInterest": metadata.particular_interest,
+            "type": "arret",
+            "ecli": f"ECLI:FR:{metadata.jurisdiction.upper()}:{metadata.decision_date.year}:{metadata.position}",
+            "themes": [],
+            "zones": zones,
+            **({"chamber": metadata.chamber} if metadata.chamber is not None else {}),
+            **({"location": metadata.location} if metadata.location is not None else {}),
+        }
+        if self.has_files(metadata):
+            decision["files"] = [
+                {
+                    "id": f"{metadata.id}-{code}",
+                    "name": f"{metadata.id}-{code}.pdf",
+                    "type": code,
+                    "isCommunication": False,
+                    "date": metadata.decision_date.isoformat(),
+                    "size": "1",
+                    "url": f"{base_url}/files/{metadata.id}-{code}.pdf",
+                    "rawUrl": f"{base_url}/files/{metadata.id}-{code}.pdf",
+                }
+                for code in ["prep_rapp", "prep_avis"]
+            ]
+        return decision
+
+    def short_decision(self, metadata: DecisionMetadata, base_url: str = "") -> dict:
+        """Returns the abridged payload of a decision (without text nor zones)"""
+        decision = self.decision(metadata, base_url=base_url)
+        return {key: decision[key] for key in _SHORT_DECISION_FIELDS if key in decision}
+
+    def filter(
+        self,
+        *,
+        jurisdictions: list[str] | None = None,
+        locations: list[str] | None = None,
+        date_start: datetime.date | None = None,
+        date_end: datetime.date | None = None,
+        date_type: str = "creation",
+        selection: bool = False,
+    ) -> list[DecisionMetadata]:
+        """Returns the metadata of the decisions matching the given filters"""
+
+        def date_of(metadata: DecisionMetadata) -> datetime.date:
+            if date_type == "update":
+                return metadata.update_datetime.date()
+            return metadata.decision_date
+
+        return [
+            d
+            for d in self.decisions
+            if (not jurisdictions or d.jurisdiction in jurisdictions)
+            and (not locations or d.location in locations)
+            and (date_start is None or date_of(d) >= date_start)
+            and (date_end is None or date_of(d) <= date_end)
+            and (not selection or d.particular_interest)
+        ]
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    # fast compression levels: the mock server should not be the bottleneck of the benchmarks
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=1)
+    if encoding == "br":
+        import brotli  # type: ignore
+
+        return brotli.compress(body, quality=1)
+    if encoding == "zstd":
+        import zstandard  # type: ignore
+
+        return zstandard.ZstdCompressor(level=1).compress(body)
+    raise ValueError(f"Unsupported encoding {encoding}")
+
+
+class _MockRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately: without TCP_NODELAY, keep-alive clients wait for delayed ACKs
+    disable_nagle_algorithm = True
+    server: "_MockHTTPServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.mock.handle(self)
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # the default backlog (5) drops the connections of concurrent clients, which are retried after 1s
+    request_queue_size = 128
+
+    def __init__(self, address, mock: "JudilibreMockServer"):
+        super().__init__(address, _MockRequestHandler)
+        self.mock = mock
+
+
+class MockRequest(NamedTuple):
+    """A request received by the mock server"""
+
+    method: str
+    path: str
+    parameters: dict[str, list[str]]
+    headers: dict[str, str]
+
+
+class JudilibreMockServer:
+    """Local HTTP server implementing the **JUDILIBRE** API on a synthetic corpus
+
+    The server runs in a background thread (one thread per connection) and can be used as a context manager.
+    Latency, errors and payload sizes can be changed at any time through the attributes of the same name.
+    """
+
+    def __init__(
+        self,
+        corpus: SyntheticCorpus | None = None,
+        *,
+        corpus_size: int = 1_000,
+        text_size: int = 2_000,
+        file_size: int = 100_000,
+        latency: float = 0.0,
+        latency_per_result: float = 0.0,
+        error_rate: float = 0.0,
+        error_codes: tuple[int, ...] = (429, 500),
+        api_key: str | None = "mock-api-key",
+        encodings: tuple[str, ...] = ("gzip",),
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int = 0,
+    ):
+        """Constructor of the `JudilibreMockServer` class
+
+        Args:
+            corpus (SyntheticCorpus | None, optional): corpus to serve.
+                If `None`, a corpus is generated from `corpus_size`, `text_size` and `seed`.
+                Defaults to None.
+            corpus_size (int, optional): number of decisions of the generated corpus.
+                Defaults to 1_000.
+            text_size (int, optional): number of characters of the texts of the generated corpus.
+                Defaults to 2_000.
+            file_size (int, optional): size in bytes of the attached files.
+                Defaults to 100_000.
+            latency (float, optional): number of seconds to wait before answering each request.
+                Defaults to 0.0.
+            latency_per_result (float, optional): number of seconds to wait per result of a paginated response,
+                on top of `latency`.
+                Defaults to 0.0.
+            error_rate (float, optional): probability to answer a request with one of `error_codes`.
+                Defaults to 0.0.
+            error_codes (tuple[int, ...], optional): status codes used for random errors.
+                Defaults to (429, 500).
+            api_key (str | None, optional): expected `KeyId` header. If `None`, no authentication is performed.
+                Defaults to "mock-api-key".
+            encodings (tuple[str, ...], optional): content codings ("gzip", "br", "zstd") used for the JSON
+                responses and files of more than 1 kB, in order of preference, when the client accepts them.
+                Defaults to ("gzip",).
+            host (str, optional): host to bind to.
+                Defaults to "127.0.0.1".
+            port (int, optional): port to bind to (0 picks a free port).
+                Defaults to 0.
+            seed (int, optional): seed of the random generators.
+                Defaults to 0.
+        """
+        self.corpus = corpus or SyntheticCorpus(size=corpus_size, text_size=text_size, seed=seed)
+        self.file_size = file_size
+        self.latency = latency
+        self.latency_per_result = latency_per_result
+        self.error_rate = error_rate
+        self.error_codes = error_codes
+        self.api_key = api_key
+        self.encodings = encodings
+
+        self.requests: list[MockRequest] = []
+        self._injected_errors: list[int] = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self._routes: dict[str, Callable[[dict[str, list[str]]], tuple[int, dict]]] = {
+            "/healthcheck": self._healthcheck,
+            "/decision": self._decision,
+            "/search": self._search,
+            "/export": self._export,
+            "/scan": self._scan,
+            "/stats": self._stats,
+            "/taxonomy": self._taxonomy,
+            "/transactionalhistory": self._transactional_history,
+        }
+
+        self._host = host
+        self._httpd = _MockHTTPServer((host, port), mock=self)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the mock API"""
+        return f"http://{self._host}:{self._httpd.server_port}"
+
+    @property
+    def request_count(self) -> int:
+        """Number of requests received since the start (or the last `reset`)"""
+        return len(self.requests)
+
+    def count(self, path: str) -> int:
+        """Number of requests received on a given endpoint"""
+        return sum(1 for r in self.requests if r.path == path)
+
+    def reset(self):
+        """Clears the request log and the injected errors"""
+        with self._lock:
+            self.requests.clear()
+            self._injected_errors.clear()
+
+    def inject_errors(self, status: int, count: int = 1):
+        """Answers the next `count` requests with the given status code"""
+        with self._lock:
+            self._injected_errors.extend([status] * count)
+
+    def start(self) -> "JudilibreMockServer":
+        """Starts serving in a background thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, args=(0.05,), daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops the server and releases its socket"""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "JudilibreMockServer":
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    # REQUEST HANDLING
+
+    def handle(self, handler: BaseHTTPRequestHandler):
+        """Answers a request received by the HTTP server"""
+        status, headers, body = self.respond(handler.command, handler.path, dict(handler.headers.items()))
+        handler.send_response(status)
+        for key, value in headers.items():
+            handler.send_header(key, value)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def respond(self, method: str, target: str, headers: Mapping[str, str]) -> tuple[int, dict[str, str], bytes]:
+        """Answers a request, without network
+
+        Args:
+            method (str): HTTP method
+            target (str): path and query string of the request (a full URL is accepted too)
+            headers (Mapping[str, str]): request headers
+
+        Returns:
+            tuple[int, dict[str, str], bytes]: status code, headers and body of the response
+        """
+        parsed_url = urlparse(target)
+        path = "/" + parsed_url.path.strip("/")
+        parameters = parse_qs(parsed_url.query, keep_blank_values=True)
+        lower_headers = {key.lower(): value for key, value in headers.items()}
+
+        with self._lock:
+            self.requests.append(
+                MockRequest(
+                    method=method,
+                    path=path,
+                    parameters=parameters,
+                    headers=dict(headers),
+                )
+            )
+            injected_error = self._injected_errors.pop(0) if self._injected_errors else None
+            if injected_error is None and self.error_rate and self._random.random() < self.error_rate:
+                injected_error = self._random.choice(self.error_codes)
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if self.api_key is not None and lower_headers.get("keyid") != self.api_key:
+            return self._json(401, {"message": "Invalid credentials"})
+        if injected_error is not None:
+            return self._json(injected_error, {"message": "Injected error"}, {"Retry-After": "0"})
+
+        if path.startswith("/files/"):
+            status, response_headers = 200, {"Content-Type": "application/pdf"}
+            body = b"%PDF" + b"\0" * max(self.file_size - 4, 0)
+        else:
+            route = self._routes.get(path)
+            if route is None:
+                return self._json(404, {"message": "Not found"})
+
+            try:
+                status, payload = route(parameters)
+            except (KeyError, ValueError) as exc:
+                status, payload = 400, {"message": f"Invalid request: {exc}"}
+            if self.latency_per_result and isinstance(payload.get("results"), list):
+                time.sleep(self.latency_per_result * len(payload["results"]))
+            status, response_headers, body = self._json(status, payload)
+
+        accepted = {coding.split(";")[0].strip() for coding in lower_headers.get("accept-encoding", "").split(",")}
+        encoding = next((e for e in self.encodings if e in accepted), None)
+        if encoding is not None and len(body) > 1_024:
+            response_headers["Content-Encoding"] = encoding
+            body = _compress(body, encoding)
+        return status, response_headers, body
+
+    @staticmethod
+    def _json(status: int, payload: dict, headers: dict | None = None) -> tuple[int, dict[str, str], bytes]:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        return status, {"Content-Type": "application/json; charset=utf-8", **(headers or {})}, body
+
+    def transport(self) -> InMemoryTransport:
+        """Returns a transport answering the requests of a `JudilibreClient` directly, without sockets
+
+        The server does not need to be started; the client can use any `judilibre_api_url`.
+        """
+        return InMemoryTransport(lambda method, url, headers: self.respond(method, url, headers))
+
+    # ENDPOINTS
+
+    @staticmethod
+    def _first(parameters: dict[str, list[str]], key: str, default: str | None = None) -> str | None:
+        return parameters.get(key, [default])[0]
+
+    def _filtered(self, parameters: dict[str, list[str]]) -> list[DecisionMetadata]:
+        date_start = self._first(parameters, "date_start")
+        date_end = self._first(parameters, "date_end")
+        return self.corpus.filter(
+            jurisdictions=parameters.get("jurisdiction"),
+            locations=parameters.get("location"),
+            date_start=datetime.date.fromisoformat(date_start) if date_start else None,
+            date_end=datetime.date.fromisoformat(date_end) if date_end else None,
+            date_type=self._first(parameters, "date_type", "creation") or "creation",
+            selection=self._first(parameters, "particularInterest") == "true",
+        )
+
+    def _payload(self, metadata: DecisionMetadata, parameters: dict[str, list[str]]) -> dict:
+        if self._first(parameters, "abridged") == "true":
+            return self.corpus.short_decision(metadata, base_url=self.url)
+        return self.corpus.decision(metadata, base_url=self.url)
+
+    def _healthcheck(self, parameters: dict[str, list[str]]) -> tuple[int, dict]:
+        return 200, {"status": "disponible"}
+
+    def _decision(self, parameters: dict[str, list[str]]) -> tuple[int, dict]:
+        metadata = self.corpus.get(self._first(parameters, "id", "") or "")
+        if metadata is None:
+            return 404, {"message": "Decision not found"}
+        return 200, self.corpus.decision(metadata, base_url=self.url)
+
+    def _search(self, parameters: dict[str, list[str]]) -> tuple[int, dict]:
+        page = int(self._first(parameters, "page", "0"))  # type: ignore
+        page_size = int(self._first(parameters, "page_size", "10"))  # type: ignore
+        if not 0 < page_size <= 50 or (page + 1) * page_size > MAX_RESULT_WINDOW:
+            return 400, {"message": "page_size must be in ]0, 50] and page * page_size <= 10000"}
+
+        query = self._first(parameters, "query", "") or ""
+        seed = sum(query.encode("utf-8"))
+        matches = [d for d in self._filtered(parameters) if (d.position + seed) % 3 == 0]
+
+        results = []
+        for rank, metadata in enumerate(matches[page * page_size : (page + 1) * page_size], start=page * page_size):
+            results.append(
+                {
+                    **self.corpus.short_decision(metadata, base_url=self.url),
+                    "score": 1.0 / (1 + rank),
+                    "highlights": {"text": [query]},
+                }
+            )
+
+        has_next_page = (page + 1) * page_size < min(len(matches), MAX_RESULT_WINDOW)
+        next_page = urlencode({**{k: v[0] for k, v in parameters.items()}, "page": page + 1}) if has_next_page else None
+        return 200, {
+            "page": page,
+            "page_size": page_size,
+            "total": len(matches),
+            "next_page": next_page,
+            "results": results,
+        }
+
+    def _export(self, parameters: dict[str, list[str]]) -> tuple[int, dict]:
+        batch = int(self._first(parameters, "batch", "0"))  # type: ignore
+        batch_size = int(self._first(parameters, "batch_size", "10"))  # type: ignore
+        if not 0 < batch_size <= 1_000 or (batch + 1) * batch_size > MAX_RESULT_WINDOW:
+            return 400, {"message": "batch_size must be in ]0, 1000] and batch * batch_size <= 10000"}
+
+        matches = self._filtered(parameters)
+        selected = matches[batch * batch_size : (batch + 1) * batch_size]
+
+        has_next_batch = (batch + 1) * batch_size < min(len(matches), MAX_RESULT_WINDOW)
+        next_batch = (
+            urlencode({**{k: v[0] for k, v in parameters.items()}, "batch": batch + 1}) if has_next_batch else None
+        )
+        return 200, {
+            "batch": batch,
+            "batch_size": batch_size,
+            "total": len(matches),
+            "next_batch": next_batch,
+            "results": [self._payload(m, parameters) for m in selected],
+        }
+
+    def _scan(self, parameters: dict[str, list[str]]) -> tuple[int, dict]:
+        batch_size = int(self._first(parameters, "batch_size", "10"))  # type: ignore
+        if not 0 < batch_size <= 1_000:
+            return 400, {"message": "batch_size must be in ]0, 1000]"}
+
+        search_after = self._first(parameters, "searchAfter")
+        matches = self._filtered(parameters)
+        if search_after is not None:
+            matches_after = [m for m in matches if m.id > search_after]
+        else:
+            matches_after = matches
+        selected = matches_after[:batch_size]
+
+        next_batch = None
+        if len(matches_after) > batch_size:
+            next_batch = urlencode(
+                {**{k: v[0] for k, v in parameters.items() if k != "searchAfter"}, "searchAfter": selected[-1].id}
+            )
+        return 200, {
+            "total": len(matches),
+            "next_batch": next_batch,
+            "results": [self._payload(m, parameters) for m in selected],
+        }
+
+    def _stats(self, parameters: dict[str, list[str]]) -> tuple[int, dict]:
+        matches = self._filtered(parameters)
+        keys = parameters.get("keys", [])
+
+        def key_of(metadata: DecisionMetadata) -> tuple:
+            values = {
+                "jurisdiction": metadata.jurisdiction,
+                "location": metadata.location,
+                "source": _SOURCES[metadata.jurisdiction],
+                "year": metadata.decision_date.year,
+                "month": f"{metadata.decision_date:%Y-%m}",
+                "chamber": metadata.chamber,
+                "solution": metadata.solution,
+                "particularInterest": metadata.particular_interest,
+            }
+            return tuple((k, values[k]) for k in keys if k in values)
+
+        aggregated: dict[tuple, int] = {}
+        if keys:
+            for metadata in matches:
+                key = key_of(metadata)
+                aggregated[key] = aggregated.get(key, 0) + 1
+
+        dates = [m.decision_date for m in matches]
+        return 200, {
+            "results": {
+                "min_decision_date": min(dates).isoformat() if dates else None,
+                "max_decision_date": max(dates).isoformat() if dates else None,
+                "total_decisions": len(matches),
+                "aggregated_data": [
+                    {"key": {k: v for k, v in key if v is not None}, "decisions_count": count}
+                    for key, count in sorted(aggregated.items(), key=lambda item: str(item[0]))
+                ],
+            },
+            "query": {
+                **({"date_start": self._first(parameters, "date_start")} if "date_start" in parameters else {}),
+                **({"date_end": self._first(parameters, "date_end")} if "date_end" in parameters else {}),
+                **({"date_type": self._first(parameters, "date_type")} if "date_type" in parameters else {}),
+                **({"jurisdiction": parameters["jurisdiction"]} if "jurisdiction" in parameters else {}),
+                **({"location": parameters["location"]} if "location" in parameters else {}),
+                **({"keys": keys} if keys else {}),
+            },
+        }
+
+    def _taxonomy(self, parameters: dict[str, list[str]]) -> tuple[int, dict]:
+        from pyjudilibre.locations import LocationTCOMEnum, LocationTJEnum
+
+        taxon_id = self._first(parameters, "id", "")
+        context = self._first(parameters, "context_value", "cc")
+
+        locations: dict[str | None, dict[str, str]] = {
+            "ca": _enum_taxon(LocationCAEnum),
+            "tj": _enum_taxon(LocationTJEnum),
+            "tcom": _enum_taxon(LocationTCOMEnum),
+        }
+        taxons: dict[str | None, dict[str, str]] = {
+            "jurisdiction": _enum_taxon(JurisdictionEnum),
+            "chamber": _enum_taxon(ChamberCCEnum),
+            "formation": _enum_taxon(FormationCCEnum),
+            "publication": _enum_taxon(PublicationCCEnum),
+            "solution": _enum_taxon(SolutionCCEnum),
+            "type": _enum_taxon(DecisionTypeCCEnum if context == "cc" else DecisionTypeCAEnum),
+            "location": locations.get(context, {}),
+            "theme": {f"theme{i}": f"Thème n°{i}" for i in range(100)},
+            "field": _enum_taxon(JudilibreFieldEnum),
+            "filetype": _enum_taxon(JudilibreFileTypeEnum),
+            "date_type": _enum_taxon(JudilibreDateTypeEnum),
+            "sort": _enum_taxon(JudilibreSortEnum),
+            "operator": _enum_taxon(JudilibreOperatorEnum),
+            "order": _enum_taxon(JudilibreOrderEnum),
+        }
+        if taxon_id not in taxons:
+            return 404, {"message": f"Taxon {taxon_id} not found"}
+        taxon = taxons[taxon_id]
+
+        key = self._first(parameters, "key")
+        value = self._first(parameters, "value")
+        if key is not None:
+            if key not in taxon:
+                return 404, {"message": f"Key {key} not found"}
+            return 200, {"id": taxon_id, "context_value": context, "result": {"key": key, "value": taxon[key]}}
+        if value is not None:
+            keys = [k for k, v in taxon.items() if v == value]
+            if not keys:
+                return 404, {"message": f"Value {value} not found"}
+            return 200, {"id": taxon_id, "context_value": context, "result": {"key": keys[0], "value": value}}
+        return 200, {"id": taxon_id, "context_value": context, "result": taxon}
+
+    def _transactional_history(self, parameters: dict[str, list[str]]) -> tuple[int, dict]:
+        date = datetime.datetime.fromisoformat(self._first(parameters, "date", "") or "")
+        page_size = int(self._first(parameters, "page_size", "500"))  # type: ignore
+        if not 0 < page_size <= 1_000:
+            return 400, {"message": "page_size must be in ]0, 1000]"}
+        from_id = self._first(parameters, "from_id")
+
+        transactions = sorted(
+            (d for d in self.corpus.decisions if d.update_datetime >= date),
+            key=lambda d: (d.update_datetime, d.id),
+        )
+        start = 0
+        if from_id is not None:
+            start = next((i + 1 for i, d in enumerate(transactions) if d.id == from_id), len(transactions))
+        selected = transactions[start : start + page_size]
+
+        next_page = None
+        if start + page_size < len(transactions):
+            next_page = urlencode(
+                {"date": self._first(parameters, "date"), "page_size": page_size, "from_id": selected[-1].id}
+            )
+        return 200, {
+            "total": len(transactions),
+            "next_page": next_page,
+            "transactions": [
+                {"id": d.id, "action": "created", "date": d.update_datetime.isoformat()} for d in selected
+            ],
+        }
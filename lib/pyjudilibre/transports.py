@@ -0,0 +1,719 @@
+"""Transports used by `JudilibreClient` to send HTTP requests
+
+A transport sends a request and returns a `JudilibreTransportResponse` (status code, headers and body stream),
+whatever the status code is: turning HTTP errors into exceptions is the job of `JudilibreClient`.
+
+Network errors (connection errors, timeouts, ...) are raised as `OSError`, whatever the transport.
+
+- `UrllibTransport` (default) relies on `urllib.request`
+- `PooledTransport` relies on `http.client` and reuses keep-alive connections
+- `HttpxTransport` relies on `httpx` (optional dependency) and supports HTTP/2
+- `InMemoryTransport` answers requests with a Python function, without network
+- `CassetteTransport` records the responses of another transport into a compressed file and replays them
+  without network, for deterministic tests and profiling sessions
+
+Transports return bodies as they were sent by the server: `ContentDecoder` decompresses them incrementally,
+whatever their `Content-Encoding` (gzip and deflate, plus br and zstd when `brotli` and `zstandard` are installed).
+"""
+
+import base64
+import functools
+import gzip
+import http.client
+import importlib.util
+import io
+import json
+import queue
+import ssl
+import threading
+import urllib.error
+import urllib.request
+import zlib
+from typing import BinaryIO, Callable, Iterable, Iterator, Mapping
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from pyjudilibre.exceptions import JudilibreCassetteMissError, JudilibreValueError
+
+
+@functools.cache
+def accept_encoding() -> str:
+    """Value of the `Accept-Encoding` header listing the content codings that `ContentDecoder` can decode"""
+    encodings = ["gzip", "deflate"]
+    for encoding, modules in [("br", ("brotli", "brotlicffi")), ("zstd", ("zstandard",))]:
+        if any(importlib.util.find_spec(module) is not None for module in modules):
+            encodings.append(encoding)
+    return ", ".join(encodings)
+
+
+class ContentDecoder:
+    """Incremental decoder of the `Content-Encoding` of a response body
+
+    ```python
+    decoder = ContentDecoder(response.headers.get("content-encoding"))
+    while chunk := response.read(65_536):
+        output.write(decoder.decompress(chunk))
+    output.write(decoder.flush())
+    ```
+    """
+
+    def __init__(self, content_encoding: str | None):
+        """Constructor of the `ContentDecoder` class
+
+        Args:
+            content_encoding (str | None): value of the `Content-Encoding` header (codings are applied in order)
+
+        Raises:
+            JudilibreValueError: raised if a coding is not supported (or its optional library is not installed)
+        """
+        codings = [c.strip().lower() for c in (content_encoding or "").split(",")]
+        # the last coding applied by the server is the first one to undo
+        self._decompressors = [self._decompressor(c) for c in reversed(codings) if c not in ("", "identity")]
+
+    @staticmethod
+    def _decompressor(coding: str):
+        if coding in ("gzip", "x-gzip"):
+            return zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if coding == "deflate":
+            return zlib.decompressobj()
+        if coding == "br":
+            try:
+                import brotli  # type: ignore
+            except ImportError:
+                try:
+                    import brotlicffi as brotli  # type: ignore
+                except ImportError:
+                    raise JudilibreValueError("Decoding br content requires brotli or brotlicffi") from None
+            return _BrotliDecompressor(brotli.Decompressor())
+        if coding == "zstd":
+            try:
+                import zstandard  # type: ignore
+            except ImportError:
+                raise JudilibreValueError("Decoding zstd content requires zstandard") from None
+            return zstandard.ZstdDecompressor().decompressobj()
+        raise JudilibreValueError(f"Unsupported Content-Encoding {coding}")
+
+    @property
+    def identity(self) -> bool:
+        """True if the body is not encoded"""
+        return not self._decompressors
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decodes a chunk of the body"""
+        for decompressor in self._decompressors:
+            data = decompressor.decompress(data)
+        return data
+
+    def flush(self) -> bytes:
+        """Returns the remaining decoded data, once the whole body has been read"""
+        data = b""
+        for decompressor in self._decompressors:
+            data = (decompressor.decompress(data) if data else b"") + decompressor.flush()
+        return data
+
+
+class _BrotliDecompressor:
+    def __init__(self, decompressor):
+        self._decompressor = decompressor
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompressor.process(data)
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class JudilibreTransportResponse:
+    """Response returned by a transport
+
+    Attributes:
+        status (int): HTTP status code
+        headers (dict[str, str]): response headers, with lower-case names
+        body (BinaryIO): file-like object streaming the body of the response
+    """
+
+    def __init__(
+        self,
+        status: int,
+        headers: Mapping[str, str] | Iterable[tuple[str, str]],
+        body: BinaryIO,
+    ):
+        self.status = status
+        items = headers.items() if isinstance(headers, Mapping) else headers
+        self.headers = {key.lower(): value for key, value in items}
+        self.body = body
+
+    def read(self, size: int = -1) -> bytes:
+        """Reads (at most `size` bytes of) the body"""
+        return self.body.read(size)
+
+    def close(self):
+        """Releases the resources (connection, file, ...) attached to the response"""
+        self.body.close()
+
+    def __enter__(self) -> "JudilibreTransportResponse":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class JudilibreTransport:
+    """Interface of the transports used by `JudilibreClient`
+
+    `send` can be called by several threads at once, when a client is shared by a thread pool.
+    """
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        timeout: float | None = None,
+    ) -> JudilibreTransportResponse:
+        """Sends a request and returns its response, whatever its status code
+
+        Raises:
+            OSError: raised on network errors (connection errors, timeouts, ...)
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Releases the resources of the transport"""
+
+
+class UrllibTransport(JudilibreTransport):
+    """Transport relying on `urllib.request` (thread-safe: each request opens its own connection)"""
+
+    def __init__(
+        self,
+        http_proxy: str | None = None,
+        https_proxy: str | None = None,
+        *,
+        url_opener: urllib.request.OpenerDirector | None = None,
+    ):
+        """Constructor of the `UrllibTransport` class
+
+        Args:
+            http_proxy (str | None, optional): proxy for HTTP requests.
+                Defaults to None.
+            https_proxy (str | None, optional): proxy for HTTPS requests.
+                Defaults to None.
+            url_opener (urllib.request.OpenerDirector | None, optional): opener to use instead of building one.
+                Defaults to None.
+        """
+        if url_opener is None:
+            proxies = {
+                **({"http": http_proxy} if http_proxy else {}),
+                **({"https": https_proxy} if https_proxy else {}),
+            }
+            url_opener = urllib.request.build_opener(urllib.request.ProxyHandler(proxies=proxies))
+        self.url_opener = url_opener
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        timeout: float | None = None,
+    ) -> JudilibreTransportResponse:
+        request = urllib.request.Request(method=method, url=url, headers=dict(headers))
+        try:
+            response = self.url_opener.open(request, timeout=timeout)
+        except urllib.error.HTTPError as exc:
+            return JudilibreTransportResponse(
+                status=exc.status or exc.code,
+                headers=exc.headers.items() if exc.headers else {},
+                body=exc,  # type: ignore
+            )
+        except urllib.error.URLError as exc:
+            if isinstance(exc.reason, TimeoutError):
+                raise TimeoutError(f"{method} {url} timed out") from exc
+            raise
+        return JudilibreTransportResponse(
+            status=response.status,
+            headers=response.headers.items(),
+            body=response,
+        )
+
+
+class _PooledBody(io.RawIOBase):
+    """Body of a `PooledTransport` response, giving the connection back to the pool once fully read"""
+
+    def __init__(self, response: http.client.HTTPResponse, release: Callable[[bool], None]):
+        self._response = response
+        self._release = release
+        self._released = False
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> bytes:
+        data = self._response.read(None if size is None or size < 0 else size)
+        if self._response.isclosed():
+            self._finish(reusable=not self._response.will_close)
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def _finish(self, reusable: bool):
+        if not self._released:
+            self._released = True
+            self._release(reusable)
+
+    def close(self):
+        if not self._response.isclosed():
+            # the body was not fully read: the connection cannot be reused
+            self._response.close()
+            self._finish(reusable=False)
+        self._finish(reusable=not self._response.will_close)
+        super().close()
+
+
+class PooledTransport(JudilibreTransport):
+    """Transport relying on `http.client`, reusing keep-alive connections (thread-safe)
+
+    Idle connections are kept in a pool per host (at most `max_connections` per host), which saves a TCP
+    and TLS handshake per request compared to `UrllibTransport`.
+    """
+
+    def __init__(
+        self,
+        http_proxy: str | None = None,
+        https_proxy: str | None = None,
+        *,
+        max_connections: int = 10,
+        ssl_context: ssl.SSLContext | None = None,
+    ):
+        """Constructor of the `PooledTransport` class
+
+        Args:
+            http_proxy (str | None, optional): proxy for HTTP requests.
+                Defaults to None.
+            https_proxy (str | None, optional): proxy for HTTPS requests.
+                Defaults to None.
+            max_connections (int, optional): maximal number of idle connections kept per host.
+                Defaults to 10.
+            ssl_context (ssl.SSLContext | None, optional): SSL context of the HTTPS connections.
+                Defaults to `ssl.create_default_context()`.
+        """
+        self.proxies = {
+            **({"http": urlsplit(http_proxy)} if http_proxy else {}),
+            **({"https": urlsplit(https_proxy)} if https_proxy else {}),
+        }
+        self.max_connections = max_connections
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self._pools: dict[tuple[str, str, int], queue.LifoQueue] = {}
+        self._lock = threading.Lock()
+
+    def _pool(self, key: tuple[str, str, int]) -> queue.LifoQueue:
+        with self._lock:
+            if key not in self._pools:
+                self._pools[key] = queue.LifoQueue(maxsize=self.max_connections)
+            return self._pools[key]
+
+    def _new_connection(self, scheme: str, host: str, port: int, timeout: float | None) -> http.client.HTTPConnection:
+        proxy = self.proxies.get(scheme)
+        if proxy is None:
+            if scheme == "https":
+                return http.client.HTTPSConnection(host, port, timeout=timeout, context=self.ssl_context)
+            return http.client.HTTPConnection(host, port, timeout=timeout)
+
+        proxy_port = proxy.port or (443 if proxy.scheme == "https" else 80)
+        if scheme == "https":
+            connection: http.client.HTTPConnection = http.client.HTTPSConnection(
+                proxy.hostname or "", proxy_port, timeout=timeout, context=self.ssl_context
+            )
+            connection.set_tunnel(host, port)
+            return connection
+        return http.client.HTTPConnection(proxy.hostname or "", proxy_port, timeout=timeout)
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        timeout: float | None = None,
+    ) -> JudilibreTransportResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, host, port)
+        pool = self._pool(key)
+
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        if scheme == "http" and scheme in self.proxies:
+            target = url
+
+        while True:
+            try:
+                connection, reused = pool.get_nowait(), True
+            except queue.Empty:
+                connection, reused = self._new_connection(scheme, host, port, timeout), False
+
+            connection.timeout = timeout
+            try:
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                connection.request(method, target, headers=dict(headers))
+                response = connection.getresponse()
+            except (ConnectionError, http.client.HTTPException) as exc:
+                connection.close()
+                if reused:
+                    # the server closed an idle connection: try again with another one
+                    continue
+                if isinstance(exc, http.client.HTTPException):
+                    raise ConnectionError(f"{method} {url} failed: {exc!r}") from exc
+                raise
+            except BaseException:
+                connection.close()
+                raise
+            break
+
+        def release(reusable: bool, connection: http.client.HTTPConnection = connection):
+            if not reusable:
+                connection.close()
+                return
+            try:
+                pool.put_nowait(connection)
+            except queue.Full:
+                connection.close()
+
+        return JudilibreTransportResponse(
+            status=response.status,
+            headers=response.getheaders(),
+            body=_PooledBody(response, release=release),  # type: ignore
+        )
+
+    def close(self):
+        """Closes all the idle connections"""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            while True:
+                try:
+                    pool.get_nowait().close()
+                except queue.Empty:
+                    break
+
+
+class _IteratorBody(io.RawIOBase):
+    """File-like object reading from an iterator of chunks"""
+
+    def __init__(self, chunks: Iterator[bytes], close: Callable[[], None]):
+        self._chunks = chunks
+        self._buffer = b""
+        self._close = close
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> bytes:
+        if size is None or size < 0:
+            data = self._buffer + b"".join(self._chunks)
+            self._buffer = b""
+            return data
+        while len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self):
+        self._close()
+        super().close()
+
+
+class HttpxTransport(JudilibreTransport):
+    """Transport relying on `httpx` (optional dependency), with connection pooling and optional HTTP/2
+
+    Requires `pip install 'pyjudilibre[httpx]'` (which also installs `h2` for HTTP/2).
+    """
+
+    def __init__(
+        self,
+        http_proxy: str | None = None,
+        https_proxy: str | None = None,
+        *,
+        http2: bool = False,
+        client=None,
+    ):
+        """Constructor of the `HttpxTransport` class
+
+        Args:
+            http_proxy (str | None, optional): proxy for HTTP requests.
+                Defaults to None.
+            https_proxy (str | None, optional): proxy for HTTPS requests.
+                Defaults to None.
+            http2 (bool, optional): enables HTTP/2.
+                Defaults to False.
+            client (httpx.Client | None, optional): client to use instead of building one.
+                Defaults to None.
+
+        Raises:
+            ImportError: raised if `httpx` is not installed
+        """
+        try:
+            import httpx
+        except ImportError as exc:
+            raise ImportError("HttpxTransport requires httpx: pip install 'pyjudilibre[httpx]'") from exc
+
+        self._httpx = httpx
+        if client is None:
+            client = httpx.Client(
+                http2=http2,
+                mounts={
+                    "http://": httpx.HTTPTransport(proxy=http_proxy),
+                    "https://": httpx.HTTPTransport(proxy=https_proxy, http2=http2),
+                },
+            )
+        self.client = client
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        timeout: float | None = None,
+    ) -> JudilibreTransportResponse:
+        httpx = self._httpx
+        try:
+            request = self.client.build_request(method, url, headers=dict(headers), timeout=timeout)
+            response = self.client.send(request, stream=True)
+        except httpx.TimeoutException as exc:
+            raise TimeoutError(f"{method} {url} timed out") from exc
+        except httpx.TransportError as exc:
+            raise ConnectionError(f"{method} {url} failed: {exc!r}") from exc
+
+        return JudilibreTransportResponse(
+            status=response.status_code,
+            headers=response.headers.multi_items(),
+            body=_IteratorBody(response.iter_raw(), close=response.close),  # type: ignore
+        )
+
+    def close(self):
+        """Closes the underlying `httpx.Client`"""
+        self.client.close()
+
+
+InMemoryHandler = Callable[[str, str, Mapping[str, str]], tuple[int, Mapping[str, str], bytes]]
+
+
+class InMemoryTransport(JudilibreTransport):
+    """Transport answering requests with a Python function, without network
+
+    ```python
+    def handler(method, url, headers):
+        return 200, {"content-type": "application/json"}, b'{"status": "disponible"}'
+
+    client = JudilibreClient(transport=InMemoryTransport(handler), ...)
+    ```
+
+    `JudilibreMockServer.transport()` returns an `InMemoryTransport` serving the mock API without sockets.
+    """
+
+    def __init__(self, handler: InMemoryHandler):
+        """Constructor of the `InMemoryTransport` class
+
+        Args:
+            handler (InMemoryHandler): function taking the method, the URL and the headers of a request
+                and returning its status code, headers and body
+        """
+        self.handler = handler
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        timeout: float | None = None,
+    ) -> JudilibreTransportResponse:
+        status, response_headers, body = self.handler(method, url, headers)
+        return JudilibreTransportResponse(
+            status=status,
+            headers=response_headers,
+            body=io.BytesIO(body),
+        )
+
+
+TRANSPORTS: dict[str, type[JudilibreTransport]] = {
+    "urllib": UrllibTransport,
+    "pooled": PooledTransport,
+    "httpx": HttpxTransport,
+}
+
+
+def build_transport(
+    name: str,
+    http_proxy: str | None = None,
+    https_proxy: str | None = None,
+) -> JudilibreTransport:
+    """Builds one of the built-in transports from its name ("urllib", "pooled" or "httpx")
+
+    Raises:
+        JudilibreValueError: raised if the name is unknown
+    """
+    if name not in TRANSPORTS:
+        raise JudilibreValueError(f"Unknown transport {name}, expected one of {', '.join(TRANSPORTS)}")
+    return TRANSPORTS[name](http_proxy=http_proxy, https_proxy=https_proxy)  # type: ignore
+
+
+def _cassette_key(method: str, url: str) -> str:
+    """Key of a request in a cassette: method, path and sorted query string (without scheme nor host)"""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return f"{method.upper()} {parts.path.rstrip('/')}?{query}".rstrip("?")
+
+
+class CassetteTransport(JudilibreTransport):
+    """Records the responses of another transport in a gzipped JSON lines file, or replays them
+
+    Requests are matched on their method, path and query string (in any order) but not on their host, so a
+    cassette can be replayed with any `judilibre_api_url` sharing the path of the one used for the recording.
+    API keys and request headers are never written to the cassette.
+
+    ```python
+    # record
+    with CassetteTransport.record("scan.jsonl.gz") as cassette:
+        client = JudilibreClient(transport=cassette)
+        client.paginate_scan(max_results=10_000)
+
+    # replay (no network)
+    client = JudilibreClient(
+        judilibre_api_url="http://replay/cassation/judilibre/v1.0",
+        judilibre_api_key="replay",
+        transport=CassetteTransport.replay("scan.jsonl.gz"),
+    )
+    client.paginate_scan(max_results=10_000)
+    ```
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "replay",
+        transport: JudilibreTransport | None = None,
+    ):
+        """Constructor of the `CassetteTransport` class
+
+        Args:
+            path (str): path of the cassette (gzipped JSON lines)
+            mode (str, optional): "record" to send requests with `transport` and record their responses,
+                "replay" to answer requests from the cassette.
+                Defaults to "replay".
+            transport (JudilibreTransport | None, optional): transport used in "record" mode.
+                Defaults to `UrllibTransport()`.
+
+        Raises:
+            JudilibreValueError: raised if `mode` is neither "record" nor "replay"
+        """
+        if mode not in ("record", "replay"):
+            raise JudilibreValueError(f"mode must be 'record' or 'replay', not {mode}")
+
+        self.path = path
+        self.mode = mode
+        self.transport = transport or (UrllibTransport() if mode == "record" else None)
+
+        self._interactions: list[dict] = []
+        self._replays: dict[str, list[dict]] = {}
+        self._positions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        if mode == "replay":
+            self.load()
+
+    @classmethod
+    def record(cls, path: str, transport: JudilibreTransport | None = None) -> "CassetteTransport":
+        """Builds a transport recording the responses of `transport` into `path`"""
+        return cls(path=path, mode="record", transport=transport)
+
+    @classmethod
+    def replay(cls, path: str) -> "CassetteTransport":
+        """Builds a transport replaying the responses recorded in `path`"""
+        return cls(path=path, mode="replay")
+
+    def load(self):
+        """Loads the interactions recorded in the cassette"""
+        with gzip.open(self.path, "rt", encoding="utf-8") as cassette:
+            for line in cassette:
+                interaction = json.loads(line)
+                self._replays.setdefault(interaction["key"], []).append(interaction)
+
+    def save(self):
+        """Writes the recorded interactions into the cassette"""
+        with self._lock:
+            with gzip.open(self.path, "wt", encoding="utf-8") as cassette:
+                for interaction in self._interactions:
+                    cassette.write(json.dumps(interaction, ensure_ascii=False) + "\n")
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        timeout: float | None = None,
+    ) -> JudilibreTransportResponse:
+        key = _cassette_key(method, url)
+
+        if self.mode == "replay":
+            with self._lock:
+                interactions = self._replays.get(key)
+                if not interactions:
+                    raise JudilibreCassetteMissError(f"{key} is not recorded in {self.path}")
+                # identical requests are replayed in the order they were recorded, the last one being repeated
+                position = self._positions.get(key, 0)
+                self._positions[key] = position + 1
+                interaction = interactions[min(position, len(interactions) - 1)]
+            if "body" in interaction:
+                body = interaction["body"].encode("utf-8")
+            else:
+                body = base64.b64decode(interaction["body_base64"])
+            return JudilibreTransportResponse(
+                status=interaction["status"],
+                headers=interaction["headers"],
+                body=io.BytesIO(body),
+            )
+
+        assert self.transport is not None
+        with self.transport.send(method=method, url=url, headers=headers, timeout=timeout) as response:
+            content = response.read()
+
+        interaction = {"key": key, "status": response.status, "headers": response.headers}
+        try:
+            interaction["body"] = content.decode("utf-8")
+        except UnicodeDecodeError:
+            interaction["body_base64"] = base64.b64encode(content).decode("ascii")
+        with self._lock:
+            self._interactions.append(interaction)
+
+        return JudilibreTransportResponse(
+            status=response.status,
+            headers=response.headers,
+            body=io.BytesIO(content),
+        )
+
+    def close(self):
+        """Saves the cassette (in "record" mode)"""
+        if self.mode == "record":
+            self.save()
+            if self.transport is not None:
+                self.transport.close()
+
+    def __enter__(self) -> "CassetteTransport":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
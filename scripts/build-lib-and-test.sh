@@ -28,6 +28,7 @@ source venv-build/bin/activate
 # Building the lib
 pip install '.[build]'
 VERSION=$(pip show pyjudilibre | awk '/^Version:/{print $2}')
+bash scripts/build-taxonomy-snapshot.sh
 python -m build
 twine check dist/pyjudilibre-${VERSION}*
 
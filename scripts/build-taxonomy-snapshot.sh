@@ -0,0 +1,12 @@
+#! /usr/bin/bash
+set -euo pipefail
+
+# Writes the taxonomy snapshot shipped with the lib (see `TaxonomySnapshot.bundled`), from the production API
+
+# Setting parameters (JUDILIBRE_API_URL, JUDILIBRE_API_KEY)
+set -o allexport
+source .env
+set +o allexport
+
+pip install . --no-deps -q
+python -m pyjudilibre taxonomy snapshot --output lib/pyjudilibre/data/taxonomy.snapshot
@@ -0,0 +1,19 @@
+import pytest
+from pyjudilibre import JudilibreClient
+from pyjudilibre.testing import JudilibreMockServer
+
+
+@pytest.fixture
+def mock_server():
+    """Local stand-in for the JUDILIBRE API (see `pyjudilibre.testing`)"""
+    with JudilibreMockServer(corpus_size=500) as server:
+        yield server
+
+
+@pytest.fixture
+def mock_client(mock_server):
+    """`JudilibreClient` querying the local stand-in server"""
+    return JudilibreClient(
+        judilibre_api_url=mock_server.url,
+        judilibre_api_key=mock_server.api_key,
+    )
@@ -0,0 +1,67 @@
+import pytest
+from pyjudilibre import JudilibreClient
+from pyjudilibre.batching import AdaptiveBatchSize
+from pyjudilibre.pyjudilibre import EXPORT_BATCH_SIZES
+from pyjudilibre.testing import JudilibreMockServer
+
+
+def test_adaptive_batch_size():
+    batch_size = AdaptiveBatchSize(initial=10, target_duration=0.5, max_bytes=None)
+
+    sizes = []
+    for _ in range(10):
+        size = batch_size.size()
+        sizes.append(size)
+        batch_size.record(n_results=size, duration=0.05 + 0.001 * size)
+
+    # grows at most twofold, then stays under the target duration
+    assert sizes[:4] == [10, 20, 40, 80]
+    assert all(b <= 2 * a for a, b in zip(sizes, sizes[1:]))
+    assert 300 < sizes[-1] <= 450
+
+    assert batch_size.record_timeout(batch_size=sizes[-1], duration=1.0)
+    assert batch_size.size() == sizes[-1] // 2
+
+    batch_size = AdaptiveBatchSize(initial=300, max_bytes=1_000_000)
+    batch_size.record(n_results=300, duration=0.1, n_bytes=3_000_000)
+    assert batch_size.size() == 100
+
+    # for `/export`, the batch size must divide the offset
+    assert AdaptiveBatchSize(initial=1_000).size(offset=300, sizes=EXPORT_BATCH_SIZES) == 100
+    assert AdaptiveBatchSize(initial=1_000).size(offset=2_000, sizes=EXPORT_BATCH_SIZES) == 1_000
+
+
+def test_paginate_with_adaptive_batch_size():
+    with JudilibreMockServer(corpus_size=2_000, text_size=200, latency_per_result=0.0001) as server:
+        client = JudilibreClient(judilibre_api_url=server.url, judilibre_api_key=server.api_key, default_timeout=1)
+        expected = client.paginate_scan(batch_size=1_000)
+
+        server.reset()
+        assert client.paginate_scan(batch_size="auto") == expected
+        scan_sizes = [int(r.parameters["batch_size"][0]) for r in server.requests if r.path == "/scan"]
+        assert scan_sizes[:3] == [100, 200, 400]
+
+        server.reset()
+        assert client.paginate_export(batch_size="auto") == expected
+        offset = 0
+        for request in server.requests:
+            batch, size = int(request.parameters["batch"][0]), int(request.parameters["batch_size"][0])
+            assert batch * size == offset
+            offset += size
+        assert server.count("/export") < 30
+
+        with pytest.raises(ValueError):
+            client.paginate_export(batch_size="fast")
+
+
+def test_adaptive_batch_size_after_timeouts():
+    with JudilibreMockServer(corpus_size=100, latency_per_result=0.005) as server:
+        client = JudilibreClient(judilibre_api_url=server.url, judilibre_api_key=server.api_key, default_timeout=0.35)
+
+        batch_size = AdaptiveBatchSize(initial=100)
+        decisions = client.paginate_export(batch_size=batch_size)
+        assert len(decisions) == 100
+        assert batch_size.timeouts == 1
+
+        with pytest.raises(TimeoutError):
+            client.paginate_export(batch_size=100)
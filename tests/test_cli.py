@@ -0,0 +1,118 @@
+import datetime
+import gzip
+import json
+import os
+
+import pytest
+from pyjudilibre.cli import ExportShard, main, plan_shards
+from pyjudilibre.testing import JudilibreMockServer, SyntheticCorpus
+
+
+def export_arguments(mock_server, tmp_path, *arguments):
+    return [
+        "export",
+        "--api-url",
+        mock_server.url,
+        "--api-key",
+        mock_server.api_key,
+        "--output",
+        str(tmp_path),
+        *arguments,
+    ]
+
+
+def read_export(folder) -> list[dict]:
+    decisions: list[dict] = []
+    for root, _, filenames in os.walk(folder):
+        for filename in filenames:
+            if filename.endswith(".jsonl.gz"):
+                with gzip.open(os.path.join(root, filename), "rt") as shard_file:
+                    decisions.extend(json.loads(line) for line in shard_file)
+    return decisions
+
+
+def test_plan_shards(mock_server, mock_client):
+    shards = plan_shards(mock_client, jurisdictions=["ca"], date_start=datetime.date(2022, 3, 15))
+
+    assert mock_server.count("/stats") == 1
+    expected = mock_server.corpus.filter(jurisdictions=["ca"], date_start=datetime.date(2022, 3, 15))
+    assert sum(shard.expected for shard in shards) == len(expected)
+    assert all(shard.jurisdiction == "ca" and shard.location.startswith("ca_") for shard in shards)
+    assert min(shard.date_start for shard in shards) == datetime.date(2022, 3, 15)
+    assert [shard.expected for shard in shards] == sorted((shard.expected for shard in shards), reverse=True)
+
+    shard = ExportShard("ca", "ca_paris", datetime.date(2024, 2, 1), datetime.date(2024, 2, 29))
+    assert shard.path("out", "jsonl") == os.path.join("out", "ca", "ca_paris", "2024-02.jsonl.gz")
+
+
+@pytest.mark.parametrize("processes", ["1", "2"])
+def test_export(mock_server, tmp_path, capsys, processes):
+    arguments = export_arguments(mock_server, tmp_path, "--date-start", "2021-01-01", "--processes", processes)
+    assert main(arguments) == 0
+
+    expected = mock_server.corpus.filter(date_start=datetime.date(2021, 1, 1))
+    decisions = read_export(tmp_path)
+    assert sorted(d["id"] for d in decisions) == sorted(d.id for d in expected)
+    assert f"Exported {len(expected)} decisions" in capsys.readouterr().out
+
+    with open(tmp_path / "checkpoint.jsonl") as checkpoint_file:
+        checkpoint = [json.loads(line) for line in checkpoint_file]
+    assert all(entry["decisions"] == entry["expected"] for entry in checkpoint)
+    assert not any(filename.endswith(".part") for _, _, filenames in os.walk(tmp_path) for filename in filenames)
+
+    # an interrupted export is resumed: exported shards are skipped
+    os.remove(checkpoint[0]["path"])
+    scans = mock_server.count("/scan")
+    main(arguments)
+    assert mock_server.count("/scan") == scans + 1
+    assert f"in 1 shards ({len(checkpoint) - 1} skipped)" in capsys.readouterr().out
+    assert len(read_export(tmp_path)) == len(expected)
+
+
+@pytest.mark.parametrize("processes", ["1", "2"])
+def test_export_shard_failure(mock_server, monkeypatch, tmp_path, capsys, processes):
+    scan = mock_server._routes["/scan"]
+    scans = []
+
+    def failing_scan(parameters):
+        scans.append(parameters)
+        if len(scans) == 3:
+            return 400, {"message": "Invalid request"}
+        return scan(parameters)
+
+    monkeypatch.setitem(mock_server._routes, "/scan", failing_scan)
+    arguments = export_arguments(mock_server, tmp_path, "--date-start", "2021-01-01", "--processes", processes)
+    assert main(arguments) == 1
+
+    # the other shards are exported and recorded in the checkpoint
+    output = capsys.readouterr().out
+    with open(tmp_path / "checkpoint.jsonl") as checkpoint_file:
+        checkpoint = [json.loads(line) for line in checkpoint_file]
+    assert f"in {len(checkpoint)} shards (0 skipped, 1 failed)" in output
+    assert output.count("error: ") == 1 and "JudilibreInvalidRequestError" in output
+    assert not any(filename.endswith(".part") for _, _, filenames in os.walk(tmp_path) for filename in filenames)
+
+    # running the command again only exports the failed shard
+    assert main(arguments) == 0
+    assert f"in 1 shards ({len(checkpoint)} skipped)" in capsys.readouterr().out
+    expected = mock_server.corpus.filter(date_start=datetime.date(2021, 1, 1))
+    assert sorted(d["id"] for d in read_export(tmp_path)) == sorted(d.id for d in expected)
+
+
+def test_export_decisions_without_location(tmp_path):
+    # a court of appeal whose decisions do not all have a location
+    corpus = SyntheticCorpus(300, text_size=20, jurisdictions=["ca"])
+    corpus.decisions = [d._replace(location=None) if d.position % 3 == 0 else d for d in corpus.decisions]
+    corpus._by_id = {d.id: d for d in corpus.decisions}
+
+    with JudilibreMockServer(corpus=corpus) as server:
+        assert main(export_arguments(server, tmp_path / "all", "--processes", "1")) == 0
+        ids = [d["id"] for d in read_export(tmp_path / "all")]
+        assert len(ids) == len(set(ids))
+        assert sorted(ids) == sorted(d.id for d in corpus.decisions)
+
+        location = next(d.location for d in corpus.decisions if d.location)
+        arguments = export_arguments(server, tmp_path / "located", "--processes", "1", "--location", location)
+        assert main(arguments) == 0
+        ids = [d["id"] for d in read_export(tmp_path / "located")]
+        assert sorted(ids) == sorted(d.id for d in corpus.decisions if d.location == location)
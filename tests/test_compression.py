@@ -0,0 +1,43 @@
+import gzip
+
+import pytest
+from pyjudilibre import JudilibreClient
+from pyjudilibre.exceptions import JudilibreValueError
+from pyjudilibre.instrumentation import JudilibreMetricsCollector
+from pyjudilibre.testing import JudilibreMockServer
+from pyjudilibre.transports import ContentDecoder, accept_encoding
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+def test_compressed_responses(encoding):
+    if encoding != "gzip":
+        pytest.importorskip({"br": "brotli", "zstd": "zstandard"}[encoding])
+
+    with JudilibreMockServer(corpus_size=200, encodings=(encoding,)) as server:
+        client = JudilibreClient(judilibre_api_url=server.url, judilibre_api_key=server.api_key)
+        metrics = JudilibreMetricsCollector().attach(client)
+        compressed = client.paginate_scan(batch_size=100)
+
+        assert encoding in server.requests[-1].headers["Accept-Encoding"]
+        scan_metrics = metrics.as_dict()["/scan"]
+        assert scan_metrics["bytes_received"] * 2 < scan_metrics["bytes_decoded"]
+
+        client = JudilibreClient(judilibre_api_url=server.url, judilibre_api_key=server.api_key, compression=False)
+        assert client.paginate_scan(batch_size=100) == compressed
+        assert encoding not in server.requests[-1].headers.get("Accept-Encoding", "")
+
+
+def test_content_decoder():
+    content = b'{"results": []}' * 1_000
+    compressed = gzip.compress(content)
+
+    decoder = ContentDecoder("gzip")
+    chunks = [decoder.decompress(compressed[i : i + 100]) for i in range(0, len(compressed), 100)]
+    assert b"".join(chunks) + decoder.flush() == content
+
+    assert ContentDecoder(None).identity
+    assert ContentDecoder("identity").identity
+    assert accept_encoding().startswith("gzip")
+
+    with pytest.raises(JudilibreValueError):
+        ContentDecoder("compress")
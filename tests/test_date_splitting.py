@@ -0,0 +1,125 @@
+import datetime
+import logging
+import time
+
+import pytest
+from pyjudilibre import JudilibreClient
+from pyjudilibre.pyjudilibre import _bisect_dates
+from pyjudilibre.testing import JudilibreMockServer
+
+
+def test_bisect_dates():
+    days = [datetime.date(2024, 1, 1) + datetime.timedelta(days=i) for i in range(100)]
+    counts = {day: 10 for day in days}
+    counts[days[50]] = 500
+    counted = []
+
+    def count(start, end):
+        counted.append((start, end))
+        return sum(n for day, n in counts.items() if start <= day <= end)
+
+    windows = _bisect_dates(count, days[0], days[-1], sum(counts.values()), limit=100)
+
+    assert sum(total for _, _, total in windows) == sum(counts.values())
+    assert all(total <= 100 or start == end for start, end, total in windows)
+    assert (days[50], days[50], 500) in windows
+    assert all(previous[1] < following[0] for previous, following in zip(windows, windows[1:]))
+    assert len(counted) < len(windows) * 2
+    assert _bisect_dates(count, days[0], days[-1], 0, limit=100) == []
+
+
+@pytest.fixture(scope="module")
+def large_mock_server():
+    """Stand-in for the API with more decisions than the 10 000 results a query gives access to"""
+    with JudilibreMockServer(corpus_size=31_000, text_size=20) as server:
+        yield server
+
+
+@pytest.fixture
+def large_mock_client(large_mock_server):
+    large_mock_server.reset()
+    return JudilibreClient(
+        judilibre_api_url=large_mock_server.url,
+        judilibre_api_key=large_mock_server.api_key,
+        default_timeout=60,
+    )
+
+
+def test_paginate_export_split_dates(large_mock_server, large_mock_client):
+    date_start = datetime.date(2021, 1, 1)
+    expected = large_mock_server.corpus.filter(date_start=date_start)
+    assert len(expected) > 10_000
+    assert len(large_mock_client.paginate_export(batch_size=1_000, date_start=date_start, abridged=True)) == 10_000
+
+    reports = []
+    decisions = large_mock_client.paginate_export(
+        batch_size=1_000,
+        date_start=date_start,
+        abridged=True,
+        split_dates=True,
+        max_workers=4,
+        progress_callback=lambda p: reports.append((p.done, p.total, p.finished)),
+    )
+
+    assert sorted(d.id for d in decisions) == sorted(d.id for d in expected)
+    assert large_mock_server.count("/stats") == 1
+    assert reports[-1] == (len(expected), len(expected), True)
+
+
+def test_paginate_export_split_dates_max_results(large_mock_server, large_mock_client, monkeypatch):
+    export = large_mock_server._routes["/export"]
+    batches = []
+
+    def recording_export(parameters):
+        if parameters.get("batch_size") != ["1"]:
+            batches.append(parameters)
+        return export(parameters)
+
+    monkeypatch.setitem(large_mock_server._routes, "/export", recording_export)
+    decisions = large_mock_client.paginate_export(10, abridged=True, split_dates=True, max_workers=4)
+
+    assert len(decisions) == len({d.id for d in decisions}) == 10
+    # a single batch, of the first window (the counts of the windows use batches of 1)
+    assert len(batches) == 1
+
+
+def test_paginate_search_split_dates(large_mock_server, large_mock_client):
+    assert large_mock_client.search("contrat")[0] > 10_000
+
+    results = large_mock_client.paginate_search("contrat", max_results=120, split_dates=True, max_workers=2)
+
+    assert len(results) == len({r.id for r in results}) == 120
+    # the 120 results all belong to the first window(s) of dates
+    assert max(r.decision_date for r in results) < datetime.date(2024, 1, 1)
+    assert large_mock_server.count("/stats") == 1
+
+
+def test_iter_search_split_dates_streams(large_mock_server, large_mock_client):
+    results = large_mock_client.paginate_search("contrat", max_results=10, split_dates=True, max_workers=4)
+    assert len(results) == 10
+    # the counts of the windows, and a single page of the first one
+    assert large_mock_server.count("/search") <= 4
+
+    large_mock_server.reset()
+    results = large_mock_client.iter_search("contrat", split_dates=True, max_workers=4)
+    first = next(results)
+    time.sleep(0.5)
+    # windows are read a few pages ahead of the consumer, not entirely
+    assert large_mock_server.count("/search") < 30
+    assert len({first.id, *(r.id for r in results)}) == large_mock_client.search("contrat")[0]
+
+
+def test_split_dates_day_over_limit(mock_client, caplog):
+    with caplog.at_level(logging.WARNING, logger="judilibre-client"):
+        windows = mock_client._date_windows(
+            lambda start, end: 20_000,
+            jurisdictions=None,
+            locations=None,
+            selection=None,
+            date_start=datetime.date(2024, 1, 1),
+            date_end=datetime.date(2024, 1, 1),
+            date_type=None,
+        )
+
+    assert windows == [(datetime.date(2024, 1, 1), datetime.date(2024, 1, 1), 20_000)]
+    assert any(r.levelno == logging.WARNING and "20000 results" in r.getMessage() for r in caplog.records)
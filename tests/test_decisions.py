@@ -0,0 +1,219 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pyjudilibre import JudilibreClient
+from pyjudilibre.cache import LRUCache, SingleFlight
+from pyjudilibre.exceptions import JudilibreDecisionNotFoundError, JudilibreInternalError, JudilibreValueError
+from pyjudilibre.testing import JudilibreMockServer
+
+
+def test_lru_cache():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c"), len(cache)) == (1, 3, 2)
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    disabled = LRUCache(maxsize=0)
+    disabled.put("a", 1)
+    assert len(disabled) == 0
+
+
+def test_lru_cache_ttl(monkeypatch):
+    cache = LRUCache(maxsize=2, ttl=10)
+    cache.put("a", 1)
+    assert "a" in cache and cache.get("a") == 1
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert "a" not in cache
+    assert cache.get("a") is None
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 0)
+
+
+def test_single_flight():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def function():
+        calls.append(1)
+        started.set()
+        release.wait()
+        raise ValueError("shared")
+
+    def do():
+        try:
+            flight.do("key", function)
+        except ValueError as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(do)
+        started.wait()
+        followers = [executor.submit(do) for _ in range(3)]
+        while flight.shared < 3:
+            time.sleep(0.001)
+        release.set()
+        errors = [f.result() for f in [leader, *followers]]
+
+    assert len(calls) == 1
+    assert all(e is errors[0] for e in errors)
+    assert flight.do("key", lambda: 1) == (1, False)
+
+
+@pytest.mark.parametrize("single_flight", [True, False])
+def test_concurrent_identical_queries(single_flight):
+    with JudilibreMockServer(corpus_size=10, latency=0.1) as server:
+        client = JudilibreClient(
+            judilibre_api_url=server.url,
+            judilibre_api_key=server.api_key,
+            single_flight=single_flight,
+        )
+        decision_id = server.corpus.decisions[0].id
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            decisions = list(executor.map(lambda _: client.decision(decision_id), range(10)))
+
+        assert all(d == decisions[0] for d in decisions)
+        assert server.count("/decision") == (1 if single_flight else 10)
+
+
+def test_single_flight_copies_shared_results():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def function():
+        started.set()
+        release.wait()
+        return {"labels": ["a"]}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(flight.do, "key", function)
+        started.wait()
+        followers = [executor.submit(flight.do, "key", function) for _ in range(3)]
+        while flight.shared < 3:
+            time.sleep(0.001)
+        release.set()
+        results = [future.result()[0] for future in [leader, *followers]]
+
+    results[0]["labels"].append("b")
+    assert all(result == {"labels": ["a"]} for result in results[1:])
+    assert len({id(result) for result in results}) == 4
+
+    # a result that is not shared is not copied
+    result = {"labels": ["a"]}
+    assert flight.do("key", lambda: result)[0] is result
+
+
+def test_concurrent_identical_queries_get_their_own_response():
+    with JudilibreMockServer(corpus_size=10, latency=0.1) as server:
+        client = JudilibreClient(judilibre_api_url=server.url, judilibre_api_key=server.api_key)
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            taxons = list(executor.map(lambda _: client.taxonomy("chamber", "cc"), range(10)))  # type: ignore
+
+        assert server.count("/taxonomy") == 1
+        taxons[0].clear()
+        assert all(taxon == taxons[1] and taxon for taxon in taxons[1:])
+
+
+@pytest.mark.parametrize("ordered", [False, True])
+def test_decisions(ordered):
+    with JudilibreMockServer(corpus_size=100, latency=0.02) as server:
+        client = JudilibreClient(
+            judilibre_api_url=server.url,
+            judilibre_api_key=server.api_key,
+            transport="pooled",
+        )
+        ids = [d.id for d in server.corpus.decisions[:40]] + ["obviously_wrong_id"]
+
+        start = time.monotonic()
+        results = list(client.decisions(ids, max_workers=8, ordered=ordered))
+        assert time.monotonic() - start < len(ids) * 0.02 / 2
+
+        if ordered:
+            assert [decision_id for decision_id, _ in results] == ids
+        assert sorted(decision_id for decision_id, _ in results) == sorted(ids)
+        for decision_id, decision in results:
+            if decision_id == "obviously_wrong_id":
+                assert isinstance(decision, JudilibreDecisionNotFoundError)
+            else:
+                assert decision.id == decision_id
+
+
+def test_decision_cache():
+    with JudilibreMockServer(corpus_size=10) as server:
+        client = JudilibreClient(
+            judilibre_api_url=server.url,
+            judilibre_api_key=server.api_key,
+            decision_cache_size=5,
+        )
+        ids = [d.id for d in server.corpus.decisions]
+
+        decision = client.decision(ids[0])
+        assert client.decision(ids[0]) == decision
+        assert server.count("/decision") == 1
+
+        # the cached decisions are copies, which the callers can modify
+        text = decision.text
+        decision.text = "MUTATED"
+        cached = client.decision(ids[0])
+        assert cached.text == text and cached is not client.decision(ids[0])
+
+        assert dict(client.decisions(ids, max_workers=4))[ids[0]] == cached
+        assert server.count("/decision") == 10
+        assert len(client.decision_cache) == 5
+
+
+def test_hydrate():
+    with JudilibreMockServer(corpus_size=200, latency=0.01) as server:
+        client = JudilibreClient(
+            judilibre_api_url=server.url,
+            judilibre_api_key=server.api_key,
+            transport="pooled",
+        )
+        search_results = client.paginate_search("contrat", page_size=10, max_results=30)
+
+        server.reset()
+        hydrated = list(client.hydrate(client.iter_search("contrat", page_size=10, max_results=30)))
+        assert [r for r, _ in hydrated] == search_results
+        for result, decision in hydrated:
+            assert decision.id == result.id
+            assert decision.text
+        assert (server.count("/search"), server.count("/decision")) == (3, 30)
+
+        hydrated = client.hydrate(search_results[:5], fields=["text"], zones=["dispositif", "motivations"])
+        for result, selected in hydrated:
+            decision = client.decision(result.id)
+            assert selected == {
+                "text": decision.text,
+                "dispositif": decision.zoning.dispositif.text,
+                "motivations": [z.text for z in decision.zoning.motivations],
+            }
+
+        with pytest.raises(JudilibreValueError):
+            client.hydrate(search_results, zones=["conclusion"])
+
+
+def test_hydrate_search_errors():
+    with JudilibreMockServer(corpus_size=200) as server:
+        client = JudilibreClient(judilibre_api_url=server.url, judilibre_api_key=server.api_key)
+
+        def results():
+            yield from client.iter_search("contrat", page_size=10, max_results=10)
+            raise JudilibreInternalError("search failed")
+
+        hydrated = client.hydrate(results())
+        assert len([next(hydrated) for _ in range(10)]) == 10
+        with pytest.raises(JudilibreInternalError):
+            next(hydrated)
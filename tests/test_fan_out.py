@@ -0,0 +1,52 @@
+import dataclasses
+
+import pytest
+from pyjudilibre.enums import LocationCAEnum
+from pyjudilibre.exceptions import JudilibreValueError
+from pyjudilibre.progress import JudilibreProgress
+from pyjudilibre.pyjudilibre import _balance
+
+
+def test_balance():
+    groups = _balance({"a": 10, "b": 7, "c": 5, "d": 4, "e": 2}, 2)
+
+    assert sorted(key for group in groups for key in group) == ["a", "b", "c", "d", "e"]
+    assert sorted(sum({"a": 10, "b": 7, "c": 5, "d": 4, "e": 2}[k] for k in group) for group in groups) == [14, 14]
+    assert _balance({"a": 1}, 4) == [["a"]]
+    assert _balance({}, 4) == []
+
+
+@pytest.mark.parametrize("batch_size", [50, "auto"])
+def test_fan_out_scan(mock_server, mock_client, batch_size):
+    locations = list(LocationCAEnum)
+    sequential = mock_client.paginate_scan(batch_size=50, locations=locations)
+    mock_server.reset()
+
+    reports: list[JudilibreProgress] = []
+    decisions = mock_client.paginate_scan(
+        batch_size=batch_size,
+        locations=locations,
+        max_workers=4,
+        progress_callback=lambda p: reports.append(dataclasses.replace(p)),
+    )
+
+    assert sorted(d.id for d in decisions) == sorted(d.id for d in sequential)
+    assert mock_server.count("/stats") == 1
+    # only the locations with decisions are scanned
+    scanned = {location for r in mock_server.requests if r.path == "/scan" for location in r.parameters["location"]}
+    assert scanned == {d.location for d in mock_server.corpus.decisions if d.jurisdiction == "ca"}
+    assert all(p.total == len(sequential) for p in reports)
+    assert reports[-1].finished and reports[-1].done == len(sequential)
+    assert reports[-1].requests == mock_server.count("/scan")
+
+
+def test_fan_out_scan_max_results(mock_server, mock_client):
+    decisions = list(
+        mock_client.iter_scan(batch_size=20, locations=list(LocationCAEnum), max_results=30, max_workers=4)
+    )
+
+    assert len(decisions) == 30
+    assert len({d.id for d in decisions}) == 30
+
+    with pytest.raises(JudilibreValueError):
+        list(mock_client.iter_scan(locations=list(LocationCAEnum), search_after="x", max_workers=4))
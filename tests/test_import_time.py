@@ -0,0 +1,60 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+LAZY_MODULES = [
+    "pydantic",
+    "pyjudilibre.locations",
+    "pyjudilibre.models",
+    "tqdm",
+]
+
+
+def _loaded_modules(statement: str) -> list[str]:
+    code = f"import json, sys\n{statement}\nprint(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(output.stdout)
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import pyjudilibre",
+        "from pyjudilibre import JudilibreClient",
+        "from pyjudilibre.enums import JurisdictionEnum",
+    ],
+)
+def test_import_is_lazy(statement):
+    modules = _loaded_modules(statement)
+
+    for module in LAZY_MODULES:
+        assert module not in modules
+
+
+def test_lazy_location_enums():
+    modules = _loaded_modules(
+        "from pyjudilibre.enums import LocationTJEnum\nassert LocationTJEnum('Tribunal judiciaire de Paris')"
+    )
+
+    assert "pyjudilibre.locations" in modules
+    assert "pydantic" not in modules
+
+
+def test_models_are_loaded_on_first_use():
+    modules = _loaded_modules(
+        "from pyjudilibre import JudilibreClient\n"
+        "client = JudilibreClient(judilibre_api_url='http://localhost', judilibre_api_key='key')\n"
+        "client._query = lambda *args, **kwargs: {'id': 'id', 'decision_date': '2024-01-01', 'number': '1',"
+        " 'numbers': ['1'], 'particularInterest': False, 'source': 'jurinet', 'text': '', 'update_date': ''}\n"
+        "client.decision('id')"
+    )
+
+    assert "pyjudilibre.models" in modules
+    assert "tqdm" not in modules
@@ -0,0 +1,68 @@
+import pytest
+from pyjudilibre import JudilibreClient
+from pyjudilibre.exceptions import JudilibreInternalError, JudilibreValueError
+from pyjudilibre.instrumentation import JudilibreMetricsCollector
+
+
+def test_hooks(mock_server, mock_client):
+    events = []
+    for name in ["before_request", "after_response", "on_error", "on_retry"]:
+        mock_client.add_hook(name, lambda event, name=name: events.append((name, event.endpoint, event.status)))
+
+    mock_client.healthcheck()
+
+    assert events == [
+        ("before_request", "/healthcheck", None),
+        ("after_response", "/healthcheck", 200),
+    ]
+
+    with pytest.raises(JudilibreValueError):
+        mock_client.add_hook("unknown_event", print)
+
+
+def test_retries(mock_server):
+    events = []
+    client = JudilibreClient(
+        judilibre_api_url=mock_server.url,
+        judilibre_api_key=mock_server.api_key,
+        max_retries=2,
+        hooks={"on_retry": [lambda event: events.append((event.attempt, event.status, event.retry_delay))]},
+    )
+
+    mock_server.inject_errors(429)
+    mock_server.inject_errors(500)
+    assert client.healthcheck() is True
+    assert events == [(0, 429, 0.0), (1, 500, 0.0)]
+    assert mock_server.request_count == 3
+
+    mock_server.inject_errors(500, count=3)
+    with pytest.raises(JudilibreInternalError):
+        client.healthcheck()
+
+
+def test_metrics_collector(mock_server, mock_client):
+    metrics = JudilibreMetricsCollector().attach(mock_client)
+
+    mock_client.paginate_scan(batch_size=200)
+    mock_server.inject_errors(500)
+    with pytest.raises(JudilibreInternalError):
+        mock_client.healthcheck()
+
+    results = metrics.as_dict()
+
+    assert results["/scan"]["requests"] == 3
+    assert results["/scan"]["status_codes"] == {200: 3}
+    assert results["/scan"]["bytes_received"] > 0
+    assert results["/scan"]["decode_time"] > 0
+    assert results["/scan"]["latency"]["buckets"]["+Inf"] == 3
+    assert results["/healthcheck"]["errors"] == 1
+    assert results["/healthcheck"]["status_codes"] == {500: 1}
+
+    prometheus = metrics.to_prometheus()
+    assert 'judilibre_client_requests_total{endpoint="/scan",status="200"} 3' in prometheus
+    assert 'judilibre_client_request_duration_seconds_bucket{endpoint="/scan",le="+Inf"} 3' in prometheus
+    assert "# TYPE judilibre_client_request_duration_seconds histogram" in prometheus
+
+    metrics.detach(mock_client)
+    mock_client.healthcheck()
+    assert metrics.as_dict()["/healthcheck"]["requests"] == 1
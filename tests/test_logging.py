@@ -0,0 +1,73 @@
+import logging
+import random
+
+import pytest
+from pyjudilibre import JudilibreClient
+from pyjudilibre.exceptions import JudilibreValueError
+
+
+def test_export_does_not_print(mock_client, capsys):
+    mock_client.export(batch_size=5)
+    mock_client.export(batch_size=5, abridged=True)
+
+    assert capsys.readouterr().out == ""
+
+
+def test_truncated_body_logging(mock_server, caplog):
+    client = JudilibreClient(
+        judilibre_api_url=mock_server.url,
+        judilibre_api_key=mock_server.api_key,
+        logging_level=logging.DEBUG,
+        log_body_max_bytes=100,
+    )
+
+    with caplog.at_level(logging.DEBUG, logger="judilibre-client"):
+        client.scan(batch_size=10)
+
+    contents = [r.getMessage() for r in caplog.records if r.getMessage().startswith("RESPONSE CONTENT")]
+    assert len(contents) == 1
+    assert len(contents[0]) < 200
+    assert contents[0].endswith("more bytes]")
+
+
+def test_no_body_logging_above_debug(mock_server, caplog, monkeypatch):
+    client = JudilibreClient(
+        judilibre_api_url=mock_server.url,
+        judilibre_api_key=mock_server.api_key,
+        logging_level=logging.INFO,
+    )
+
+    def fail(content):
+        raise AssertionError("the body should not be decoded when DEBUG is disabled")
+
+    monkeypatch.setattr(client, "_truncate_body", fail)
+
+    with caplog.at_level(logging.INFO, logger="judilibre-client"):
+        client.scan(batch_size=10)
+
+    assert not any(r.getMessage().startswith("RESPONSE CONTENT") for r in caplog.records)
+    assert any(r.getMessage().startswith("RESPONSE STATUS") for r in caplog.records)
+
+
+@pytest.mark.parametrize("sample_rate, expected", [(0.0, {0}), (0.5, set(range(1, 20))), (1.0, {20})])
+def test_sampled_body_logging(mock_server, caplog, sample_rate, expected):
+    client = JudilibreClient(
+        judilibre_api_url=mock_server.url,
+        judilibre_api_key=mock_server.api_key,
+        logging_level=logging.DEBUG,
+        log_body_sample_rate=sample_rate,
+    )
+
+    random.seed(0)
+    with caplog.at_level(logging.DEBUG, logger="judilibre-client"):
+        for _ in range(20):
+            assert client.healthcheck()
+
+    contents = [r for r in caplog.records if r.getMessage().startswith("RESPONSE CONTENT")]
+    assert len(contents) in expected
+    assert sum(r.getMessage().startswith("RESPONSE STATUS") for r in caplog.records) == 20
+
+
+def test_invalid_body_sample_rate(mock_server):
+    with pytest.raises(JudilibreValueError):
+        JudilibreClient(judilibre_api_url=mock_server.url, judilibre_api_key="key", log_body_sample_rate=2)
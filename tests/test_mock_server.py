@@ -0,0 +1,166 @@
+import datetime
+import os
+
+import pytest
+from pyjudilibre import JudilibreClient
+from pyjudilibre.enums import JudilibreStatsAggregationKeysEnum, JudilibreTaxonEnum, JurisdictionEnum
+from pyjudilibre.exceptions import (
+    JudilibreDecisionNotFoundError,
+    JudilibreInternalError,
+    JudilibreInvalidCredentialsError,
+    JudilibreTooManyRequestError,
+    JudilibreValueError,
+)
+from pyjudilibre.models import JudilibreDecision, JudilibreSearchResult, JudilibreShortDecision
+from pyjudilibre.testing import JudilibreMockServer
+
+
+def test_mock_healthcheck(mock_client):
+    assert mock_client.healthcheck() is True
+
+
+def test_mock_decision(mock_server, mock_client):
+    decision_id = mock_server.corpus.decisions[0].id
+
+    decision = mock_client.decision(decision_id)
+
+    assert isinstance(decision, JudilibreDecision)
+    assert decision.id == decision_id
+    assert decision.zoning.dispositif is not None
+
+    with pytest.raises(JudilibreDecisionNotFoundError):
+        mock_client.decision("obviously_wrong_id")
+
+
+def test_mock_search(mock_client):
+    total, results = mock_client.search("contrat", page_size=10)
+
+    assert len(results) == 10
+    for r in results:
+        assert isinstance(r, JudilibreSearchResult)
+
+    results = mock_client.paginate_search("contrat")
+    assert len(results) == total
+
+
+@pytest.mark.parametrize("abridged", [False, True])
+def test_mock_export(mock_server, mock_client, abridged):
+    total, decisions = mock_client.export(
+        batch_size=20,
+        jurisdictions=[JurisdictionEnum.cour_de_cassation],
+        abridged=abridged,
+    )
+
+    assert total == len(mock_server.corpus.filter(jurisdictions=["cc"]))
+    assert len(decisions) == 20
+    for d in decisions:
+        assert isinstance(d, JudilibreShortDecision if abridged else JudilibreDecision)
+        assert d.jurisdiction == JurisdictionEnum.cour_de_cassation
+
+
+def test_mock_scan(mock_server, mock_client):
+    decisions = mock_client.paginate_scan(batch_size=100)
+
+    assert len(decisions) == mock_server.corpus.size
+    assert len({d.id for d in decisions}) == mock_server.corpus.size
+
+
+def test_mock_stats(mock_server, mock_client):
+    stats = mock_client.stats(
+        keys=[JudilibreStatsAggregationKeysEnum.jurisdiction],
+        date_start=datetime.date(2022, 1, 1),
+    )
+
+    assert stats.results.total_decisions == sum(d.decisions_count for d in stats.results.aggregated_data)
+    assert stats.results.min_decision_date >= datetime.date(2022, 1, 1)
+
+
+def test_mock_taxonomy(mock_client):
+    taxons = mock_client.taxonomy(JudilibreTaxonEnum.jurisdiction, JurisdictionEnum.cour_de_cassation)
+    assert taxons["cc"] == "Cour de cassation"
+
+    taxons = mock_client.taxonomy(
+        JudilibreTaxonEnum.location,
+        JurisdictionEnum.cours_d_appel,
+        taxon_key="ca_paris",
+    )
+    assert taxons == {"ca_paris": "Cour d'appel de Paris"}
+
+
+def test_mock_transactional_history(mock_server, mock_client):
+    transactions = mock_client.paginate_transactional_history(date_start=datetime.date(2020, 1, 1))
+
+    assert len(transactions) == mock_server.corpus.size
+
+
+def test_mock_page_sizes(mock_server, mock_client):
+    total, _ = mock_client.search("contrat", page_size=1)
+    results = mock_client.paginate_search("contrat", page_size=10)
+    assert len(results) == total
+    assert mock_server.count("/search") == 1 + -(-total // 10)
+    assert all(r.parameters["page_size"] == ["10"] for r in mock_server.requests[1:])
+
+    mock_server.reset()
+    assert mock_client.paginate_search("contrat") == results
+    assert mock_server.count("/search") == -(-total // 50)
+
+    mock_server.reset()
+    assert len(mock_client.paginate_search("contrat", max_results=7)) == 7
+    assert mock_server.requests[0].parameters["page_size"] == ["7"]
+
+    mock_server.reset()
+    transactions = mock_client.paginate_transactional_history(date_start=datetime.date(2020, 1, 1), page_size=100)
+    assert len(transactions) == mock_server.corpus.size
+    assert mock_server.count("/transactionalhistory") == 5
+    assert all(r.parameters["page_size"] == ["100"] for r in mock_server.requests)
+
+    mock_server.reset()
+    assert mock_client.paginate_transactional_history(date_start=datetime.date(2020, 1, 1)) == transactions
+    assert mock_server.count("/transactionalhistory") == 1
+
+    with pytest.raises(JudilibreValueError):
+        mock_client.paginate_search("contrat", page_size="max")
+
+
+def test_mock_download_file(mock_server, mock_client, tmp_path):
+    metadata = next(d for d in mock_server.corpus.decisions if mock_server.corpus.has_files(d))
+    decision = mock_client.decision(metadata.id)
+
+    filenames = mock_client.download_decision_files(decision, folder=str(tmp_path))
+
+    assert len(filenames) == 2
+    for filename in filenames:
+        assert os.stat(filename).st_size == mock_server.file_size
+
+
+@pytest.mark.parametrize(
+    "status, exception",
+    [
+        (429, JudilibreTooManyRequestError),
+        (500, JudilibreInternalError),
+    ],
+)
+def test_mock_error_injection(mock_server, mock_client, status, exception):
+    mock_server.inject_errors(status)
+
+    with pytest.raises(exception):
+        mock_client.healthcheck()
+    assert mock_client.healthcheck() is True
+
+
+def test_mock_credentials(mock_server):
+    client = JudilibreClient(judilibre_api_url=mock_server.url, judilibre_api_key="obviously_wrong_credentials")
+
+    with pytest.raises(JudilibreInvalidCredentialsError):
+        client.healthcheck()
+
+
+def test_mock_latency():
+    with JudilibreMockServer(corpus_size=10, latency=0.2) as server:
+        client = JudilibreClient(judilibre_api_url=server.url, judilibre_api_key=server.api_key)
+
+        start = datetime.datetime.now()
+        client.healthcheck()
+
+        assert datetime.datetime.now() - start >= datetime.timedelta(seconds=0.2)
+        assert server.count("/healthcheck") == 1
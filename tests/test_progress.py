@@ -0,0 +1,128 @@
+import dataclasses
+import datetime
+
+from pyjudilibre import JudilibreClient
+from pyjudilibre.progress import JudilibreProgress, TqdmProgress
+from pyjudilibre.ratelimit import RateLimiter
+
+
+def test_paginate_scan_progress(mock_server, mock_client):
+    reports: list[JudilibreProgress] = []
+
+    def record(progress):
+        reports.append(dataclasses.replace(progress))
+
+    decisions = mock_client.paginate_scan(batch_size=200, progress_callback=record)
+
+    assert mock_server.count("/stats") == 0
+    assert mock_server.count("/scan") == 3
+    assert [(p.done, p.total, p.requests, p.finished) for p in reports] == [
+        (200, 500, 1, False),
+        (400, 500, 2, False),
+        (500, 500, 3, True),
+    ]
+    assert reports[-1].fraction == 1.0
+    assert len(decisions) == 500
+
+
+def test_paginate_scan_progress_max_results(mock_server, mock_client):
+    reports: list[JudilibreProgress] = []
+
+    mock_client.paginate_scan(
+        batch_size=200,
+        max_results=300,
+        progress_callback=lambda p: reports.append(dataclasses.replace(p)),
+    )
+
+    assert [(p.done, p.total, p.finished) for p in reports] == [(200, 300, False), (300, 300, True)]
+
+
+def test_paginate_scan_stats_total(mock_server, mock_client):
+    reports: list[JudilibreProgress] = []
+
+    mock_client.paginate_scan(
+        batch_size=200,
+        stats_total=True,
+        progress_callback=lambda p: reports.append(dataclasses.replace(p)),
+    )
+
+    assert mock_server.count("/stats") == 1
+    assert [(p.done, p.total) for p in reports] == [(0, 500), (200, 500), (400, 500), (500, 500)]
+
+
+def test_tqdm_progress(mock_client, capsys):
+    mock_client.paginate_scan(batch_size=200, verbose=True)
+    assert "500/500" in capsys.readouterr().err
+
+    progress = TqdmProgress()
+    progress(JudilibreProgress(operation="scan", done=1))
+    progress(JudilibreProgress(operation="scan", done=2, total=2, finished=True))
+    assert "2/2" in capsys.readouterr().err
+
+
+def test_paginate_search_progress(mock_client):
+    reports: list[JudilibreProgress] = []
+
+    results = mock_client.paginate_search(
+        "",
+        max_results=120,
+        progress_callback=lambda p: reports.append(dataclasses.replace(p)),
+    )
+
+    assert len(results) == 120
+    assert [(p.done, p.total, p.finished) for p in reports] == [(50, 120, False), (100, 120, False), (120, 120, True)]
+    assert reports[-1].unit == "results"
+    assert reports[-1].bytes_received > 0
+
+
+def test_paginate_export_and_history_progress(mock_client):
+    exports: list[JudilibreProgress] = []
+    mock_client.paginate_export(batch_size=200, progress_callback=lambda p: exports.append(dataclasses.replace(p)))
+    assert [(p.done, p.total, p.finished) for p in exports] == [(200, 500, False), (400, 500, False), (500, 500, True)]
+
+    history: list[JudilibreProgress] = []
+    transactions = mock_client.paginate_transactional_history(
+        datetime.datetime(2000, 1, 1),
+        page_size=300,
+        progress_callback=lambda p: history.append(dataclasses.replace(p)),
+    )
+    assert len(transactions) == 500
+    assert [(p.done, p.total, p.requests, p.finished) for p in history] == [(300, 500, 1, False), (500, 500, 2, True)]
+
+
+def test_decisions_progress(mock_server):
+    client = JudilibreClient(
+        judilibre_api_url=mock_server.url,
+        judilibre_api_key=mock_server.api_key,
+        max_retries=1,
+        retry_backoff=0,
+        rate_limit=RateLimiter(rate=200),
+    )
+    decision_ids = [d.id for d in mock_server.corpus.decisions[:10]]
+    reports: list[JudilibreProgress] = []
+
+    mock_server.inject_errors(500)
+    results = list(client.decisions(decision_ids, progress_callback=lambda p: reports.append(dataclasses.replace(p))))
+
+    assert len(results) == 10
+    assert [p.done for p in reports] == list(range(1, 11)) + [10]
+    assert all(p.total == 10 for p in reports)
+    final = reports[-1]
+    assert final.finished and final.eta == 0.0
+    assert (final.requests, final.retries) == (10, 1)
+    assert final.throttle_time > 0
+
+
+def test_download_progress(mock_server, mock_client, tmp_path):
+    metadata = next(d for d in mock_server.corpus.decisions if mock_server.corpus.has_files(d))
+    decision = mock_client.decision(metadata.id)
+    reports: list[JudilibreProgress] = []
+
+    mock_client.download_decision_files(
+        decision,
+        folder=str(tmp_path),
+        progress_callback=lambda p: reports.append(dataclasses.replace(p)),
+    )
+
+    assert [(p.done, p.total, p.finished) for p in reports] == [(1, 2, False), (2, 2, True)]
+    assert reports[-1].bytes_received == 2 * mock_server.file_size
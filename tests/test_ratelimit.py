@@ -0,0 +1,83 @@
+import json
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from pyjudilibre import JudilibreClient
+from pyjudilibre.exceptions import JudilibreValueError
+from pyjudilibre.instrumentation import JudilibreMetricsCollector
+from pyjudilibre.ratelimit import RateLimiter
+from pyjudilibre.testing import JudilibreMockServer
+from pyjudilibre.transports import InMemoryTransport
+
+
+def test_rate_limiter():
+    limiter = RateLimiter(rate=100, burst=5)
+
+    start = time.monotonic()
+    delays = [limiter.acquire() for _ in range(5)]
+    assert delays == [0.0] * 5
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - start >= 0.09
+
+    with pytest.raises(JudilibreValueError):
+        RateLimiter(rate=0)
+
+
+def test_rate_limited_client():
+    with JudilibreMockServer(corpus_size=10) as server:
+        client = JudilibreClient(judilibre_api_url=server.url, judilibre_api_key=server.api_key, rate_limit=20)
+        metrics = JudilibreMetricsCollector().attach(client)
+
+        start = time.monotonic()
+        for _ in range(5):
+            client.healthcheck()
+        assert time.monotonic() - start >= 0.19
+        assert metrics.as_dict()["/healthcheck"]["throttle_time"] > 0.1
+
+
+def test_concurrent_paginate_search():
+    with JudilibreMockServer(corpus_size=2_000, latency=0.02) as server:
+        client = JudilibreClient(judilibre_api_url=server.url, judilibre_api_key=server.api_key)
+
+        results = client.paginate_search("contrat", page_size=20)
+        n_requests = server.request_count
+        assert n_requests > 4
+
+        server.reset()
+        start = time.monotonic()
+        assert client.paginate_search("contrat", page_size=20, max_workers=8) == results
+        assert time.monotonic() - start < n_requests * 0.02
+        assert server.request_count == n_requests
+
+        server.reset()
+        assert client.paginate_search("contrat", page_size=20, max_results=50, max_workers=8) == results[:50]
+        assert server.request_count == 3
+
+
+def test_concurrent_paginate_search_deduplication():
+    with JudilibreMockServer(corpus_size=500) as server:
+        client = JudilibreClient(judilibre_api_url=server.url, judilibre_api_key=server.api_key)
+        ranking = client._query("/search", query_parameters={"query": "contrat", "page_size": 50})["results"][:30]
+
+    def handler(method, url, headers):
+        # a new result ranked first is inserted after the first page: the last result of the first page
+        # is the first result of the second one
+        parameters = parse_qs(urlsplit(url).query)
+        page, page_size = int(parameters["page"][0]), int(parameters["page_size"][0])
+        results = ranking[1:] if page == 0 else ranking
+        body = {"total": len(ranking), "results": results[page * page_size : (page + 1) * page_size]}
+        return 200, {"Content-Type": "application/json"}, json.dumps(body).encode("utf-8")
+
+    client = JudilibreClient(
+        judilibre_api_url="http://judilibre.invalid",
+        judilibre_api_key="unused",
+        transport=InMemoryTransport(handler),
+    )
+    results = client.paginate_search("contrat", page_size=10, max_workers=4)
+    assert [r.id for r in results] == [r["id"] for r in ranking[1:]]
@@ -0,0 +1,66 @@
+import datetime
+import time
+
+import pytest
+from pyjudilibre import JudilibreClient
+from pyjudilibre.enums import JudilibreStatsAggregationKeysEnum, JurisdictionEnum
+from pyjudilibre.exceptions import JudilibreValueError
+from pyjudilibre.testing import JudilibreMockServer
+
+QUERIES = [
+    {"jurisdictions": [jurisdiction], "keys": [JudilibreStatsAggregationKeysEnum.year], "date_start": date_start}
+    for jurisdiction in ["cc", "ca", "tj", "tcom"]
+    for date_start in [None, datetime.date(2020, 1, 1), datetime.date(2023, 1, 1)]
+]
+
+
+def test_stats_many(mock_server, mock_client):
+    # the same query as the first one, with an enum member instead of a code
+    duplicate = {**QUERIES[0], "jurisdictions": [JurisdictionEnum.cour_de_cassation], "keys": ["year"]}
+    stats = mock_client.stats_many([*QUERIES, duplicate])
+
+    assert mock_server.count("/stats") == len(QUERIES)
+    assert stats == [mock_client.stats(**query) for query in [*QUERIES, QUERIES[0]]]
+    assert stats[0].results.total_decisions == len(mock_server.corpus.filter(jurisdictions=["cc"]))
+
+    with pytest.raises(JudilibreValueError):
+        mock_client.stats_many([{"jurisdiction": ["cc"]}])
+
+
+def test_stats_many_is_concurrent():
+    with JudilibreMockServer(corpus_size=100, latency=0.1) as server:
+        client = JudilibreClient(judilibre_api_url=server.url, judilibre_api_key=server.api_key)
+        start = time.perf_counter()
+        client.stats_many(QUERIES, max_workers=len(QUERIES))
+
+        assert time.perf_counter() - start < len(QUERIES) * 0.1 / 2
+
+
+def test_stats_cache(mock_server, monkeypatch):
+    client = JudilibreClient(
+        judilibre_api_url=mock_server.url,
+        judilibre_api_key=mock_server.api_key,
+        stats_cache_size=100,
+        stats_cache_ttl=60,
+    )
+    first = client.stats_many(QUERIES)
+    assert client.stats_many(QUERIES) == first
+    assert client.stats(jurisdictions=["ca", "cc"]) == client.stats(jurisdictions=["cc", "ca"])
+    assert mock_server.count("/stats") == len(QUERIES) + 1
+
+    # dates and their ISO strings are the same query
+    client.stats_many([{**QUERIES[1], "date_start": QUERIES[1]["date_start"].isoformat()}])
+    assert mock_server.count("/stats") == len(QUERIES) + 1
+
+    # each caller gets its own statistics
+    cached = client.stats(**QUERIES[0])
+    cached.results.aggregated_data.clear()
+    assert client.stats(**QUERIES[0]) == first[0] != cached
+    duplicates = client.stats_many([QUERIES[1], QUERIES[1]])
+    assert duplicates[0] == duplicates[1] and duplicates[0] is not duplicates[1]
+    assert mock_server.count("/stats") == len(QUERIES) + 1
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 120)
+    client.stats_many(QUERIES)
+    assert mock_server.count("/stats") == 2 * len(QUERIES) + 1
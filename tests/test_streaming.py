@@ -0,0 +1,81 @@
+import io
+import json
+
+import pytest
+from pyjudilibre import JudilibreClient
+from pyjudilibre.streaming import JsonStreamParser
+from pyjudilibre.testing import JudilibreMockServer
+from pyjudilibre.transports import JudilibreTransport, JudilibreTransportResponse
+
+
+def parse(body: bytes, chunk_size: int) -> tuple[list, dict]:
+    parser = JsonStreamParser("results")
+    items = []
+    for i in range(0, len(body), chunk_size):
+        items.extend(parser.feed(body[i : i + chunk_size]))
+    items.extend(parser.close())
+    return items, parser.fields
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1_000_000])
+def test_stream_parser(chunk_size):
+    document = {
+        "results": [
+            {"id": "a", "text": 'é\\"{[ \U0001f600 ]}', "numbers": [1, -2.5e3, None, True]},
+            [[], {}],
+            123456,
+            "string, with ] and }",
+            False,
+        ],
+        "total": 5,
+        "query": {"results": [1, 2]},
+        "next_batch": None,
+    }
+    for indent in [None, 2]:
+        for ensure_ascii in [True, False]:
+            body = json.dumps(document, indent=indent, ensure_ascii=ensure_ascii).encode("utf-8")
+            items, fields = parse(body, chunk_size)
+            assert items == document["results"]
+            assert fields == {"total": 5, "query": {"results": [1, 2]}, "next_batch": None}
+
+
+@pytest.mark.parametrize("body", [b'{"results": [{"id": 1}, {"id"', b"[1, 2]", b'{"total": 1} []', b'{"total": 1'])
+def test_stream_parser_errors(body):
+    with pytest.raises(json.JSONDecodeError):
+        parse(body, 3)
+
+
+class RecordingTransport(JudilibreTransport):
+    """Serves the responses of a mock server, recording how much of each body has been read"""
+
+    def __init__(self, server: JudilibreMockServer):
+        self.server = server
+        self.bodies: list[io.BytesIO] = []
+
+    def send(self, method, url, headers, timeout=None):
+        status, response_headers, body = self.server.respond(method, url, {**headers, "Accept-Encoding": ""})
+        self.bodies.append(io.BytesIO(body))
+        return JudilibreTransportResponse(status=status, headers=response_headers, body=self.bodies[-1])
+
+
+def test_iter_scan():
+    server = JudilibreMockServer(corpus_size=250, text_size=50_000)
+    transport = RecordingTransport(server)
+    client = JudilibreClient(
+        judilibre_api_url="http://judilibre.invalid",
+        judilibre_api_key=server.api_key,
+        transport=transport,
+    )
+
+    decisions = client.iter_scan(batch_size=100)
+    first_decision = next(decisions)
+    body = transport.bodies[0]
+    assert body.tell() < len(body.getvalue()) / 10
+
+    all_decisions = [first_decision, *decisions]
+    assert [d.id for d in all_decisions] == [m.id for m in server.corpus.decisions]
+    assert server.count("/scan") == 3
+
+    server.reset()
+    assert client.paginate_scan(batch_size=100, max_results=150) == all_decisions[:150]
+    assert server.count("/scan") == 2
@@ -0,0 +1,276 @@
+import json
+import logging
+import time
+
+import pytest
+from pyjudilibre import taxonomy
+from pyjudilibre.cli import main
+from pyjudilibre.enums import ChamberCCEnum, JudilibreMultiValueEnum, JudilibreTaxonEnum, JurisdictionEnum
+from pyjudilibre.exceptions import JudilibreValueError
+from pyjudilibre.taxonomy import DEFAULT_LABEL_COLUMNS, TaxonomyRegistry, TaxonomySnapshot, write_snapshot
+
+
+def test_warm_up_and_lookups(mock_server, mock_client):
+    registry = TaxonomyRegistry(mock_client).warm_up()
+
+    n_taxons = len(JudilibreTaxonEnum) * len(JurisdictionEnum)
+    assert len(registry) == n_taxons
+    assert mock_server.count("/taxonomy") == n_taxons
+
+    assert registry.label(JudilibreTaxonEnum.chamber, JurisdictionEnum.cour_de_cassation, "soc") == "Chambre sociale"
+    assert registry.code("chamber", "cc", "Chambre sociale") == "soc"
+    assert registry.label("chamber", "cc", "unknown", default="?") == "?"
+    assert registry.label("location", "cc", None) is None
+    assert registry.taxon("location", "cc").labels == {}
+    assert mock_server.count("/taxonomy") == n_taxons
+
+
+def test_label_client_decisions(mock_server, mock_client):
+    registry = TaxonomyRegistry(mock_client).warm_up()
+    decisions = [decision for decision in mock_client.paginate_scan(batch_size=1_000) if decision.chamber]
+    assert decisions
+
+    # the attributes of the decisions are enum members
+    for decision in decisions:
+        label = registry.label(JudilibreTaxonEnum.chamber, decision.jurisdiction, decision.chamber)
+        code = JudilibreMultiValueEnum.replace_enum(decision.chamber)
+        assert label is not None
+        assert label == registry.label(JudilibreTaxonEnum.chamber, decision.jurisdiction, code)
+        assert registry.code(JudilibreTaxonEnum.chamber, decision.jurisdiction, decision.chamber) == code
+
+    # and labels resolve to themselves, and to their codes
+    assert registry.label("chamber", JurisdictionEnum.cour_de_cassation, ChamberCCEnum.chambre_sociale) == (
+        "Chambre sociale"
+    )
+    assert registry.label("chamber", "Cour de cassation", "Chambre sociale") == "Chambre sociale"
+    assert registry.code("chamber", "cc", ChamberCCEnum.chambre_sociale) == "soc"
+    assert registry.code("chamber", "cc", "soc") == "soc"
+
+
+def test_on_demand_fetch_and_ttl(mock_server, mock_client, monkeypatch):
+    registry = TaxonomyRegistry(mock_client, ttl=60)
+
+    registry.label("solution", "cc", "cassation")
+    registry.label("solution", "cc", "rejet")
+    assert mock_server.count("/taxonomy") == 1
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    registry.label("solution", "cc", "rejet")
+    assert mock_server.count("/taxonomy") == 2
+
+
+def test_disk_cache(mock_server, mock_client, tmp_path):
+    cache_path = tmp_path / "cache" / "taxonomy.json"
+    TaxonomyRegistry(mock_client, cache_path=str(cache_path)).warm_up(contexts=[JurisdictionEnum.cour_de_cassation])
+    requests = mock_server.count("/taxonomy")
+
+    registry = TaxonomyRegistry(mock_client, cache_path=str(cache_path)).warm_up(
+        contexts=[JurisdictionEnum.cour_de_cassation]
+    )
+    assert len(registry) == len(JudilibreTaxonEnum)
+    assert mock_server.count("/taxonomy") == requests
+
+    # expired entries, and the caches of other APIs, are ignored
+    assert len(TaxonomyRegistry(mock_client, cache_path=str(cache_path), ttl=-1)) == 0
+    cache = json.loads(cache_path.read_text())
+    cache_path.write_text(json.dumps({**cache, "url": "https://other.invalid"}))
+    assert len(TaxonomyRegistry(mock_client, cache_path=str(cache_path))) == 0
+
+
+def test_snapshot(mock_server, mock_client, tmp_path):
+    path = str(tmp_path / "taxonomy.snapshot")
+    taxons = TaxonomyRegistry(mock_client).warm_up().taxons()
+    write_snapshot(path, taxons, url=mock_client.judilibre_api_url)
+    requests = mock_server.count("/taxonomy")
+
+    with TaxonomySnapshot(path) as snapshot:
+        assert len(snapshot) == len(taxons)
+        assert snapshot.url == mock_client.judilibre_api_url
+
+        registry = TaxonomyRegistry(mock_client, snapshot=snapshot).warm_up()
+        assert registry.label("chamber", "cc", "soc") == "Chambre sociale"
+        assert registry.code("chamber", "cc", "Chambre sociale") == "soc"
+        for taxon in taxons:
+            assert snapshot.taxon(taxon.taxon_id, taxon.context).labels == taxon.labels
+        assert mock_server.count("/taxonomy") == requests
+
+    empty_path = tmp_path / "empty.snapshot"
+    empty_path.write_bytes(b"")
+    with pytest.raises(JudilibreValueError):
+        TaxonomySnapshot(str(empty_path))
+    cache_path = tmp_path / "taxonomy.json"
+    cache_path.write_text("{}")
+    with pytest.raises(JudilibreValueError):
+        TaxonomySnapshot(str(cache_path))
+
+
+def test_bundled_snapshot(mock_server, mock_client, tmp_path, monkeypatch):
+    path = str(tmp_path / "data" / "taxonomy.snapshot")
+    monkeypatch.setattr(taxonomy, "BUNDLED_SNAPSHOT_PATH", path)
+    assert TaxonomySnapshot.bundled() is None
+    assert TaxonomyRegistry(mock_client).snapshot is None
+
+    write_snapshot(path, TaxonomyRegistry(mock_client).warm_up().taxons(), url=mock_client.judilibre_api_url)
+    mock_server.reset()
+
+    # used by default, without any request
+    registry = TaxonomyRegistry(mock_client).warm_up()
+    assert registry.snapshot is not None and registry.snapshot.path == path
+    assert registry.label("chamber", "cc", "soc") == "Chambre sociale"
+    assert mock_server.count("/taxonomy") == 0
+
+    # unless disabled, or taken from another API
+    assert TaxonomyRegistry(mock_client, snapshot=False).snapshot is None
+    taxons = [registry.snapshot.taxon(*key) for key in registry.snapshot.keys()]
+    write_snapshot(path, taxons, url="https://other.invalid")
+    assert TaxonomyRegistry(mock_client).snapshot is None
+    assert TaxonomyRegistry(mock_client, snapshot=True).snapshot is not None
+
+
+def test_snapshot_commands(mock_server, tmp_path, capsys):
+    path = str(tmp_path / "taxonomy.snapshot")
+    api = ["--api-url", mock_server.url, "--api-key", mock_server.api_key]
+
+    assert main(["taxonomy", "snapshot", "--output", path, *api]) == 0
+    assert main(["taxonomy", "diff", path, *api]) == 0
+    assert "up to date" in capsys.readouterr().out
+
+    with TaxonomySnapshot(path) as snapshot:
+        taxons = [snapshot.taxon(*key) for key in snapshot.keys()]
+    chambers = next(taxon for taxon in taxons if (taxon.taxon_id, taxon.context) == ("chamber", "cc"))
+    chambers.labels = {**chambers.labels, "soc": "Chambre sociale (ancien)", "old": "Ancienne chambre"}
+    write_snapshot(path, taxons)
+
+    assert main(["taxonomy", "diff", path, "--verbose", *api]) == 1
+    output = capsys.readouterr().out
+    assert "chamber/cc: +0 -1 ~1" in output
+    assert "~ soc: Chambre sociale (ancien) -> Chambre sociale" in output
+
+
+def failing_taxonomy(mock_server, monkeypatch):
+    """Answers 400 for the locations of the Cour de cassation and 500 for its chambers"""
+    taxonomy = mock_server._routes["/taxonomy"]
+
+    def _taxonomy(parameters):
+        key = (mock_server._first(parameters, "id"), mock_server._first(parameters, "context_value"))
+        if key == ("location", "cc"):
+            return 400, {"message": "Taxon not applicable"}
+        if key == ("chamber", "cc"):
+            return 500, {"message": "Internal error"}
+        return taxonomy(parameters)
+
+    monkeypatch.setitem(mock_server._routes, "/taxonomy", _taxonomy)
+
+
+def test_warm_up_failures(mock_server, mock_client, monkeypatch, caplog):
+    failing_taxonomy(mock_server, monkeypatch)
+    with caplog.at_level(logging.WARNING, logger="judilibre-client"):
+        registry = TaxonomyRegistry(mock_client).warm_up()
+
+    assert len(registry) == len(JudilibreTaxonEnum) * len(JurisdictionEnum) - 1
+    assert registry.taxon("location", "cc").labels == {}
+    assert list(registry.failures) == [("chamber", "cc")]
+    assert "Could not fetch the taxon chamber of cc" in caplog.text
+    assert registry.label("solution", "cc", "cassation")
+
+
+def test_snapshot_commands_failures(mock_server, monkeypatch, tmp_path, capsys):
+    path = str(tmp_path / "taxonomy.snapshot")
+    api = ["--api-url", mock_server.url, "--api-key", mock_server.api_key]
+    assert main(["taxonomy", "snapshot", "--output", path, *api]) == 0
+
+    failing_taxonomy(mock_server, monkeypatch)
+    assert main(["taxonomy", "diff", path, *api]) == 1
+    output = capsys.readouterr().out
+    assert "error: could not fetch chamber/cc" in output
+    assert "chamber/cc: +" not in output
+
+    assert main(["taxonomy", "snapshot", "--output", path, *api]) == 1
+    with TaxonomySnapshot(path) as snapshot:
+        assert ("chamber", "cc") not in snapshot
+        assert ("solution", "cc") in snapshot
+
+
+def exported_rows(mock_client) -> list[dict]:
+    """Decisions as exported by `pyjudilibre` (with labels, where the API gives codes)"""
+    columns = ["id", "jurisdiction", *DEFAULT_LABEL_COLUMNS]
+    decisions = [decision.model_dump(mode="json") for decision in mock_client.iter_scan(batch_size=1_000)]
+    return [{column: decision.get(column) for column in columns} for decision in decisions]
+
+
+def expected_labels(mock_server, registry, ids, column, taxon_id):
+    """Labels of the codes given by the API for the decisions `ids`"""
+    labels = []
+    for decision_id in ids:
+        decision = mock_server.corpus.decision(mock_server.corpus.get(decision_id))
+        code = decision.get(column)
+        if isinstance(code, list):
+            labels.append([registry.label(taxon_id, decision["jurisdiction"], c) for c in code])
+        else:
+            labels.append(registry.label(taxon_id, decision["jurisdiction"], code))
+    return labels
+
+
+def assert_labelled(values, labels):
+    """Checks that all the values (and the values of lists) have a label"""
+    for value, label in zip(values, labels):
+        if isinstance(value, list):
+            assert len(label) == len(value) and None not in label
+        else:
+            assert (label is None) == (value is None)
+
+
+def test_label_columns(mock_server, mock_client):
+    rows = exported_rows(mock_client)
+    registry = TaxonomyRegistry(mock_client)
+    batch = {name: [row[name] for row in rows] for name in rows[0]}
+
+    labelled = registry.label_columns(batch)
+    for column, taxon_id in DEFAULT_LABEL_COLUMNS.items():
+        assert labelled[f"{column}_label"] == expected_labels(mock_server, registry, batch["id"], column, taxon_id)
+        assert_labelled(batch[column], labelled[f"{column}_label"])
+    assert "chamber_label" not in batch
+    assert any(label is not None for label in labelled["chamber_label"])
+
+    # codes, labels and enum members
+    chambers = ["soc", ChamberCCEnum.chambre_sociale, "Chambre sociale", None, "unknown"]
+    assert registry.labels("chamber", chambers, "cc", default="?") == ["Chambre sociale"] * 3 + ["?", "?"]
+    assert registry.labels("chamber", [["soc", "civ1"]], ["Cour de cassation"]) == [
+        ["Chambre sociale", "Première chambre civile"]
+    ]
+    with pytest.raises(JudilibreValueError):
+        registry.labels("chamber", ["soc"], ["cc", "cc"])
+    with pytest.raises(JudilibreValueError):
+        registry.label_columns({"chamber": ["soc"]})
+
+
+def test_label_arrow_columns(mock_server, mock_client, tmp_path):
+    pyarrow = pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+
+    api = ["--api-url", mock_server.url, "--api-key", mock_server.api_key]
+    assert main(["export", "--format", "parquet", "--output", str(tmp_path), "--processes", "1", *api]) == 0
+    registry = TaxonomyRegistry(mock_client)
+
+    n_decisions = 0
+    for path in tmp_path.rglob("*.parquet"):
+        table = parquet.read_table(path)
+        labelled = registry.label_columns(table)
+        ids = table["id"].to_pylist()
+        for column, taxon_id in DEFAULT_LABEL_COLUMNS.items():
+            labels = labelled[f"{column}_label"].to_pylist()
+            assert labels == expected_labels(mock_server, registry, ids, column, taxon_id)
+            assert_labelled(table[column].to_pylist(), labels)
+        n_decisions += len(table)
+    assert n_decisions == len(mock_server.corpus.decisions)
+
+    # a table split into chunks
+    table = pyarrow.Table.from_pylist(exported_rows(mock_client))
+    labelled = registry.label_columns(pyarrow.concat_tables([table.slice(0, 100), table.slice(100)]))
+    for column, taxon_id in DEFAULT_LABEL_COLUMNS.items():
+        labels = labelled[f"{column}_label"].to_pylist()
+        assert labels == expected_labels(mock_server, registry, table["id"].to_pylist(), column, taxon_id)
+
+    codes = pyarrow.array(["soc", "Chambre sociale", None, "unknown"])
+    assert registry.labels("chamber", codes, "cc", default="?").to_pylist() == ["Chambre sociale"] * 2 + ["?", "?"]
@@ -0,0 +1,71 @@
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pyjudilibre import JudilibreClient
+from pyjudilibre.instrumentation import JudilibreMetricsCollector
+from pyjudilibre.ratelimit import RateLimiter
+
+
+@pytest.mark.parametrize("transport", ["urllib", "pooled"])
+def test_shared_client_stress(mock_server, transport):
+    client = JudilibreClient(
+        judilibre_api_url=mock_server.url,
+        judilibre_api_key=mock_server.api_key,
+        transport=transport,
+        rate_limit=RateLimiter(rate=5_000, burst=50),
+        decision_cache_size=100,
+    )
+    metrics = JudilibreMetricsCollector().attach(client)
+    decision_ids = [d.id for d in mock_server.corpus.decisions]
+    calls = [("decision", random.Random(i).choice(decision_ids)) for i in range(400)] + [("scan", None)] * 20
+    random.Random(0).shuffle(calls)
+
+    stop = threading.Event()
+
+    def churn_hooks():
+        while not stop.is_set():
+            hook = lambda event: None  # noqa: E731
+            client.add_hook("after_response", hook)
+            client.remove_hook("after_response", hook)
+
+    def call(kind: str, decision_id: str | None) -> bool:
+        if kind == "decision":
+            return client.decision(decision_id).id == decision_id
+        decisions = client.paginate_scan(batch_size=250)
+        return sorted(d.id for d in decisions) == sorted(decision_ids)
+
+    churner = threading.Thread(target=churn_hooks)
+    churner.start()
+    try:
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            results = list(executor.map(lambda c: call(*c), calls))
+    finally:
+        stop.set()
+        churner.join()
+        client.close()
+
+    assert all(results)
+    assert metrics.as_dict()["/decision"]["requests"] == mock_server.count("/decision")
+    assert metrics.as_dict()["/scan"]["requests"] == mock_server.count("/scan")
+    assert mock_server.count("/decision") + client.decision_cache.hits + client.single_flight.shared >= 400
+    assert len(client.decision_cache) <= 100
+
+
+def test_query_parameters_are_not_modified(mock_client):
+    query_parameters = {"id": "x", "nested": {"flag": True}}
+    url, _ = mock_client._url("GET", "/decision", query_parameters)
+
+    assert query_parameters == {"id": "x", "nested": {"flag": True}}
+    assert "id=x" in url
+
+
+def test_concurrent_clients_share_one_log_handler(mock_server):
+    def build(_):
+        return JudilibreClient(judilibre_api_url=mock_server.url, judilibre_api_key=mock_server.api_key)
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        clients = list(executor.map(build, range(64)))
+
+    assert len(clients[0]._logger.handlers) == 1
@@ -0,0 +1,197 @@
+import datetime
+import gzip
+import socket
+import urllib.error
+
+import pytest
+from pyjudilibre import JudilibreClient
+from pyjudilibre.enums import JudilibreStatsAggregationKeysEnum
+from pyjudilibre.exceptions import (
+    JudilibreCassetteMissError,
+    JudilibreDownloadFileError,
+    JudilibreHTTPError,
+    JudilibreTooManyRequestError,
+    JudilibreValueError,
+)
+from pyjudilibre.models import File
+from pyjudilibre.testing import JudilibreMockServer
+from pyjudilibre.transports import CassetteTransport, InMemoryTransport, PooledTransport
+
+
+def run_queries(client: JudilibreClient) -> tuple:
+    return (
+        client.paginate_scan(batch_size=100),
+        client.paginate_search("contrat"),
+        client.stats(keys=[JudilibreStatsAggregationKeysEnum.year], date_start=datetime.date(2022, 1, 1)),
+    )
+
+
+def test_cassette_record_and_replay(tmp_path):
+    path = str(tmp_path / "cassette.jsonl.gz")
+
+    with JudilibreMockServer(corpus_size=300) as server:
+        with CassetteTransport.record(path) as cassette:
+            client = JudilibreClient(
+                judilibre_api_url=server.url,
+                judilibre_api_key=server.api_key,
+                transport=cassette,
+            )
+            recorded = run_queries(client)
+        n_requests = server.request_count
+
+    with gzip.open(path, "rt") as cassette_file:
+        content = cassette_file.read()
+    assert len(content.splitlines()) == n_requests
+    assert "mock-api-key" not in content
+
+    client = JudilibreClient(
+        judilibre_api_url="http://replay.invalid",
+        judilibre_api_key="replay",
+        transport=CassetteTransport.replay(path),
+    )
+    replayed = run_queries(client)
+
+    assert replayed == recorded
+
+    with pytest.raises(JudilibreCassetteMissError):
+        client.healthcheck()
+
+
+def test_cassette_replays_errors(tmp_path):
+    path = str(tmp_path / "cassette.jsonl.gz")
+
+    with JudilibreMockServer(corpus_size=10) as server, CassetteTransport.record(path) as cassette:
+        client = JudilibreClient(judilibre_api_url=server.url, judilibre_api_key=server.api_key, transport=cassette)
+        server.inject_errors(429)
+        with pytest.raises(JudilibreTooManyRequestError):
+            client.healthcheck()
+        assert client.healthcheck() is True
+
+    client = JudilibreClient(
+        judilibre_api_url="http://replay.invalid",
+        judilibre_api_key="replay",
+        transport=CassetteTransport.replay(path),
+        max_retries=1,
+    )
+    assert client.healthcheck() is True
+
+
+@pytest.mark.parametrize("transport", ["urllib", "pooled", "httpx"])
+def test_transports_by_name(mock_server, transport):
+    if transport == "httpx":
+        pytest.importorskip("httpx")
+
+    with JudilibreClient(
+        judilibre_api_url=mock_server.url,
+        judilibre_api_key=mock_server.api_key,
+        transport=transport,
+    ) as client:
+        scanned, searched, stats = run_queries(client)
+
+    assert len(scanned) == len(mock_server.corpus.decisions)
+    assert len(searched) > 0
+    assert stats.results.total_decisions > 0
+
+
+def test_http_error_is_a_urllib_http_error():
+    client = JudilibreClient(
+        judilibre_api_url="http://judilibre.invalid",
+        judilibre_api_key="key",
+        transport=InMemoryTransport(lambda method, url, headers: (418, {"X-Reason": "teapot"}, b"I'm a teapot")),
+    )
+
+    with pytest.raises(urllib.error.HTTPError) as error:
+        client.healthcheck()
+    assert isinstance(error.value, JudilibreHTTPError)
+    assert (error.value.code, error.value.headers["X-Reason"]) == (418, "teapot")
+    assert str(error.value).endswith("returned 418: I'm a teapot")
+
+
+def test_unknown_transport_name():
+    with pytest.raises(JudilibreValueError):
+        JudilibreClient(judilibre_api_url="http://localhost", judilibre_api_key="key", transport="carrier-pigeon")
+
+
+def test_pooled_transport_reuses_connections(mock_server):
+    transport = PooledTransport()
+    client = JudilibreClient(
+        judilibre_api_url=mock_server.url, judilibre_api_key=mock_server.api_key, transport=transport
+    )
+
+    connections = set()
+    for _ in range(5):
+        assert client.healthcheck() is True
+        pool = next(iter(transport._pools.values()))
+        connections.add(id(pool.queue[-1]))
+    assert len(connections) == 1
+
+    # a connection closed on the server side is replaced transparently
+    pool.queue[-1].sock.shutdown(socket.SHUT_RDWR)
+    assert client.healthcheck() is True
+
+    client.close()
+    assert transport._pools == {}
+
+
+def test_in_memory_transport_and_download(tmp_path):
+    server = JudilibreMockServer(corpus_size=50, file_size=10_000)
+    client = JudilibreClient(
+        judilibre_api_url="http://judilibre.invalid",
+        judilibre_api_key=server.api_key,
+        transport=server.transport(),
+    )
+
+    assert len(client.paginate_scan(batch_size=10)) == 50
+    assert server.count("/scan") == 5
+
+    file = File(
+        id="file",
+        name="file.pdf",
+        type="prep_rapp",
+        isCommunication=False,
+        date="2024-01-01",
+        url="http://judilibre.invalid/files/file.pdf",
+        rawUrl="http://judilibre.invalid/files/file.pdf",
+    )
+    path = client.download_file(file, folder=str(tmp_path))
+    with open(path, "rb") as downloaded_file:
+        assert len(downloaded_file.read()) == 10_000
+
+    client.transport = InMemoryTransport(lambda method, url, headers: (404, {}, b"Not found"))
+    with pytest.raises(JudilibreDownloadFileError):
+        client.download_file(file, folder=str(tmp_path))
+
+
+@pytest.mark.parametrize("transport", ["urllib", "pooled", "httpx", "in_memory"])
+def test_download_compressed_file(tmp_path, transport):
+    if transport == "httpx":
+        pytest.importorskip("httpx")
+
+    # the server compresses the files when the client accepts it, as the JSON responses
+    with JudilibreMockServer(corpus_size=10, file_size=10_000, encodings=("gzip",)) as server:
+        client = JudilibreClient(
+            judilibre_api_url=server.url,
+            judilibre_api_key=server.api_key,
+            transport=server.transport() if transport == "in_memory" else transport,
+        )
+        file = File(
+            id="file",
+            name="file.pdf",
+            type="prep_rapp",
+            isCommunication=False,
+            date="2024-01-01",
+            url=f"{server.url}/files/file.pdf",
+            rawUrl=f"{server.url}/files/file.pdf",
+        )
+        path = client.download_file(file, folder=str(tmp_path))
+    with open(path, "rb") as downloaded_file:
+        assert downloaded_file.read() == b"%PDF" + b"\0" * 9_996
+
+    # a server ignoring `Accept-Encoding: identity`
+    body = b"%PDF" + b"\0" * 9_996
+    client.transport = InMemoryTransport(
+        lambda method, url, headers: (200, {"Content-Encoding": "gzip"}, gzip.compress(body))
+    )
+    path = client.download_file(file, folder=str(tmp_path))
+    with open(path, "rb") as downloaded_file:
+        assert downloaded_file.read() == body